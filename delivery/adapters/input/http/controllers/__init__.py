@@ -1,6 +1,7 @@
 from .create_courier_controller import router as create_courier_router
 from .create_order_controller import router as create_order_router
 from .get_couriers_controller import router as get_couriers_router
+from .get_demand_heatmap_controller import router as get_demand_heatmap_router
 from .get_orders_controller import router as get_orders_router
 
 
@@ -8,5 +9,6 @@ __all__ = [
     "create_courier_router",
     "create_order_router",
     "get_couriers_router",
+    "get_demand_heatmap_router",
     "get_orders_router",
 ]
@@ -0,0 +1,40 @@
+import typing
+
+from fastapi import APIRouter, Depends, status
+from that_depends import Provide
+
+from delivery.adapters.input.http.mappers.demand_mapper import DemandMapper
+from delivery.adapters.input.http.models.demand import DemandHeatmap
+from delivery.adapters.input.http.models.error import Error as HttpError
+from delivery.core.application.queries.get_demand_heatmap import (
+    GetDemandHeatmapQuery,
+    GetDemandHeatmapQueryHandler,
+)
+from delivery.ioc import IOCContainer
+
+
+router = APIRouter()
+
+
+@router.get(
+    "/demand/heatmap",
+    status_code=status.HTTP_200_OK,
+    responses={
+        "default": {"model": HttpError, "description": "Ошибка"},
+    },
+)
+async def get_demand_heatmap(
+    handler: typing.Annotated[
+        GetDemandHeatmapQueryHandler,
+        Depends(Provide[IOCContainer.get_demand_heatmap_handler]),
+    ],
+) -> DemandHeatmap:
+    query: typing.Final = GetDemandHeatmapQuery()
+
+    result: typing.Final = await handler.handle(query)
+
+    if result.is_failure:
+        error: typing.Final = result.get_error()
+        raise Exception(f"Error: {error.code} - {error.message}")  # noqa: TRY002
+
+    return DemandMapper.to_http(result.get_value())
@@ -1,5 +1,6 @@
 from .courier_mapper import CourierMapper
+from .demand_mapper import DemandMapper
 from .order_mapper import OrderMapper
 
 
-__all__ = ["CourierMapper", "OrderMapper"]
+__all__ = ["CourierMapper", "DemandMapper", "OrderMapper"]
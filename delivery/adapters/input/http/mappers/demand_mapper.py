@@ -0,0 +1,8 @@
+from delivery.adapters.input.http.models.demand import DemandHeatmap as HttpDemandHeatmap
+from delivery.core.application.queries.get_demand_heatmap.dto import DemandHeatmapDto
+
+
+class DemandMapper:
+    @staticmethod
+    def to_http(dto: DemandHeatmapDto) -> HttpDemandHeatmap:
+        return HttpDemandHeatmap(gridSize=dto.grid_size, cells=dto.cells)
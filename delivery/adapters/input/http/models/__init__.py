@@ -1,4 +1,5 @@
 from .courier import Courier, CreateCourierResponse, NewCourier
+from .demand import DemandHeatmap
 from .error import Error
 from .location import Location
 from .order import CreateOrderRequest, CreateOrderResponse, Order
@@ -9,6 +10,7 @@ __all__ = [
     "CreateCourierResponse",
     "CreateOrderRequest",
     "CreateOrderResponse",
+    "DemandHeatmap",
     "Error",
     "Location",
     "NewCourier",
@@ -0,0 +1,6 @@
+from pydantic import BaseModel, Field
+
+
+class DemandHeatmap(BaseModel):
+    grid_size: int = Field(..., description="Number of cells along each side of the map", alias="gridSize")
+    cells: list[list[float]] = Field(..., description="Decayed order demand, cells[x - 1][y - 1] for cell (x, y)")
@@ -6,6 +6,7 @@ from delivery.adapters.input.http.controllers import (
     create_courier_router,
     create_order_router,
     get_couriers_router,
+    get_demand_heatmap_router,
     get_orders_router,
 )
 
@@ -17,5 +18,6 @@ def create_router() -> APIRouter:
     router.include_router(create_courier_router)
     router.include_router(get_couriers_router)
     router.include_router(get_orders_router)
+    router.include_router(get_demand_heatmap_router)
 
     return router
@@ -1,13 +1,43 @@
+import datetime as dt
 import typing
 from uuid import UUID
 
+import structlog
+
 from delivery.adapters.input.kafka import baskets_events_pb2 as pb2
 from delivery.core.application.commands.create_order.command import CreateOrderCommand
-from delivery.core.domain.model.kernel import Address, Volume
+from delivery.core.domain.model.kernel import Address, DeliveryPeriod, Volume
 from delivery.libs.errs.error import Error
 from delivery.libs.errs.result import Result
 
 
+logger = structlog.get_logger(__name__)
+
+_HOURS_IN_DAY: typing.Final[int] = 24
+
+
+def map_delivery_period(
+    period: pb2.DeliveryPeriod,
+    confirmed_at: dt.datetime,
+) -> Result[DeliveryPeriod, Error]:
+    """Переводит окно доставки в часах (from/to) в интервал в день подтверждения корзины."""
+    start_hour: typing.Final = getattr(period, "from")
+    end_hour: typing.Final = period.to
+    if not 0 <= start_hour <= _HOURS_IN_DAY or not 0 <= end_hour <= _HOURS_IN_DAY:
+        return Result.failure(
+            Error.of(
+                "basket.event.invalid.delivery.period",
+                f"Delivery period hours must be within 0..{_HOURS_IN_DAY}, got {start_hour}..{end_hour}",
+            )
+        )
+
+    day_start: typing.Final = confirmed_at.replace(hour=0, minute=0, second=0, microsecond=0)
+    return DeliveryPeriod.create(
+        day_start + dt.timedelta(hours=start_hour),
+        day_start + dt.timedelta(hours=end_hour),
+    )
+
+
 def map_basket_confirmed_to_create_order_command(
     event: pb2.BasketConfirmedIntegrationEvent,
 ) -> Result[CreateOrderCommand, Error]:
@@ -28,10 +58,27 @@ def map_basket_confirmed_to_create_order_command(
         if volume_result.is_failure:
             return Result.failure(volume_result.get_error())
 
+        delivery_period: DeliveryPeriod | None = None
+        if event.HasField("delivery_period"):
+            period_result = map_delivery_period(event.delivery_period, dt.datetime.now(dt.UTC))
+            if period_result.is_success:
+                delivery_period = period_result.get_value()
+            else:
+                # Окно только задаёт приоритет доставки, поэтому из-за неверного окна заказ не теряется,
+                # а создаётся без окна
+                period_error = period_result.get_error()
+                logger.warning(
+                    "Ignoring invalid delivery period in basket event",
+                    basket_id=event.basket_id,
+                    error_code=period_error.code,
+                    error_message=period_error.message,
+                )
+
         command: typing.Final = CreateOrderCommand(
             order_id=order_id,
             address=address_result.get_value(),
             volume=volume_result.get_value(),
+            delivery_period=delivery_period,
         )
         return Result.success(command)
 
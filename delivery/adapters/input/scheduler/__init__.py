@@ -1,5 +1,17 @@
-from .jobs import AssignOrdersJob, MoveCouriersJob
+from .dispatch_trigger import InProcessDispatchTrigger
+from .dispatch_worker import DispatchWorker
+from .jobs import AssignOrdersJob, DeliveryTickJob, MoveCouriersJob, RebalanceCouriersJob
+from .running_jobs import RunningJobs
 from .scheduler_config import create_scheduler
 
 
-__all__ = ["AssignOrdersJob", "MoveCouriersJob", "create_scheduler"]
+__all__ = [
+    "AssignOrdersJob",
+    "DeliveryTickJob",
+    "DispatchWorker",
+    "InProcessDispatchTrigger",
+    "MoveCouriersJob",
+    "RebalanceCouriersJob",
+    "RunningJobs",
+    "create_scheduler",
+]
@@ -0,0 +1,18 @@
+import asyncio
+import typing
+
+from delivery.core.ports.dispatch_trigger import DispatchTrigger
+
+
+class InProcessDispatchTrigger(DispatchTrigger):
+    """Сигнал диспетчеру внутри процесса: повторные уведомления до пробуждения схлопываются в одно."""
+
+    def __init__(self) -> None:
+        self._event: typing.Final = asyncio.Event()
+
+    def notify(self) -> None:
+        self._event.set()
+
+    async def wait(self) -> None:
+        await self._event.wait()
+        self._event.clear()
@@ -0,0 +1,36 @@
+import asyncio
+import contextlib
+
+from delivery.adapters.input.scheduler.dispatch_trigger import InProcessDispatchTrigger
+from delivery.adapters.input.scheduler.jobs.assign_orders_job import AssignOrdersJob
+
+
+class DispatchWorker:
+    def __init__(
+        self,
+        assign_orders_job: AssignOrdersJob,
+        trigger: InProcessDispatchTrigger,
+    ) -> None:
+        self._assign_orders_job = assign_orders_job
+        self._trigger = trigger
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="dispatch_worker")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await self._trigger.wait()
+            # Пока запуски забирают полные пачки, остаток очереди разбирается сразу, а не через страховочный интервал
+            while await self._assign_orders_job.run():
+                pass
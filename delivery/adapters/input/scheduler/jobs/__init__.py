@@ -1,5 +1,7 @@
 from .assign_orders_job import AssignOrdersJob
+from .delivery_tick_job import DeliveryTickJob
 from .move_couriers_job import MoveCouriersJob
+from .rebalance_couriers_job import RebalanceCouriersJob
 
 
-__all__ = ["AssignOrdersJob", "MoveCouriersJob"]
+__all__ = ["AssignOrdersJob", "DeliveryTickJob", "MoveCouriersJob", "RebalanceCouriersJob"]
@@ -14,12 +14,16 @@ class AssignOrdersJob:
     def __init__(self, handler: AssignOrderToCourierCommandHandler) -> None:
         self._handler = handler
 
-    async def run(self) -> None:
+    async def run(self) -> bool:
+        """Возвращает True, если в очереди могут остаться заказы и запуск стоит повторить сразу."""
         try:
             command: typing.Final = AssignOrderToCourierCommand()
             result: typing.Final = await self._handler.handle(command)
             if result.is_failure:
                 error: typing.Final = result.get_error()
                 logger.warning("AssignOrdersJob failed: %s - %s", error.code, error.message)
+                return False
+            return result.get_value()
         except Exception:
             logger.exception("AssignOrdersJob unexpected error")
+            return False
@@ -0,0 +1,25 @@
+import logging
+import typing
+
+from delivery.core.application.commands.run_delivery_tick import (
+    RunDeliveryTickCommand,
+    RunDeliveryTickCommandHandler,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class DeliveryTickJob:
+    def __init__(self, handler: RunDeliveryTickCommandHandler) -> None:
+        self._handler = handler
+
+    async def run(self) -> None:
+        try:
+            command: typing.Final = RunDeliveryTickCommand()
+            result: typing.Final = await self._handler.handle(command)
+            if result.is_failure:
+                error: typing.Final = result.get_error()
+                logger.warning("DeliveryTickJob failed: %s - %s", error.code, error.message)
+        except Exception:
+            logger.exception("DeliveryTickJob unexpected error")
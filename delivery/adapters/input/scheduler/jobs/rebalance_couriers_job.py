@@ -0,0 +1,25 @@
+import logging
+import typing
+
+from delivery.core.application.commands.rebalance_couriers import (
+    RebalanceCouriersCommand,
+    RebalanceCouriersCommandHandler,
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class RebalanceCouriersJob:
+    def __init__(self, handler: RebalanceCouriersCommandHandler) -> None:
+        self._handler = handler
+
+    async def run(self) -> None:
+        try:
+            command: typing.Final = RebalanceCouriersCommand()
+            result: typing.Final = await self._handler.handle(command)
+            if result.is_failure:
+                error: typing.Final = result.get_error()
+                logger.warning("RebalanceCouriersJob failed: %s - %s", error.code, error.message)
+        except Exception:
+            logger.exception("RebalanceCouriersJob unexpected error")
@@ -0,0 +1,39 @@
+import asyncio
+import typing
+
+from apscheduler.events import (  # type: ignore[import-untyped]
+    EVENT_JOB_ERROR,
+    EVENT_JOB_EXECUTED,
+    EVENT_JOB_SUBMITTED,
+    JobEvent,
+)
+from apscheduler.schedulers.asyncio import AsyncIOScheduler  # type: ignore[import-untyped]
+
+
+class RunningJobs:
+    """Считает запуски задач планировщика, которые ещё выполняются.
+
+    shutdown планировщика отменяет начатые корутины, поэтому перед ним drain ставит новые запуски на паузу
+    и дожидается выполняющихся.
+    """
+
+    def __init__(self, scheduler: AsyncIOScheduler) -> None:
+        self._scheduler: typing.Final = scheduler
+        self._running = 0
+        self._idle: typing.Final = asyncio.Event()
+        self._idle.set()
+        scheduler.add_listener(self._on_job_event, EVENT_JOB_SUBMITTED | EVENT_JOB_EXECUTED | EVENT_JOB_ERROR)
+
+    async def drain(self) -> None:
+        self._scheduler.pause()
+        await self._idle.wait()
+
+    def _on_job_event(self, event: JobEvent) -> None:
+        if event.code == EVENT_JOB_SUBMITTED:
+            self._running += 1
+            self._idle.clear()
+            return
+
+        self._running -= 1
+        if self._running == 0:
+            self._idle.set()
@@ -4,45 +4,67 @@ import typing
 from apscheduler.schedulers.asyncio import AsyncIOScheduler  # type: ignore[import-untyped]
 from apscheduler.triggers.interval import IntervalTrigger  # type: ignore[import-untyped]
 
-from delivery.adapters.input.scheduler.jobs.assign_orders_job import AssignOrdersJob
+from delivery.adapters.input.scheduler.jobs.delivery_tick_job import DeliveryTickJob
 from delivery.adapters.input.scheduler.jobs.move_couriers_job import MoveCouriersJob
 from delivery.adapters.input.scheduler.jobs.outbox_job import OutboxJob
-from delivery.core.application.commands.assign_order_to_courier import AssignOrderToCourierCommandHandler
+from delivery.adapters.input.scheduler.jobs.rebalance_couriers_job import RebalanceCouriersJob
 from delivery.core.application.commands.move_couriers import MoveCouriersCommandHandler
+from delivery.core.application.commands.rebalance_couriers import RebalanceCouriersCommandHandler
+from delivery.core.application.commands.run_delivery_tick import RunDeliveryTickCommandHandler
+from delivery.core.ports.dispatch_trigger import DispatchTrigger
 from delivery.core.ports.order_events_producer import OrderEventsProducer
 from delivery.core.ports.outbox_repository import OutboxRepository
+from delivery.settings import settings
 
 
 logger = logging.getLogger(__name__)
 
 
-def create_scheduler(
-    assign_orders_handler: AssignOrderToCourierCommandHandler,
+def create_scheduler(  # noqa: PLR0913
+    dispatch_trigger: DispatchTrigger,
     move_couriers_handler: MoveCouriersCommandHandler,
     outbox_repository: OutboxRepository,
     order_events_producer: OrderEventsProducer,
+    *,
+    rebalance_couriers_handler: RebalanceCouriersCommandHandler | None = None,
+    delivery_tick_handler: RunDeliveryTickCommandHandler | None = None,
 ) -> AsyncIOScheduler:
     scheduler: typing.Final = AsyncIOScheduler()
 
-    assign_orders_job: typing.Final = AssignOrdersJob(assign_orders_handler)
-    move_couriers_job: typing.Final = MoveCouriersJob(move_couriers_handler)
     outbox_job: typing.Final = OutboxJob(outbox_repository, order_events_producer)  # type: ignore[arg-type]
 
-    scheduler.add_job(
-        assign_orders_job.run,
-        trigger=IntervalTrigger(seconds=1),
-        id="assign_orders_job",
-        name="Assign Orders to Couriers",
-        replace_existing=True,
-    )
+    if delivery_tick_handler is not None:
+        # Движение и назначение выполняются одним тиком, отдельные задачи для них не нужны
+        delivery_tick_job: typing.Final = DeliveryTickJob(delivery_tick_handler)
+        scheduler.add_job(
+            delivery_tick_job.run,
+            trigger=IntervalTrigger(seconds=1),
+            id="delivery_tick_job",
+            name="Move Couriers and Assign Orders",
+            replace_existing=True,
+        )
+    else:
+        move_couriers_job: typing.Final = MoveCouriersJob(move_couriers_handler)
 
-    scheduler.add_job(
-        move_couriers_job.run,
-        trigger=IntervalTrigger(seconds=1),
-        id="move_couriers_job",
-        name="Move Couriers",
-        replace_existing=True,
-    )
+        # Заказы назначаются по сигналу о создании, интервальный запуск лишь страхует от пропущенных сигналов
+        async def notify_dispatch_trigger() -> None:
+            dispatch_trigger.notify()
+
+        scheduler.add_job(
+            notify_dispatch_trigger,
+            trigger=IntervalTrigger(seconds=settings.assign_orders_safety_interval_seconds),
+            id="assign_orders_job",
+            name="Assign Orders to Couriers",
+            replace_existing=True,
+        )
+
+        scheduler.add_job(
+            move_couriers_job.run,
+            trigger=IntervalTrigger(seconds=1),
+            id="move_couriers_job",
+            name="Move Couriers",
+            replace_existing=True,
+        )
 
     scheduler.add_job(
         outbox_job.run,
@@ -52,4 +74,14 @@ def create_scheduler(
         replace_existing=True,
     )
 
+    if rebalance_couriers_handler is not None:
+        rebalance_couriers_job: typing.Final = RebalanceCouriersJob(rebalance_couriers_handler)
+        scheduler.add_job(
+            rebalance_couriers_job.run,
+            trigger=IntervalTrigger(seconds=settings.courier_rebalancing_interval_seconds),
+            id="rebalance_couriers_job",
+            name="Rebalance Idle Couriers",
+            replace_existing=True,
+        )
+
     return scheduler
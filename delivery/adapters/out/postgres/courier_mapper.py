@@ -1,18 +1,13 @@
 import typing
+from collections.abc import Sequence
+from uuid import UUID
+
+import sqlalchemy
 
 from delivery.core.domain.model.courier.courier import Courier
 from delivery.core.domain.model.courier.storage_place import StoragePlace
 from delivery.core.domain.model.kernel import Location
-from delivery.database.models import CourierModel, StoragePlaceModel
-
-
-def _storage_place_to_domain(model: StoragePlaceModel) -> StoragePlace:
-    return StoragePlace(
-        id_=model.id,
-        name=model.name,
-        total_volume=model.total_volume,
-        order_id=model.order_id,
-    )
+from delivery.database.models import CourierModel, CourierPositionModel, StoragePlaceModel
 
 
 def _storage_place_to_model(place: StoragePlace, courier_id: object) -> StoragePlaceModel:
@@ -25,15 +20,45 @@ def _storage_place_to_model(place: StoragePlace, courier_id: object) -> StorageP
     )
 
 
-def to_domain(model: CourierModel) -> Courier:
-    location: typing.Final[Location] = Location.must_create(model.location_x, model.location_y)
-    storage_places: typing.Final[list[StoragePlace]] = [_storage_place_to_domain(sp) for sp in model.storage_places]
+# Courier columns, then one array per storage place column, NULL for a courier without storage places
+CourierRow = tuple[
+    UUID,
+    str,
+    int,
+    int,
+    int,
+    Sequence[UUID] | None,
+    Sequence[str] | None,
+    Sequence[int] | None,
+    Sequence[UUID | None] | None,
+]
+
+
+def row_to_domain(row: sqlalchemy.Row[*CourierRow]) -> Courier:
+    # Rows come from our own tables, where every value already passed domain validation on the way in,
+    # so the aggregate is assembled through plain constructors instead of must_create guards
+    (
+        courier_id,
+        name,
+        speed,
+        location_x,
+        location_y,
+        place_ids,
+        place_names,
+        place_volumes,
+        place_order_ids,
+    ) = row
     return Courier(
-        id_=model.id,
-        name=model.name,
-        speed=model.speed,
-        location=location,
-        storage_places=storage_places,
+        id_=courier_id,
+        name=name,
+        speed=speed,
+        location=Location(location_x, location_y),
+        storage_places=[
+            StoragePlace(id_=place_id, name=place_name, total_volume=total_volume, order_id=order_id)
+            for place_id, place_name, total_volume, order_id in zip(
+                place_ids or (), place_names or (), place_volumes or (), place_order_ids or (), strict=True
+            )
+        ],
     )
 
 
@@ -42,8 +67,28 @@ def to_model(courier: Courier) -> CourierModel:
         id=courier.id,
         name=courier.name,
         speed=courier.speed,
-        location_x=courier.location.x,
-        location_y=courier.location.y,
+        position=CourierPositionModel(
+            courier_id=courier.id,
+            location_x=courier.location.x,
+            location_y=courier.location.y,
+        ),
     )
     courier_model.storage_places = [_storage_place_to_model(place, courier.id) for place in courier.storage_places]
     return courier_model
+
+
+# Column values of the courier row, of its position row and of each storage place row keyed by place id
+type CourierSnapshot = tuple[tuple[object, ...], tuple[object, ...], tuple[tuple[object, tuple[object, ...]], ...]]
+
+COURIER_COLUMNS: typing.Final = ("name", "speed")
+POSITION_COLUMNS: typing.Final = ("location_x", "location_y")
+STORAGE_PLACE_COLUMNS: typing.Final = ("name", "total_volume", "order_id")
+
+
+def to_snapshot(courier: Courier) -> CourierSnapshot:
+    # Everything update_many writes, compared at flush to find couriers and columns changed since they were loaded
+    return (
+        (courier.name, courier.speed),
+        (courier.location.x, courier.location.y),
+        tuple((place.id, (place.name, place.total_volume, place.order_id)) for place in courier.storage_places),
+    )
@@ -0,0 +1,69 @@
+import typing
+from uuid import UUID
+
+import sqlalchemy
+import sqlalchemy.ext.asyncio as sa_async
+
+from delivery.core.domain.model.kernel import Location
+from delivery.core.ports.courier_position_buffer import CourierPositionBuffer
+
+
+_UPDATE_POSITIONS_SQL: typing.Final = sqlalchemy.text(
+    """
+    UPDATE courier_positions
+    SET location_x = positions.x, location_y = positions.y
+    FROM unnest(CAST(:ids AS uuid[]), CAST(:xs AS integer[]), CAST(:ys AS integer[])) AS positions(id, x, y)
+    WHERE courier_positions.courier_id = positions.id
+    """
+)
+
+
+class WriteBehindCourierPositionBuffer(CourierPositionBuffer):
+    """Keeps courier positions in memory and writes them to Postgres in one bulk statement.
+
+    Only positions not yet written are kept: once a flush succeeds, the row in Postgres is authoritative again and
+    readers fall back to it. A failed flush keeps the positions, and the next tick retries it. At most
+    flush_interval_ticks ticks or max_unflushed positions can be lost if the process dies between flushes.
+    """
+
+    def __init__(self, engine: sa_async.AsyncEngine, flush_interval_ticks: int, max_unflushed: int) -> None:
+        self._engine: typing.Final = engine
+        self._flush_interval_ticks: typing.Final = flush_interval_ticks
+        self._max_unflushed: typing.Final = max_unflushed
+        self._unflushed: typing.Final[dict[UUID, Location]] = {}
+        self._ticks_since_flush = 0
+
+    def get_location(self, courier_id: UUID) -> Location | None:
+        return self._unflushed.get(courier_id)
+
+    def set_location(self, courier_id: UUID, location: Location) -> None:
+        self._unflushed[courier_id] = location
+
+    async def complete_tick(self, force_flush: bool = False) -> None:
+        self._ticks_since_flush += 1
+        if (
+            force_flush
+            or self._ticks_since_flush >= self._flush_interval_ticks
+            or len(self._unflushed) >= self._max_unflushed
+        ):
+            await self.flush()
+
+    async def flush(self) -> None:
+        if self._unflushed:
+            positions: typing.Final = list(self._unflushed.items())
+            async with self._engine.begin() as connection:
+                await connection.execute(
+                    _UPDATE_POSITIONS_SQL,
+                    {
+                        "ids": [courier_id for courier_id, _ in positions],
+                        "xs": [location.x for _, location in positions],
+                        "ys": [location.y for _, location in positions],
+                    },
+                )
+            # Positions set while the statement was running stay unflushed until the next flush
+            for courier_id, location in positions:
+                if self._unflushed.get(courier_id) == location:
+                    del self._unflushed[courier_id]
+
+        # A failed flush raises before this point and leaves the counter as is, so the next tick retries it
+        self._ticks_since_flush = 0
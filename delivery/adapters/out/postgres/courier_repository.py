@@ -1,14 +1,146 @@
+import collections
+import dataclasses
+import functools
 import typing
+from collections.abc import Collection, Sequence
 from uuid import UUID
 
 import sqlalchemy
 import sqlalchemy.ext.asyncio as sa_async
 from advanced_alchemy.repository import SQLAlchemyAsyncRepository
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.orm.util import identity_key
 
-from delivery.adapters.out.postgres.courier_mapper import to_domain, to_model
+from delivery.adapters.out.postgres.courier_mapper import (
+    COURIER_COLUMNS,
+    POSITION_COLUMNS,
+    STORAGE_PLACE_COLUMNS,
+    CourierRow,
+    CourierSnapshot,
+    row_to_domain,
+    to_model,
+    to_snapshot,
+)
+from delivery.adapters.out.postgres.tracked_aggregates import TrackedAggregates
 from delivery.core.domain.model.courier.courier import Courier
 from delivery.core.ports.courier_repository import CourierRepository
-from delivery.database.models import CourierModel, StoragePlaceModel
+from delivery.database.models import BaseModel, CourierModel, CourierPositionModel, StoragePlaceModel
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Table:
+    model: type[BaseModel]
+    key: str
+    columns: tuple[str, ...]
+
+
+_COURIERS: typing.Final = _Table(CourierModel, "id", COURIER_COLUMNS)
+_POSITIONS: typing.Final = _Table(CourierPositionModel, "courier_id", POSITION_COLUMNS)
+_STORAGE_PLACES: typing.Final = _Table(StoragePlaceModel, "id", STORAGE_PLACE_COLUMNS)
+
+
+@functools.cache
+def _upsert_changed(table: _Table) -> postgresql.Insert:
+    # Rows whose values are already current are skipped by the WHERE clause, so Postgres does not rewrite them
+    local_table: typing.Final = typing.cast("sqlalchemy.Table", sqlalchemy.inspect(table.model).local_table)
+    stmt: typing.Final = postgresql.insert(local_table)
+    return stmt.on_conflict_do_update(
+        index_elements=[table.key],
+        set_={column: stmt.excluded[column] for column in table.columns},
+        where=sqlalchemy.tuple_(*(local_table.c[column] for column in table.columns)).is_distinct_from(
+            sqlalchemy.tuple_(*(stmt.excluded[column] for column in table.columns))
+        ),
+    )
+
+
+@functools.cache
+def _update_columns(table: _Table, columns: tuple[str, ...]) -> sqlalchemy.Update:
+    # Executed with one parameter set per row; bind names differ from column names, which SET reserves for itself
+    local_table: typing.Final = typing.cast("sqlalchemy.Table", sqlalchemy.inspect(table.model).local_table)
+    return (
+        sqlalchemy.update(local_table)
+        .where(local_table.c[table.key] == sqlalchemy.bindparam("row_key"))
+        .values({column: sqlalchemy.bindparam(f"new_{column}") for column in columns})
+    )
+
+
+class _CourierWrites:
+    """Rows of changed couriers, grouped into one statement per table and set of changed columns."""
+
+    def __init__(self) -> None:
+        self._upserts: typing.Final[dict[_Table, list[dict[str, object]]]] = collections.defaultdict(list)
+        self._updates: typing.Final[dict[sqlalchemy.Update, list[dict[str, object]]]] = collections.defaultdict(list)
+
+    def add(self, courier: Courier, persisted: CourierSnapshot | None) -> None:
+        courier_values, position_values, places = to_snapshot(courier)
+        if persisted is None:
+            self._upsert(_COURIERS, courier_values, id=courier.id)
+            self._upsert(_POSITIONS, position_values, courier_id=courier.id)
+        else:
+            self._update(_COURIERS, courier.id, persisted[0], courier_values)
+            self._update(_POSITIONS, courier.id, persisted[1], position_values)
+
+        persisted_places: typing.Final = dict(persisted[2]) if persisted is not None else {}
+        for place_id, place_values in places:
+            persisted_values = persisted_places.get(place_id)
+            if persisted_values is None:
+                self._upsert(_STORAGE_PLACES, place_values, id=place_id, courier_id=courier.id)
+            else:
+                self._update(_STORAGE_PLACES, place_id, persisted_values, place_values)
+
+    def statements(self) -> list[tuple[sqlalchemy.Executable, list[dict[str, object]]]]:
+        # Upserts go first and courier rows before the rows referring to them
+        upserts: typing.Final = [
+            (_upsert_changed(table), self._upserts[table])
+            for table in (_COURIERS, _POSITIONS, _STORAGE_PLACES)
+            if table in self._upserts
+        ]
+        return [*upserts, *self._updates.items()]
+
+    def _upsert(self, table: _Table, values: tuple[object, ...], **keys: object) -> None:
+        self._upserts[table].append({**keys, **dict(zip(table.columns, values, strict=True))})
+
+    def _update(
+        self, table: _Table, row_key: object, persisted: tuple[object, ...], values: tuple[object, ...]
+    ) -> None:
+        changed: typing.Final = {
+            column: value
+            for column, old_value, value in zip(table.columns, persisted, values, strict=True)
+            if old_value != value
+        }
+        if changed:
+            self._updates[_update_columns(table, tuple(changed))].append(
+                {"row_key": row_key, **{f"new_{column}": value for column, value in changed.items()}}
+            )
+
+
+def _select_couriers() -> sqlalchemy.Select[*CourierRow]:
+    # A courier with its position and storage places in one statement: places are grouped into one typed array
+    # per column, all in the same order, instead of a second selectin query and ORM entities per row
+    def aggregate_places[T](column: InstrumentedAttribute[T]) -> sqlalchemy.ColumnElement[Sequence[T] | None]:
+        # Without storage places the filtered aggregate is NULL rather than an empty array
+        aggregate: typing.Final = sqlalchemy.func.array_agg(
+            postgresql.aggregate_order_by(column, StoragePlaceModel.id), _default_array_type=postgresql.ARRAY
+        ).filter(StoragePlaceModel.id.is_not(None))
+        return typing.cast("sqlalchemy.ColumnElement[Sequence[T] | None]", aggregate)
+
+    return (
+        sqlalchemy.select(
+            CourierModel.id,
+            CourierModel.name,
+            CourierModel.speed,
+            CourierPositionModel.location_x,
+            CourierPositionModel.location_y,
+            aggregate_places(StoragePlaceModel.id),
+            aggregate_places(StoragePlaceModel.name),
+            aggregate_places(StoragePlaceModel.total_volume),
+            aggregate_places(StoragePlaceModel.order_id),
+        )
+        .join(CourierPositionModel, CourierPositionModel.courier_id == CourierModel.id)
+        .outerjoin(StoragePlaceModel, StoragePlaceModel.courier_id == CourierModel.id)
+        .group_by(CourierModel.id, CourierPositionModel.courier_id)
+    )
 
 
 class _CourierAlchemyRepository(SQLAlchemyAsyncRepository[CourierModel]):  # type: ignore[type-var]
@@ -19,25 +151,118 @@ class CourierRepositoryImpl(CourierRepository):
     def __init__(self, session: sa_async.AsyncSession) -> None:
         self._session: typing.Final = session
         self._repo: typing.Final = _CourierAlchemyRepository(session=session)
+        self._tracked: typing.Final = TrackedAggregates[Courier](to_snapshot)
 
     async def add(self, courier: Courier) -> None:
         await self._repo.add(to_model(courier), auto_commit=False)
+        self._tracked.mark_persisted(courier)
+
+    async def update_many(self, couriers: Collection[Courier]) -> None:
+        # Each tracked courier is compared with its snapshot, so only changed rows and columns are written, with one
+        # statement per table and set of changed columns. Rows not stored yet are upserted whole instead of merged.
+        # Storage places are never removed from the aggregate, so there are no orphans to delete here.
+        if not couriers:
+            return
+
+        writes: typing.Final = _CourierWrites()
+        for courier in couriers:
+            persisted = self._tracked.persisted(typing.cast("UUID", courier.id))
+            writes.add(courier, typing.cast("CourierSnapshot | None", persisted))
+
+        # Pending ORM changes are flushed first, otherwise they would overwrite these statements at commit
+        await self._session.flush()
+        for stmt, parameters in writes.statements():
+            await self._session.execute(stmt, parameters)
+
+        self._expire_loaded(couriers)
+        for courier in couriers:
+            self._tracked.mark_persisted(courier)
+
+    def mark_persisted(self, courier: Courier) -> None:
+        self._tracked.mark_persisted(courier)
+
+    def tracked(self) -> list[Courier]:
+        return list(self._tracked)
 
-    async def update(self, courier: Courier) -> None:
-        await self._session.merge(to_model(courier))
+    async def flush_changes(self) -> None:
+        await self.update_many(self._tracked.changed())
 
     async def get_by_id(self, courier_id: UUID) -> Courier | None:
-        model: typing.Final = await self._repo.get_one_or_none(id=courier_id)
-        if model is None:
+        tracked: typing.Final = self._tracked.get(courier_id)
+        if tracked is not None:
+            return tracked
+        couriers: typing.Final = await self._load(CourierModel.id == courier_id)
+        return couriers[0] if couriers else None
+
+    async def claim_by_id(self, courier_id: UUID) -> Courier | None:
+        # Returns None if another dispatcher already holds the courier row, and always re-reads its storage places.
+        # FOR UPDATE cannot be combined with GROUP BY, so the row is locked in a CTE of the same statement
+        await self.flush_changes()
+        claimed: typing.Final = (
+            sqlalchemy.select(CourierModel.id)
+            .where(CourierModel.id == courier_id)
+            .with_for_update(skip_locked=True)
+            .cte("claimed")
+        )
+        stmt: typing.Final = _select_couriers().where(CourierModel.id.in_(sqlalchemy.select(claimed.c.id)))
+        row: typing.Final = (await self._session.execute(stmt)).one_or_none()
+        if row is None:
             return None
-        return to_domain(model)
+        return self._tracked.refresh(row_to_domain(row))
+
+    async def get_all_by_ids(self, courier_ids: Collection[UUID]) -> list[Courier]:
+        # Couriers already loaded in this transaction are served from the identity map without a query
+        loaded: typing.Final[list[Courier]] = []
+        missing_ids: typing.Final[list[UUID]] = []
+        for courier_id in courier_ids:
+            tracked = self._tracked.get(courier_id)
+            if tracked is None:
+                missing_ids.append(courier_id)
+            else:
+                loaded.append(tracked)
+        if not missing_ids:
+            return loaded
+        return [*loaded, *await self._load(CourierModel.id.in_(missing_ids))]
 
     async def get_all_free(self) -> list[Courier]:
+        await self.flush_changes()
         # Get all courier IDs that have at least one storage place with an order
         occupied_courier_ids_subquery: typing.Final = (
             sqlalchemy.select(StoragePlaceModel.courier_id).where(StoragePlaceModel.order_id.is_not(None)).distinct()
         )
-        stmt: typing.Final = sqlalchemy.select(CourierModel).where(~CourierModel.id.in_(occupied_courier_ids_subquery))
-        result: typing.Final = await self._session.execute(stmt)
-        models: typing.Final = result.scalars().unique().all()
-        return [to_domain(m) for m in models]
+        return await self._load(~CourierModel.id.in_(occupied_courier_ids_subquery))
+
+    async def get_all_with_free_capacity(self, volume: int) -> list[Courier]:
+        await self.flush_changes()
+        # Couriers with at least one empty storage place that fits the volume, even if other places are occupied
+        free_place_courier_ids_subquery: typing.Final = (
+            sqlalchemy.select(StoragePlaceModel.courier_id)
+            .where(StoragePlaceModel.order_id.is_(None), StoragePlaceModel.total_volume >= volume)
+            .distinct()
+        )
+        return await self._load(CourierModel.id.in_(free_place_courier_ids_subquery))
+
+    async def _load(self, criterion: sqlalchemy.ColumnElement[bool]) -> list[Courier]:
+        result: typing.Final = await self._session.execute(_select_couriers().where(criterion))
+        # The same courier loaded twice in a transaction is one object, so changes made through either are kept
+        couriers: typing.Final[list[Courier]] = []
+        for row in result:
+            courier = self._tracked.get(row[0])
+            if courier is None:
+                courier = row_to_domain(row)
+                self._tracked.mark_persisted(courier)
+            couriers.append(courier)
+        return couriers
+
+    def _expire_loaded(self, couriers: Collection[Courier]) -> None:
+        # Models loaded earlier in the session still hold the values from before the write
+        for courier in couriers:
+            self._expire(CourierModel, courier.id)
+            self._expire(CourierPositionModel, courier.id)
+            for place in courier.storage_places:
+                self._expire(StoragePlaceModel, place.id)
+
+    def _expire(self, model_type: type[BaseModel], model_id: object) -> None:
+        model: typing.Final = self._session.identity_map.get(identity_key(model_type, model_id))
+        if model is not None:
+            self._session.expire(model)
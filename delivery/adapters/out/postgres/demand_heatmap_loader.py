@@ -0,0 +1,31 @@
+import datetime as dt
+import typing
+
+import sqlalchemy
+import sqlalchemy.ext.asyncio as sa_async
+
+from delivery.core.domain.model.kernel import Location
+from delivery.core.domain.model.order.events import OrderCreatedDomainEvent
+from delivery.core.domain.service.demand_heatmap import DemandHeatmap
+from delivery.database.models import OrderModel, OutboxMessageModel
+
+
+async def restore_demand_heatmap(engine: sa_async.AsyncEngine, demand_heatmap: DemandHeatmap) -> None:
+    """Replays recent order creations into the heatmap.
+
+    Orders have no creation timestamp of their own, so the time comes from the OrderCreatedDomainEvent
+    outbox record that is written in the same transaction as the order.
+    """
+    since: typing.Final = dt.datetime.now(dt.UTC) - demand_heatmap.memory
+    stmt: typing.Final = (
+        sqlalchemy.select(OrderModel.location_x, OrderModel.location_y, OutboxMessageModel.occurred_on_utc)
+        .join(OutboxMessageModel, OutboxMessageModel.aggregate_id == OrderModel.id)
+        .where(
+            OutboxMessageModel.event_type == OrderCreatedDomainEvent.__name__,
+            OutboxMessageModel.occurred_on_utc >= since,
+        )
+        .order_by(OutboxMessageModel.occurred_on_utc)
+    )
+    async with engine.connect() as connection:
+        for row in await connection.execute(stmt):
+            demand_heatmap.record(Location.must_create(row.location_x, row.location_y), row.occurred_on_utc)
@@ -1,6 +1,8 @@
+import datetime as dt
 import typing
+from uuid import UUID
 
-from delivery.core.domain.model.kernel import Location, Volume
+from delivery.core.domain.model.kernel import DeliveryPeriod, Location, Volume
 from delivery.core.domain.model.order.order import Order
 from delivery.core.domain.model.order.order_status import OrderStatus
 from delivery.database.models import OrderModel
@@ -9,12 +11,20 @@ from delivery.database.models import OrderModel
 def to_domain(model: OrderModel) -> Order:
     location: typing.Final[Location] = Location.must_create(model.location_x, model.location_y)
     volume: typing.Final[Volume] = Volume.must_create(model.volume)
+    delivery_period: typing.Final[DeliveryPeriod | None] = (
+        DeliveryPeriod.must_create(model.delivery_period_start, model.delivery_period_end)
+        if model.delivery_period_start is not None and model.delivery_period_end is not None
+        else None
+    )
     return Order(
         id_=model.id,
         location=location,
         volume=volume,
         status=OrderStatus(model.status),
         courier_id=model.courier_id,
+        reserved_courier_id=model.reserved_courier_id,
+        delivery_period=delivery_period,
+        estimated_arrival_at=model.estimated_arrival_at,
     )
 
 
@@ -26,4 +36,16 @@ def to_model(order: Order) -> OrderModel:
         volume=order.volume.value,
         status=order.status.value,
         courier_id=order.courier_id,
+        reserved_courier_id=order.reserved_courier_id,
+        delivery_period_start=order.delivery_period.start if order.delivery_period is not None else None,
+        delivery_period_end=order.delivery_period.end if order.delivery_period is not None else None,
+        estimated_arrival_at=order.estimated_arrival_at,
     )
+
+
+type OrderSnapshot = tuple[OrderStatus, UUID | None, UUID | None, dt.datetime | None]
+
+
+def to_snapshot(order: Order) -> OrderSnapshot:
+    # Only the columns update_many writes: location, volume and delivery period never change after creation
+    return (order.status, order.courier_id, order.reserved_courier_id, order.estimated_arrival_at)
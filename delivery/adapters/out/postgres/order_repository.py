@@ -1,15 +1,76 @@
+import datetime as dt
 import typing
+from collections.abc import Collection
 from uuid import UUID
 
+import sqlalchemy
 import sqlalchemy.ext.asyncio as sa_async
-from advanced_alchemy.filters import CollectionFilter, LimitOffset
+from advanced_alchemy.filters import CollectionFilter, LimitOffset, OrderBy
 from advanced_alchemy.repository import SQLAlchemyAsyncRepository
+from sqlalchemy.orm.util import identity_key
 
-from delivery.adapters.out.postgres.order_mapper import to_domain, to_model
+from delivery.adapters.out.postgres.order_mapper import OrderSnapshot, to_domain, to_model, to_snapshot
+from delivery.adapters.out.postgres.tracked_aggregates import TrackedAggregates
 from delivery.core.domain.model.order.order import Order
 from delivery.core.domain.model.order.order_status import OrderStatus
 from delivery.core.ports.order_repository import OrderRepository
 from delivery.database.models import OrderModel
+from delivery.libs.errs.error import Error
+
+
+# A row is only overwritten while it still holds the values this transaction loaded, so an order that a concurrent
+# transaction has changed in the meantime, even to the same status, is left alone and missing from the result.
+# Orders not loaded here have no such values and fall back to a status that is the same or one transition behind.
+_UPDATE_ORDERS_SQL: typing.Final = sqlalchemy.text(
+    """
+    UPDATE orders
+    SET status = changes.status,
+        courier_id = changes.courier_id,
+        reserved_courier_id = changes.reserved_courier_id,
+        estimated_arrival_at = changes.estimated_arrival_at
+    FROM unnest(
+        CAST(:ids AS uuid[]),
+        CAST(:statuses AS varchar[]),
+        CAST(:courier_ids AS uuid[]),
+        CAST(:reserved_courier_ids AS uuid[]),
+        CAST(:estimated_arrivals AS timestamptz[]),
+        CAST(:persisted_statuses AS varchar[]),
+        CAST(:persisted_courier_ids AS uuid[]),
+        CAST(:persisted_reserved_courier_ids AS uuid[]),
+        CAST(:persisted_estimated_arrivals AS timestamptz[])
+    ) AS changes(
+        id,
+        status,
+        courier_id,
+        reserved_courier_id,
+        estimated_arrival_at,
+        persisted_status,
+        persisted_courier_id,
+        persisted_reserved_courier_id,
+        persisted_estimated_arrival_at
+    )
+    WHERE orders.id = changes.id
+      AND CASE
+        WHEN changes.persisted_status IS NOT NULL THEN
+          (orders.status, orders.courier_id, orders.reserved_courier_id, orders.estimated_arrival_at)
+          IS NOT DISTINCT FROM (
+            changes.persisted_status,
+            changes.persisted_courier_id,
+            changes.persisted_reserved_courier_id,
+            changes.persisted_estimated_arrival_at
+          )
+        ELSE
+          orders.status = changes.status
+          OR (orders.status, changes.status) IN (
+            SELECT * FROM unnest(CAST(:transitions_from AS varchar[]), CAST(:transitions_to AS varchar[]))
+          )
+      END
+    RETURNING orders.id
+    """
+)
+_STATUS_TRANSITIONS: typing.Final = [
+    (source, target) for source in OrderStatus for target in OrderStatus if source.can_transition_to(target)
+]
 
 
 class _OrderAlchemyRepository(SQLAlchemyAsyncRepository[OrderModel]):  # type: ignore[type-var]
@@ -18,31 +79,158 @@ class _OrderAlchemyRepository(SQLAlchemyAsyncRepository[OrderModel]):  # type: i
 
 class OrderRepositoryImpl(OrderRepository):
     def __init__(self, session: sa_async.AsyncSession) -> None:
+        self._session: typing.Final = session
         self._repo: typing.Final = _OrderAlchemyRepository(session=session)
+        self._tracked: typing.Final = TrackedAggregates[Order](to_snapshot)
 
     async def add(self, order: Order) -> None:
         await self._repo.add(to_model(order), auto_commit=False)
+        self._tracked.mark_persisted(order)
+
+    async def update_many(self, orders: Collection[Order]) -> int:
+        # One statement for the whole batch instead of a load and merge per order
+        if not orders:
+            return 0
+
+        persisted: typing.Final = [
+            typing.cast("OrderSnapshot | None", self._tracked.persisted(typing.cast("UUID", order.id)))
+            for order in orders
+        ]
+        # Pending ORM changes are flushed first, otherwise they would overwrite this update at commit
+        await self._session.flush()
+        result: typing.Final = await self._session.execute(
+            _UPDATE_ORDERS_SQL,
+            {
+                "ids": [order.id for order in orders],
+                "statuses": [order.status.value for order in orders],
+                "courier_ids": [order.courier_id for order in orders],
+                "reserved_courier_ids": [order.reserved_courier_id for order in orders],
+                "estimated_arrivals": [order.estimated_arrival_at for order in orders],
+                "persisted_statuses": [snapshot[0].value if snapshot else None for snapshot in persisted],
+                "persisted_courier_ids": [snapshot[1] if snapshot else None for snapshot in persisted],
+                "persisted_reserved_courier_ids": [snapshot[2] if snapshot else None for snapshot in persisted],
+                "persisted_estimated_arrivals": [snapshot[3] if snapshot else None for snapshot in persisted],
+                "transitions_from": [source.value for source, _ in _STATUS_TRANSITIONS],
+                "transitions_to": [target.value for _, target in _STATUS_TRANSITIONS],
+            },
+        )
+        updated_ids: typing.Final = set(result.scalars())
+
+        for order in orders:
+            # Models loaded earlier in the session still hold the values from before the update
+            model = self._session.identity_map.get(identity_key(OrderModel, order.id))
+            if model is not None:
+                self._session.expire(model)
+            # An order left alone keeps its snapshot, so it still counts as changed and is not taken as stored
+            if order.id in updated_ids:
+                self._tracked.mark_persisted(order)
 
-    async def update(self, order: Order) -> None:
-        await self._repo.update(to_model(order), auto_commit=False)
+        return len(updated_ids)
+
+    def tracked(self) -> list[Order]:
+        return list(self._tracked)
+
+    async def flush_changes(self) -> None:
+        changed: typing.Final = self._tracked.changed()
+        if changed and await self.update_many(changed) != len(changed):
+            # The exception rolls back the whole unit of work instead of committing couriers that disagree with orders
+            Error.throw_if(Error.of("order.lost.update", "Some orders were changed by a concurrent transaction"))
 
     async def get_by_id(self, order_id: UUID) -> Order | None:
+        tracked: typing.Final = self._tracked.get(order_id)
+        if tracked is not None:
+            return tracked
         model: typing.Final = await self._repo.get_one_or_none(id=order_id)
         if model is None:
             return None
-        return to_domain(model)
+        return self._hydrate(model)
 
     async def get_first_by_status_created(self) -> Order | None:
+        await self.flush_changes()
         results: typing.Final = await self._repo.list(
             CollectionFilter(field_name="status", values=[OrderStatus.CREATED.value]),
+            OrderBy(field_name="delivery_period_end", sort_order="asc"),
             LimitOffset(limit=1, offset=0),
         )
         if not results:
             return None
-        return to_domain(results[0])
+        return self._hydrate(results[0])
+
+    async def get_all_by_status_created(self, limit: int) -> list[Order]:
+        await self.flush_changes()
+        results: typing.Final = await self._repo.list(
+            CollectionFilter(field_name="status", values=[OrderStatus.CREATED.value]),
+            OrderBy(field_name="delivery_period_end", sort_order="asc"),
+            LimitOffset(limit=limit, offset=0),
+        )
+        return [self._hydrate(model) for model in results]
+
+    async def claim_all_created(self, limit: int) -> list[Order]:
+        await self.flush_changes()
+        # Rows locked by another dispatcher's transaction are skipped, so parallel dispatchers get disjoint orders.
+        # Orders whose delivery window closes soonest come first; ix_orders_status_delivery_period_end serves the sort
+        stmt: typing.Final = (
+            sqlalchemy.select(OrderModel)
+            .where(OrderModel.status == OrderStatus.CREATED.value)
+            .order_by(OrderModel.delivery_period_end.asc().nulls_last())
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .execution_options(populate_existing=True)
+        )
+        result: typing.Final = await self._session.execute(stmt)
+        return [self._tracked.refresh(to_domain(model)) for model in result.scalars().all()]
 
     async def get_all_assigned(self) -> list[Order]:
+        await self.flush_changes()
+        results: typing.Final = await self._repo.list(
+            CollectionFilter(field_name="status", values=[OrderStatus.ASSIGNED.value]),
+            OrderBy(field_name="delivery_period_end", sort_order="asc"),
+        )
+        return [self._hydrate(model) for model in results]
+
+    async def get_all_assigned_by_courier_ids(self, courier_ids: Collection[UUID]) -> list[Order]:
+        if not courier_ids:
+            return []
+        await self.flush_changes()
         results: typing.Final = await self._repo.list(
             CollectionFilter(field_name="status", values=[OrderStatus.ASSIGNED.value]),
+            CollectionFilter(field_name="courier_id", values=list(courier_ids)),
         )
-        return [to_domain(model) for model in results]
+        return [self._hydrate(model) for model in results]
+
+    async def get_all_arrived(self, moment: dt.datetime) -> list[Order]:
+        await self.flush_changes()
+        # ix_orders_status_estimated_arrival_at serves as the queue of due arrivals, so a tick reads only them
+        stmt: typing.Final = (
+            sqlalchemy.select(OrderModel)
+            .where(
+                OrderModel.status == OrderStatus.ASSIGNED.value,
+                OrderModel.estimated_arrival_at <= moment,
+            )
+            .order_by(OrderModel.estimated_arrival_at.asc())
+        )
+        result: typing.Final = await self._session.execute(stmt)
+        return [self._hydrate(model) for model in result.scalars().all()]
+
+    async def get_all_unscheduled(self) -> list[Order]:
+        await self.flush_changes()
+        # Orders assigned before the eta mode was enabled have no arrival yet
+        stmt: typing.Final = (
+            sqlalchemy.select(OrderModel)
+            .where(
+                OrderModel.status == OrderStatus.ASSIGNED.value,
+                OrderModel.estimated_arrival_at.is_(None),
+            )
+            .order_by(OrderModel.delivery_period_end.asc())
+        )
+        result: typing.Final = await self._session.execute(stmt)
+        return [self._hydrate(model) for model in result.scalars().all()]
+
+    def _hydrate(self, model: OrderModel) -> Order:
+        # The same order loaded twice in a transaction is one object, so changes made through either are kept
+        tracked: typing.Final = self._tracked.get(model.id)
+        if tracked is not None:
+            return tracked
+        order: typing.Final = to_domain(model)
+        self._tracked.mark_persisted(order)
+        return order
@@ -0,0 +1,53 @@
+import typing
+from collections.abc import Callable, Hashable
+from uuid import UUID
+
+from delivery.libs.ddd import Aggregate
+
+
+class TrackedAggregates[T: Aggregate[typing.Any]]:
+    """Per-transaction identity map of aggregates with a snapshot of their persisted state.
+
+    A repository hands out the tracked instance for every row it has already loaded, so all code in the transaction
+    works on the same object, and only aggregates whose snapshot no longer matches are written back.
+    """
+
+    def __init__(self, snapshot: Callable[[T], Hashable]) -> None:
+        self._snapshot: typing.Final = snapshot
+        self._aggregates: typing.Final[dict[UUID, T]] = {}
+        self._persisted: typing.Final[dict[UUID, Hashable]] = {}
+
+    def __iter__(self) -> typing.Iterator[T]:
+        return iter(self._aggregates.values())
+
+    def get(self, aggregate_id: UUID) -> T | None:
+        return self._aggregates.get(aggregate_id)
+
+    def mark_persisted(self, aggregate: T) -> None:
+        """Tracks the aggregate with its current state as the one stored in the database."""
+        aggregate_id: typing.Final = typing.cast("UUID", aggregate.id)
+        self._aggregates[aggregate_id] = aggregate
+        self._persisted[aggregate_id] = self._snapshot(aggregate)
+
+    def persisted(self, aggregate_id: UUID) -> Hashable | None:
+        """Return the snapshot of the aggregate as last stored, or None if it is not tracked."""
+        return self._persisted.get(aggregate_id)
+
+    def refresh(self, aggregate: T) -> T:
+        """Tracks an aggregate just re-read from the database.
+
+        The instance loaded earlier is kept while it matches the row, so references held by the caller stay valid.
+        Otherwise the row was changed by another transaction and the fresh instance replaces it.
+        """
+        tracked: typing.Final = self._aggregates.get(typing.cast("UUID", aggregate.id))
+        if tracked is not None and self._snapshot(tracked) == self._snapshot(aggregate):
+            return tracked
+        self.mark_persisted(aggregate)
+        return aggregate
+
+    def changed(self) -> list[T]:
+        return [
+            aggregate
+            for aggregate_id, aggregate in self._aggregates.items()
+            if self._snapshot(aggregate) != self._persisted[aggregate_id]
+        ]
@@ -0,0 +1 @@
+"""Prometheus adapters for service metrics."""
@@ -0,0 +1,25 @@
+import typing
+
+import prometheus_client
+
+from delivery.core.ports.delivery_metrics import DeliveryMetrics
+
+
+_MISSED_DELIVERY_WINDOWS: typing.Final = prometheus_client.Counter(
+    "delivery_orders_missed_window",
+    "Orders completed after their delivery window had closed",
+)
+
+_TICK_STAGE_DURATION: typing.Final = prometheus_client.Histogram(
+    "delivery_tick_stage_seconds",
+    "Duration of each stage of the unified delivery tick",
+    ["stage"],
+)
+
+
+class PrometheusDeliveryMetrics(DeliveryMetrics):
+    def record_missed_delivery_windows(self, count: int) -> None:
+        _MISSED_DELIVERY_WINDOWS.inc(count)
+
+    def record_tick_stage_duration(self, stage: str, seconds: float) -> None:
+        _TICK_STAGE_DURATION.labels(stage=stage).observe(seconds)
@@ -0,0 +1 @@
+"""Offline benchmarks that replay order streams through the domain model."""
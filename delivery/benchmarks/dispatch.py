@@ -0,0 +1,233 @@
+"""Сравнение стратегий диспетчеризации на записанном или синтетическом потоке заказов.
+
+Запуск: python -m delivery.benchmarks.dispatch --couriers 50 --orders 500 --ticks 200
+или python -m delivery.benchmarks.dispatch --scenario recorded.json --strategy greedy_nearest
+
+Формат сценария: {"ticks": 100, "couriers": [{"speed": 2, "x": 1, "y": 1, "extra_volume": 20}],
+"orders": [{"tick": 0, "x": 5, "y": 5, "volume": 3}]}, поле extra_volume необязательное.
+"""
+
+import argparse
+import dataclasses
+import json
+import pathlib
+import random
+import statistics
+import sys
+import time
+import typing
+import uuid
+
+from delivery.core.domain.model.courier.courier import Courier
+from delivery.core.domain.model.kernel import Location, Volume
+from delivery.core.domain.model.order.order import Order
+from delivery.core.domain.service.dispatch_strategy import DispatchStrategyRegistry
+from delivery.core.domain.service.order_dispatch_service import OrderDispatchDomainService
+
+
+_EXTRA_STORAGE_NAME: typing.Final[str] = "Рюкзак"
+_MAX_SYNTHETIC_ORDER_VOLUME: typing.Final[int] = 15
+_NANOSECONDS_IN_MICROSECOND: typing.Final[int] = 1_000
+_PERCENTILES: typing.Final[int] = 100
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CourierSeed:
+    speed: int
+    x: int
+    y: int
+    extra_volume: int | None = None
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class OrderArrival:
+    tick: int
+    x: int
+    y: int
+    volume: int
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Scenario:
+    ticks: int
+    couriers: list[CourierSeed]
+    orders: list[OrderArrival]
+
+
+@dataclasses.dataclass(slots=True)
+class StrategyReport:
+    strategy: str
+    orders: int
+    decision_latencies_ns: list[int] = dataclasses.field(default_factory=list)
+    delivered: int = 0
+    delivery_steps: int = 0
+    busy_courier_ticks: int = 0
+    courier_ticks: int = 0
+
+    @property
+    def utilisation(self) -> float:
+        return self.busy_courier_ticks / self.courier_ticks if self.courier_ticks else 0.0
+
+    def latency_percentile_us(self, percentile: int) -> float:
+        if not self.decision_latencies_ns:
+            return 0.0
+        if len(self.decision_latencies_ns) == 1:
+            return self.decision_latencies_ns[0] / _NANOSECONDS_IN_MICROSECOND
+        cut_points: typing.Final = statistics.quantiles(self.decision_latencies_ns, n=_PERCENTILES)
+        return cut_points[percentile - 1] / _NANOSECONDS_IN_MICROSECOND
+
+
+def generate_scenario(couriers_count: int, orders_count: int, ticks: int, seed: int) -> Scenario:
+    rng: typing.Final = random.Random(seed)  # noqa: S311
+    couriers: typing.Final = [
+        CourierSeed(
+            speed=rng.randint(1, 3),
+            x=rng.randint(1, 10),
+            y=rng.randint(1, 10),
+            extra_volume=rng.choice([None, 20]),
+        )
+        for _ in range(couriers_count)
+    ]
+    orders: typing.Final = sorted(
+        (
+            OrderArrival(
+                tick=rng.randrange(ticks),
+                x=rng.randint(1, 10),
+                y=rng.randint(1, 10),
+                volume=rng.randint(1, _MAX_SYNTHETIC_ORDER_VOLUME),
+            )
+            for _ in range(orders_count)
+        ),
+        key=lambda arrival: arrival.tick,
+    )
+    return Scenario(ticks=ticks, couriers=couriers, orders=orders)
+
+
+def load_scenario(path: pathlib.Path) -> Scenario:
+    raw: typing.Final = json.loads(path.read_text())
+    return Scenario(
+        ticks=raw["ticks"],
+        couriers=[CourierSeed(**courier) for courier in raw["couriers"]],
+        orders=sorted((OrderArrival(**order) for order in raw["orders"]), key=lambda arrival: arrival.tick),
+    )
+
+
+def _create_couriers(seeds: list[CourierSeed]) -> list[Courier]:
+    couriers: typing.Final[list[Courier]] = []
+    for number, seed in enumerate(seeds):
+        courier = Courier.must_create(f"Courier {number}", seed.speed, Location.must_create(seed.x, seed.y))
+        if seed.extra_volume is not None:
+            courier.add_storage_place(_EXTRA_STORAGE_NAME, seed.extra_volume).get_or_else_throw()
+        couriers.append(courier)
+    return couriers
+
+
+def run_strategy(strategy_name: str, scenario: Scenario) -> StrategyReport:
+    """Прогоняет сценарий по тикам: поступление заказов, диспетчеризация, один шаг каждого курьера."""
+    strategy: typing.Final = DispatchStrategyRegistry.create(strategy_name, OrderDispatchDomainService())
+    couriers: typing.Final = _create_couriers(scenario.couriers)
+    couriers_by_id: typing.Final = {courier.id: courier for courier in couriers}
+    report: typing.Final = StrategyReport(strategy=strategy_name, orders=len(scenario.orders))
+
+    arrivals: typing.Final = list(reversed(scenario.orders))
+    pending: typing.Final[list[Order]] = []
+    # Активные заказы курьера в порядке назначения и тик назначения каждого заказа
+    active: typing.Final[dict[uuid.UUID, list[tuple[Order, int]]]] = {}
+
+    for tick in range(scenario.ticks):
+        while arrivals and arrivals[-1].tick <= tick:
+            arrival = arrivals.pop()
+            pending.append(
+                Order.must_create(
+                    uuid.uuid4(), Location.must_create(arrival.x, arrival.y), Volume.must_create(arrival.volume)
+                )
+            )
+
+        candidates = [
+            courier
+            for courier in couriers
+            if (
+                any(not place.is_occupied() for place in courier.storage_places)
+                if strategy.uses_partially_loaded_couriers
+                else not any(place.is_occupied() for place in courier.storage_places)
+            )
+        ]
+        if pending and candidates:
+            started_at = time.perf_counter_ns()
+            dispatch_result = strategy.dispatch(list(pending), candidates)
+            report.decision_latencies_ns.append(time.perf_counter_ns() - started_at)
+
+            if dispatch_result.is_success:
+                for assignment in dispatch_result.get_value():
+                    courier_id = typing.cast("uuid.UUID", assignment.courier.id)
+                    assignment.courier.take_order(
+                        typing.cast("uuid.UUID", assignment.order.id), assignment.order.volume
+                    )
+                    assignment.order.assign(courier_id)
+                    pending.remove(assignment.order)
+                    active.setdefault(courier_id, []).append((assignment.order, tick))
+
+        report.courier_ticks += len(couriers)
+        report.busy_courier_ticks += len(active)
+        for courier_id in list(active):
+            courier = couriers_by_id[courier_id]
+            order, assigned_tick = active[courier_id][0]
+            courier.move(order.location)
+            if courier.location != order.location:
+                continue
+
+            order.complete()
+            courier.complete_order(typing.cast("uuid.UUID", order.id))
+            report.delivered += 1
+            report.delivery_steps += tick - assigned_tick + 1
+            active[courier_id].pop(0)
+            if not active[courier_id]:
+                del active[courier_id]
+
+    return report
+
+
+def format_reports(reports: list[StrategyReport]) -> str:
+    header: typing.Final = (
+        f"{'strategy':<16}{'decisions':>10}{'p50, us':>10}{'p95, us':>10}"
+        f"{'delivered':>11}{'steps':>8}{'steps/order':>13}{'utilisation':>13}"
+    )
+    lines: typing.Final = [header, "-" * len(header)]
+    for report in reports:
+        steps_per_order = report.delivery_steps / report.delivered if report.delivered else 0.0
+        lines.append(
+            f"{report.strategy:<16}{len(report.decision_latencies_ns):>10}"
+            f"{report.latency_percentile_us(50):>10.1f}{report.latency_percentile_us(95):>10.1f}"
+            f"{f'{report.delivered}/{report.orders}':>11}{report.delivery_steps:>8}"
+            f"{steps_per_order:>13.2f}{report.utilisation:>13.1%}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser: typing.Final = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("--scenario", type=pathlib.Path, help="записанный сценарий в JSON")
+    parser.add_argument("--couriers", type=int, default=50)
+    parser.add_argument("--orders", type=int, default=500)
+    parser.add_argument("--ticks", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--strategy",
+        action="append",
+        choices=DispatchStrategyRegistry.get_all_names(),
+        help="можно указать несколько раз, по умолчанию все зарегистрированные",
+    )
+    args: typing.Final = parser.parse_args(argv)
+
+    scenario: typing.Final = (
+        load_scenario(args.scenario)
+        if args.scenario is not None
+        else generate_scenario(args.couriers, args.orders, args.ticks, args.seed)
+    )
+    strategies: typing.Final = args.strategy or DispatchStrategyRegistry.get_all_names()
+    reports: typing.Final = [run_strategy(strategy, scenario) for strategy in strategies]
+    sys.stdout.write(format_reports(reports) + "\n")
+
+
+if __name__ == "__main__":
+    main()
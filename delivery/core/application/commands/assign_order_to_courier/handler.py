@@ -1,11 +1,14 @@
 from abc import ABC, abstractmethod
 
 from delivery.libs.errs.error import Error
-from delivery.libs.errs.result import UnitResult
+from delivery.libs.errs.result import Result
 from .command import AssignOrderToCourierCommand
 
 
 class AssignOrderToCourierCommandHandler(ABC):
     @abstractmethod
-    async def handle(self, command: AssignOrderToCourierCommand) -> UnitResult[Error]:
-        pass
+    async def handle(self, command: AssignOrderToCourierCommand) -> Result[bool, Error]:
+        """Назначает пачку заказов.
+
+        Возвращает True, если пачка была заполнена и хотя бы один заказ назначен: в очереди могут остаться заказы.
+        """
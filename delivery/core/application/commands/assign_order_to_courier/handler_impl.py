@@ -1,56 +1,219 @@
+import collections
+import datetime as dt
 import typing
+from uuid import UUID
 
-from delivery.core.domain.service.order_dispatch_service import OrderDispatchDomainService
+from delivery.core.domain.service.courier_route import schedule_after_route
+from delivery.core.domain.service.delivery_deadline_queue import DeliveryDeadlineQueue
+from delivery.core.domain.service.dispatch_strategy import BatchMatchingDispatchStrategy, DispatchStrategy
+from delivery.core.domain.service.order_dispatch_service import OrderAssignment, OrderDispatchDomainService
 from delivery.core.ports.unit_of_work import DeliveryUnitOfWork
 from delivery.libs.errs.error import Error
-from delivery.libs.errs.result import UnitResult
+from delivery.libs.errs.result import Result, UnitResult
 from .command import AssignOrderToCourierCommand
 from .handler import AssignOrderToCourierCommandHandler
 
 
 if typing.TYPE_CHECKING:
-    from uuid import UUID
+    from delivery.core.domain.model.courier.courier import Courier
+    from delivery.core.domain.model.order.order import Order
 
 
 class AssignOrderToCourierCommandHandlerImpl(AssignOrderToCourierCommandHandler):
     def __init__(
         self,
         order_dispatch_service: OrderDispatchDomainService,
+        batch_size: int = 1,
+        dispatch_strategy: DispatchStrategy | None = None,
+        lookahead: bool = False,
+        schedule_arrivals: bool = False,
     ) -> None:
         self._order_dispatch_service = order_dispatch_service
+        self._batch_size = batch_size
+        self._dispatch_strategy = dispatch_strategy or BatchMatchingDispatchStrategy(order_dispatch_service)
+        self._lookahead = lookahead
+        self._schedule_arrivals = schedule_arrivals
 
-    async def handle(self, command: AssignOrderToCourierCommand) -> UnitResult[Error]:  # noqa: ARG002
+    async def handle(self, command: AssignOrderToCourierCommand) -> Result[bool, Error]:  # noqa: ARG002
         async with DeliveryUnitOfWork.start() as uow:
-            order: typing.Final = await uow.order.get_first_by_status_created()
-            if order is None:
-                return UnitResult.success()
-
-            free_couriers: typing.Final = await uow.courier.get_all_free()
-            if not free_couriers:
-                return UnitResult.failure(
-                    Error.of(
-                        "dispatch.no.free.couriers",
-                        "No free couriers available for order assignment",
-                    )
+            return await self.assign(uow)
+
+    async def assign(self, uow: DeliveryUnitOfWork) -> Result[bool, Error]:
+        """Назначает заказы в рамках чужой единицы работы, коммит остаётся за вызывающим."""
+        if self._lookahead:
+            return await self._assign_with_lookahead(uow)
+        return await self._assign_batch(uow)
+
+    async def _assign_batch(self, uow: DeliveryUnitOfWork) -> Result[bool, Error]:
+        orders: typing.Final = await uow.order.claim_all_created(self._batch_size)
+        if not orders:
+            return Result.success(False)
+
+        if self._dispatch_strategy.uses_partially_loaded_couriers:
+            smallest_volume = min(order.volume.value for order in orders)
+            free_couriers = await uow.courier.get_all_with_free_capacity(smallest_volume)
+        else:
+            free_couriers = await uow.courier.get_all_free()
+
+        if not free_couriers:
+            return Result.failure(
+                Error.of(
+                    "dispatch.no.free.couriers",
+                    "No free couriers available for order assignment",
                 )
+            )
+
+        dispatch_result: typing.Final = self._dispatch_strategy.dispatch(orders, free_couriers)
+        if dispatch_result.is_failure:
+            return Result.failure(dispatch_result.get_error())
+
+        apply_result: typing.Final = await self._claim_and_apply(uow, dispatch_result.get_value())
+        if apply_result.is_failure:
+            return Result.failure(apply_result.get_error())
+
+        await self._publish(uow, apply_result.get_value())
+
+        return Result.success(self._may_have_backlog(len(orders), apply_result.get_value()))
 
-            dispatch_result: typing.Final = self._order_dispatch_service.dispatch_order(order, free_couriers)
+    async def _assign_with_lookahead(self, uow: DeliveryUnitOfWork) -> Result[bool, Error]:
+        orders: typing.Final = await uow.order.claim_all_created(self._batch_size)
+        if not orders:
+            return Result.success(False)
+
+        free_couriers: typing.Final = {courier.id: courier for courier in await uow.courier.get_all_free()}
+        busy_courier_ids, busy_deliveries = await self._load_busy_deliveries(uow)
+
+        # Курьер, за которым уже зарезервирован заказ, не достаётся другим заказам
+        reserved_courier_ids: typing.Final = {
+            order.reserved_courier_id for order in orders if order.reserved_courier_id is not None
+        }
+        assignments: typing.Final[list[OrderAssignment]] = []
+
+        pending_orders: typing.Final = DeliveryDeadlineQueue(orders)
+        while pending_orders:
+            order = pending_orders.pop()
+            reserved_courier_id = order.reserved_courier_id
+            if reserved_courier_id is not None:
+                if reserved_courier_id in busy_courier_ids:
+                    continue
+
+                reserved_courier = free_couriers.pop(reserved_courier_id, None)
+                if reserved_courier is not None:
+                    assignments.append(OrderAssignment(order=order, courier=reserved_courier))
+                    continue
+
+                # Курьер не занят и не свободен (например, удалён): выбираем заново
+                order.release_reservation()
+
+            dispatch_result = self._order_dispatch_service.dispatch_order_with_lookahead(
+                order,
+                [courier for courier_id, courier in free_couriers.items() if courier_id not in reserved_courier_ids],
+                [delivery for delivery in busy_deliveries if delivery.courier.id not in reserved_courier_ids],
+            )
             if dispatch_result.is_failure:
-                return UnitResult.failure(dispatch_result.get_error())
+                continue
+
+            decision = dispatch_result.get_value()
+            if not decision.is_reservation:
+                free_couriers.pop(decision.courier.id)
+                assignments.append(decision)
+                continue
+
+            reserve_result = order.reserve(typing.cast("UUID", decision.courier.id))
+            if reserve_result.is_failure:
+                uow.discard()
+                return Result.failure(reserve_result.get_error())
 
-            best_courier: typing.Final = dispatch_result.get_value()
+            reserved_courier_ids.add(typing.cast("UUID", decision.courier.id))
 
-            take_result: typing.Final = best_courier.take_order(typing.cast("UUID", order.id), order.volume)
+        apply_result: typing.Final = await self._claim_and_apply(uow, assignments)
+        if apply_result.is_failure:
+            return Result.failure(apply_result.get_error())
+
+        await self._publish(uow, apply_result.get_value())
+
+        return Result.success(self._may_have_backlog(len(orders), apply_result.get_value()))
+
+    def _may_have_backlog(self, claimed_count: int, applied: list[OrderAssignment]) -> bool:
+        # Неполная пачка значит, что очередь разобрана; без назначений повторный запуск взял бы те же заказы
+        return claimed_count >= self._batch_size and bool(applied)
+
+    @staticmethod
+    async def _load_busy_deliveries(
+        uow: DeliveryUnitOfWork,
+    ) -> tuple[set[UUID], list[OrderAssignment]]:
+        """Возвращает всех занятых курьеров и доставки тех, у кого остался единственный заказ."""
+        orders_by_courier: typing.Final[dict[UUID, list[Order]]] = collections.defaultdict(list)
+        for order in await uow.order.get_all_assigned():
+            if order.courier_id is not None:
+                orders_by_courier[order.courier_id].append(order)
+
+        single_order_courier_ids: typing.Final = [
+            courier_id for courier_id, courier_orders in orders_by_courier.items() if len(courier_orders) == 1
+        ]
+        deliveries: typing.Final = [
+            OrderAssignment(order=orders_by_courier[typing.cast("UUID", courier.id)][0], courier=courier)
+            for courier in await uow.courier.get_all_by_ids(single_order_courier_ids)
+        ]
+
+        return set(orders_by_courier), deliveries
+
+    async def _claim_and_apply(
+        self,
+        uow: DeliveryUnitOfWork,
+        assignments: list[OrderAssignment],
+    ) -> Result[list[OrderAssignment], Error]:
+        """Блокирует выбранных курьеров и применяет к ним назначения.
+
+        Курьеры выбирались по снимку без блокировок, поэтому каждый перечитывается под FOR UPDATE SKIP LOCKED.
+        Если курьера уже держит другой диспетчер или его место успели занять, назначение пропускается,
+        а заказ остаётся в статусе Created до следующего запуска.
+        """
+        claimed_couriers: typing.Final[dict[UUID, Courier | None]] = {}
+        applied: typing.Final[list[OrderAssignment]] = []
+
+        # Сначала применяем все назначения к агрегатам и только потом сохраняем,
+        # чтобы ошибка посередине пачки не оставила частично записанное состояние
+        for assignment in assignments:
+            courier_id = typing.cast("UUID", assignment.courier.id)
+            if courier_id not in claimed_couriers:
+                claimed_couriers[courier_id] = await uow.courier.claim_by_id(courier_id)
+
+            courier = claimed_couriers[courier_id]
+            order = assignment.order
+            if courier is None or not courier.can_take_order(order.volume.value):
+                continue
+
+            take_result = courier.take_order(typing.cast("UUID", order.id), order.volume)
             if take_result.is_failure:
-                return UnitResult.failure(take_result.get_error())
+                uow.discard()
+                return Result.failure(take_result.get_error())
 
-            assign_result: typing.Final = order.assign(typing.cast("UUID", best_courier.id))
+            assign_result = order.assign(courier_id)
             if assign_result.is_failure:
-                return UnitResult.failure(assign_result.get_error())
+                uow.discard()
+                return Result.failure(assign_result.get_error())
+
+            applied.append(OrderAssignment(order=order, courier=courier))
+
+        if self._schedule_arrivals:
+            schedule_result: typing.Final = await self._schedule_arrival(uow, applied)
+            if schedule_result.is_failure:
+                uow.discard()
+                return Result.failure(schedule_result.get_error())
+
+        return Result.success(applied)
 
-            await uow.order.update(order)
-            await uow.courier.update(best_courier)
+    @staticmethod
+    async def _schedule_arrival(uow: DeliveryUnitOfWork, assignments: list[OrderAssignment]) -> UnitResult[Error]:
+        courier_ids: typing.Final = {typing.cast("UUID", assignment.courier.id) for assignment in assignments}
+        return schedule_after_route(
+            await uow.order.get_all_assigned_by_courier_ids(courier_ids), assignments, dt.datetime.now(dt.UTC)
+        )
 
-            await uow.domain_event_publisher.publish([order])
+    @staticmethod
+    async def _publish(uow: DeliveryUnitOfWork, assignments: list[OrderAssignment]) -> None:
+        if not assignments:
+            return
 
-        return UnitResult.success()
+        await uow.domain_event_publisher.publish([assignment.order for assignment in assignments])
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from delivery.core.domain.model.kernel import Address, Volume
+from delivery.core.domain.model.kernel import Address, DeliveryPeriod, Volume
 
 
 class CreateOrderCommand:
@@ -9,10 +9,12 @@ class CreateOrderCommand:
         order_id: UUID,
         address: Address,
         volume: Volume,
+        delivery_period: DeliveryPeriod | None = None,
     ) -> None:
         self._order_id = order_id
         self._address = address
         self._volume = volume
+        self._delivery_period = delivery_period
 
     @property
     def order_id(self) -> UUID:
@@ -25,3 +27,7 @@ class CreateOrderCommand:
     @property
     def volume(self) -> Volume:
         return self._volume
+
+    @property
+    def delivery_period(self) -> DeliveryPeriod | None:
+        return self._delivery_period
@@ -1,6 +1,9 @@
+import datetime as dt
 import typing
 
 from delivery.core.domain.model.order.order import Order
+from delivery.core.domain.service.demand_heatmap import DemandHeatmap
+from delivery.core.ports.dispatch_trigger import DispatchTrigger
 from delivery.core.ports.geo_location_client import GeoLocationClient
 from delivery.core.ports.unit_of_work import DeliveryUnitOfWork
 from delivery.libs.errs.error import Error
@@ -13,15 +16,24 @@ class CreateOrderCommandHandlerImpl(CreateOrderCommandHandler):
     def __init__(
         self,
         geo_location_client: GeoLocationClient,
+        dispatch_trigger: DispatchTrigger | None = None,
+        demand_heatmap: DemandHeatmap | None = None,
     ) -> None:
         self._geo_location_client = geo_location_client
+        self._dispatch_trigger = dispatch_trigger
+        self._demand_heatmap = demand_heatmap
 
     async def handle(self, command: CreateOrderCommand) -> UnitResult[Error]:
         location_result: typing.Final = await self._geo_location_client.get_location(command.address.street)
         if location_result.is_failure:
             return UnitResult.failure(location_result.get_error())
 
-        order_result: typing.Final = Order.create(command.order_id, location_result.get_value(), command.volume)
+        order_result: typing.Final = Order.create(
+            command.order_id,
+            location_result.get_value(),
+            command.volume,
+            command.delivery_period,
+        )
         if order_result.is_failure:
             return UnitResult.failure(order_result.get_error())
 
@@ -31,4 +43,11 @@ class CreateOrderCommandHandlerImpl(CreateOrderCommandHandler):
             await uow.order.add(order)
             await uow.domain_event_publisher.publish([order])
 
+        # Сигналим только после коммита, иначе диспетчер может не увидеть новый заказ
+        if self._dispatch_trigger is not None:
+            self._dispatch_trigger.notify()
+
+        if self._demand_heatmap is not None:
+            self._demand_heatmap.record(order.location, dt.datetime.now(dt.UTC))
+
         return UnitResult.success()
@@ -1,10 +1,16 @@
 from .command import MoveCouriersCommand
+from .eta_handler_impl import EtaMoveCouriersCommandHandlerImpl
 from .handler import MoveCouriersCommandHandler
-from .handler_impl import MoveCouriersCommandHandlerImpl
+from .handler_impl import FleetMove, MoveCouriersCommandHandlerImpl, TickCompletion
+from .set_based_handler_impl import SetBasedMoveCouriersCommandHandlerImpl
 
 
 __all__ = [
+    "EtaMoveCouriersCommandHandlerImpl",
+    "FleetMove",
     "MoveCouriersCommand",
     "MoveCouriersCommandHandler",
     "MoveCouriersCommandHandlerImpl",
+    "SetBasedMoveCouriersCommandHandlerImpl",
+    "TickCompletion",
 ]
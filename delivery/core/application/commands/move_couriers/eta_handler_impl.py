@@ -0,0 +1,109 @@
+import datetime as dt
+import typing
+
+from delivery.core.domain.model.courier.courier import Courier
+from delivery.core.domain.model.order.order import Order
+from delivery.core.domain.service.courier_route import schedule_after_route
+from delivery.core.domain.service.order_dispatch_service import OrderAssignment
+from delivery.core.ports.delivery_metrics import DeliveryMetrics
+from delivery.core.ports.dispatch_trigger import DispatchTrigger
+from delivery.core.ports.unit_of_work import DeliveryUnitOfWork
+from delivery.libs.errs.error import Error
+from delivery.libs.errs.result import UnitResult
+from .command import MoveCouriersCommand
+from .handler import MoveCouriersCommandHandler
+
+
+if typing.TYPE_CHECKING:
+    from uuid import UUID
+
+
+class EtaMoveCouriersCommandHandlerImpl(MoveCouriersCommandHandler):
+    """Завершает только заказы, расчётное время прибытия которых уже наступило.
+
+    Время прибытия назначает диспетчер, а позиция курьера между остановками выводится при чтении,
+    поэтому работа за тик пропорциональна числу прибытий, а не размеру парка. Заказы, назначенные
+    до включения режима, времени прибытия не имеют: тик сначала рассчитывает его для них.
+    """
+
+    def __init__(
+        self,
+        dispatch_trigger: DispatchTrigger | None = None,
+        delivery_metrics: DeliveryMetrics | None = None,
+    ) -> None:
+        self._dispatch_trigger = dispatch_trigger
+        self._delivery_metrics = delivery_metrics
+
+    async def handle(self, command: MoveCouriersCommand) -> UnitResult[Error]:  # noqa: ARG002
+        async with DeliveryUnitOfWork.start() as uow:
+            now: typing.Final = dt.datetime.now(dt.UTC)
+            schedule_result: typing.Final = await self._schedule_unscheduled(uow, now)
+            if schedule_result.is_failure:
+                uow.discard()
+                return schedule_result
+
+            arrived_orders: typing.Final = await uow.order.get_all_arrived(now)
+            if not arrived_orders:
+                return UnitResult.success()
+
+            couriers: typing.Final = {
+                courier.id: courier
+                for courier in await uow.courier.get_all_by_ids(
+                    {order.courier_id for order in arrived_orders if order.courier_id is not None}
+                )
+            }
+
+            completed_orders: typing.Final[list[Order]] = []
+            missed_windows = 0
+            # Прибытия идут по возрастанию времени, поэтому курьер остаётся на последней пройденной остановке
+            for order in arrived_orders:
+                courier = couriers.get(order.courier_id)
+                if courier is None:
+                    continue
+
+                arrival_result = self._complete_arrival(courier, order)
+                if arrival_result.is_failure:
+                    uow.discard()
+                    return arrival_result
+
+                completed_orders.append(order)
+                arrived_at = typing.cast("dt.datetime", order.estimated_arrival_at)
+                if order.delivery_period is not None and order.delivery_period.is_missed_at(arrived_at):
+                    missed_windows += 1
+
+            await uow.domain_event_publisher.publish(completed_orders)
+
+        if missed_windows and self._delivery_metrics is not None:
+            self._delivery_metrics.record_missed_delivery_windows(missed_windows)
+
+        if completed_orders and self._dispatch_trigger is not None:
+            self._dispatch_trigger.notify()
+
+        return UnitResult.success()
+
+    @staticmethod
+    def _complete_arrival(courier: Courier, order: Order) -> UnitResult[Error]:
+        relocate_result: typing.Final = courier.relocate(order.location)
+        if relocate_result.is_failure:
+            return relocate_result
+
+        complete_result: typing.Final = order.complete()
+        if complete_result.is_failure:
+            return complete_result
+
+        return courier.complete_order(typing.cast("UUID", order.id))
+
+    @staticmethod
+    async def _schedule_unscheduled(uow: DeliveryUnitOfWork, now: dt.datetime) -> UnitResult[Error]:
+        unscheduled_orders: typing.Final = await uow.order.get_all_unscheduled()
+        if not unscheduled_orders:
+            return UnitResult.success()
+
+        courier_ids: typing.Final = {order.courier_id for order in unscheduled_orders if order.courier_id is not None}
+        couriers: typing.Final = {courier.id: courier for courier in await uow.courier.get_all_by_ids(courier_ids)}
+        assignments: typing.Final = [
+            OrderAssignment(order=order, courier=couriers[order.courier_id])
+            for order in unscheduled_orders
+            if order.courier_id in couriers
+        ]
+        return schedule_after_route(await uow.order.get_all_assigned_by_courier_ids(courier_ids), assignments, now)
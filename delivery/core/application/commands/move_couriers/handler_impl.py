@@ -1,57 +1,158 @@
+import collections
+import dataclasses
+import datetime as dt
 import typing
+from uuid import UUID
 
 from delivery.core.domain.model.courier.courier import Courier
 from delivery.core.domain.model.order.order import Order
+from delivery.core.domain.service.courier_movement import move_couriers_towards
+from delivery.core.domain.service.courier_route_planner import CourierRoutePlanner
+from delivery.core.ports.courier_position_buffer import CourierPositionBuffer
+from delivery.core.ports.delivery_metrics import DeliveryMetrics
+from delivery.core.ports.dispatch_trigger import DispatchTrigger
 from delivery.core.ports.unit_of_work import DeliveryUnitOfWork
 from delivery.libs.errs.error import Error
-from delivery.libs.errs.result import UnitResult
+from delivery.libs.errs.result import Result, UnitResult
 from .command import MoveCouriersCommand
 from .handler import MoveCouriersCommandHandler
 
 
-if typing.TYPE_CHECKING:
-    from uuid import UUID
+@dataclasses.dataclass(slots=True)
+class FleetMove:
+    """Курьеры после шага тика вместе с заказами в порядке маршрута и признаком прибытия к первому из них."""
+
+    couriers: list[Courier] = dataclasses.field(default_factory=list)
+    couriers_orders: list[list[Order]] = dataclasses.field(default_factory=list)
+    arrived: list[bool] = dataclasses.field(default_factory=list)
+
+
+@dataclasses.dataclass(slots=True)
+class TickCompletion:
+    freed_courier_ids: set[UUID] = dataclasses.field(default_factory=set)
+    missed_windows: int = 0
 
 
 class MoveCouriersCommandHandlerImpl(MoveCouriersCommandHandler):
-    async def handle(self, command: MoveCouriersCommand) -> UnitResult[Error]:  # noqa: C901, ARG002
+    def __init__(
+        self,
+        dispatch_trigger: DispatchTrigger | None = None,
+        delivery_metrics: DeliveryMetrics | None = None,
+        position_buffer: CourierPositionBuffer | None = None,
+        route_planner: CourierRoutePlanner | None = None,
+    ) -> None:
+        self._dispatch_trigger = dispatch_trigger
+        self._delivery_metrics = delivery_metrics
+        self._position_buffer = position_buffer
+        self._route_planner = route_planner if route_planner is not None else CourierRoutePlanner()
+
+    async def handle(self, command: MoveCouriersCommand) -> UnitResult[Error]:  # noqa: ARG002
         async with DeliveryUnitOfWork.start() as uow:
-            assigned_orders: typing.Final = await uow.order.get_all_assigned()
-            if not assigned_orders:
-                return UnitResult.success()
+            fleet_move_result = await self.move_fleet(uow)
+            if fleet_move_result.is_failure:
+                uow.discard()
+                return UnitResult.failure(fleet_move_result.get_error())
+
+            completion_result = await self.complete_arrivals(uow, fleet_move_result.get_value())
+            if completion_result.is_failure:
+                uow.discard()
+                return UnitResult.failure(completion_result.get_error())
+
+        await self.finish_tick(completion_result.get_value())
+        return UnitResult.success()
 
-            modified_aggregates: typing.Final[list[Order | Courier]] = []
-            for order in assigned_orders:
-                if order.courier_id is None:
-                    continue
+    async def move_fleet(self, uow: DeliveryUnitOfWork) -> Result[FleetMove, Error]:
+        """Делает шаг всех курьеров с назначенными заказами к первой остановке их маршрута."""
+        assigned_orders: typing.Final = await uow.order.get_all_assigned()
+        if not assigned_orders:
+            self._route_planner.retain(())
+            return Result.success(FleetMove())
 
-                courier = await uow.courier.get_by_id(order.courier_id)
-                if courier is None:
-                    continue
+        # Курьер с несколькими заказами загружается и двигается один раз за тик
+        orders_by_courier: typing.Final[dict[UUID, list[Order]]] = collections.defaultdict(list)
+        for order in assigned_orders:
+            if order.courier_id is not None:
+                orders_by_courier[order.courier_id].append(order)
+        couriers: typing.Final = await uow.courier.get_all_by_ids(list(orders_by_courier))
+        if self._position_buffer is not None:
+            # В режиме отложенной записи актуальные позиции хранятся в буфере, а в базе могут отставать
+            for courier in couriers:
+                buffered_location = self._position_buffer.get_location(typing.cast("UUID", courier.id))
+                if buffered_location is not None:
+                    courier.relocate(buffered_location)
 
-                move_result = courier.move(order.location)
-                if move_result.is_failure:
-                    return UnitResult.failure(move_result.get_error())
+        # Заказы курьера идут в порядке спланированного маршрута, чтобы он не метался между ними
+        self._route_planner.retain(orders_by_courier)
+        couriers_orders: typing.Final = [
+            self._route_planner.sequence(courier, orders_by_courier[typing.cast("UUID", courier.id)])
+            for courier in couriers
+        ]
+        step: typing.Final = move_couriers_towards(
+            couriers, [courier_orders[0].location for courier_orders in couriers_orders]
+        )
+        for position, courier in enumerate(couriers):
+            relocate_result = courier.relocate(step.location(position))
+            if relocate_result.is_failure:
+                return Result.failure(relocate_result.get_error())
 
-                if courier.location == order.location:
-                    complete_result = order.complete()
-                    if complete_result.is_failure:
-                        return UnitResult.failure(complete_result.get_error())
+        return Result.success(
+            FleetMove(couriers=couriers, couriers_orders=couriers_orders, arrived=step.arrived.tolist())
+        )
 
-                    clear_result = courier.complete_order(typing.cast("UUID", order.id))
-                    if clear_result.is_failure:
-                        return UnitResult.failure(clear_result.get_error())
+    async def complete_arrivals(  # noqa: C901
+        self,
+        uow: DeliveryUnitOfWork,
+        fleet_move: FleetMove,
+    ) -> Result[TickCompletion, Error]:
+        """Завершает заказы в точках, куда пришли курьеры; изменённые агрегаты запишет единица работы."""
+        modified_aggregates: typing.Final[list[Order | Courier]] = []
+        completed_at: typing.Final = dt.datetime.now(dt.UTC)
+        completion: typing.Final = TickCompletion()
+        for courier, courier_orders, arrived in zip(
+            fleet_move.couriers, fleet_move.couriers_orders, fleet_move.arrived, strict=True
+        ):
+            # Цель шага - первая остановка маршрута; остальные заказы курьера могли оказаться на пути
+            reached_orders = [order for order in courier_orders[1:] if order.location == courier.location]
+            if arrived:
+                reached_orders.insert(0, courier_orders[0])
 
-                    modified_aggregates.append(order)
+            for order in reached_orders:
+                complete_result = order.complete()
+                if complete_result.is_failure:
+                    return Result.failure(complete_result.get_error())
 
-                modified_aggregates.append(courier)
+                clear_result = courier.complete_order(typing.cast("UUID", order.id))
+                if clear_result.is_failure:
+                    return Result.failure(clear_result.get_error())
 
-            for aggregate in modified_aggregates:
-                if isinstance(aggregate, Order):
-                    await uow.order.update(aggregate)
-                elif isinstance(aggregate, Courier):
-                    await uow.courier.update(aggregate)
+                modified_aggregates.append(order)
+                completion.freed_courier_ids.add(typing.cast("UUID", courier.id))
+                if order.delivery_period is not None and order.delivery_period.is_missed_at(completed_at):
+                    completion.missed_windows += 1
 
+            modified_aggregates.append(courier)
+
+        if self._position_buffer is not None:
+            for courier in fleet_move.couriers:
+                courier_id = typing.cast("UUID", courier.id)
+                self._position_buffer.set_location(courier_id, courier.location)
+                # Курьер без завершённых заказов изменил только координаты, их запишет буфер, а не единица работы
+                if courier_id not in completion.freed_courier_ids:
+                    uow.courier.mark_persisted(courier)
+
+        if modified_aggregates:
             await uow.domain_event_publisher.publish(modified_aggregates)
 
-        return UnitResult.success()
+        return Result.success(completion)
+
+    async def finish_tick(self, completion: TickCompletion) -> None:
+        """Побочные эффекты тика, которые допустимы только после коммита."""
+        if self._position_buffer is not None:
+            await self._position_buffer.complete_tick(force_flush=bool(completion.freed_courier_ids))
+
+        if completion.missed_windows and self._delivery_metrics is not None:
+            self._delivery_metrics.record_missed_delivery_windows(completion.missed_windows)
+
+        # Освободившийся курьер может забрать зарезервированный за ним заказ уже в этом тике
+        if completion.freed_courier_ids and self._dispatch_trigger is not None:
+            self._dispatch_trigger.notify()
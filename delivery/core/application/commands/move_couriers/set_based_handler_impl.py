@@ -0,0 +1,157 @@
+import datetime as dt
+import typing
+from collections.abc import Callable
+from contextlib import AbstractAsyncContextManager
+
+import sqlalchemy
+import sqlalchemy.ext.asyncio as sa_async
+
+from delivery.core.domain.model.order.events import OrderCompletedDomainEvent
+from delivery.core.domain.model.order.order import Order
+from delivery.core.domain.model.order.order_status import OrderStatus
+from delivery.core.ports.delivery_metrics import DeliveryMetrics
+from delivery.core.ports.dispatch_trigger import DispatchTrigger
+from delivery.libs.errs.error import Error
+from delivery.libs.errs.result import UnitResult
+from .command import MoveCouriersCommand
+from .handler import MoveCouriersCommandHandler
+
+
+# Курьер делает шаг к первому заказу (по сроку окна доставки) с той же отсечкой, что и Courier.move:
+# сначала по x не дальше скорости, затем остаток хода по y
+_MOVE_COURIERS_SQL: typing.Final = sqlalchemy.text(
+    """
+    WITH targets AS (
+        SELECT DISTINCT ON (courier_id) courier_id, location_x, location_y
+        FROM orders
+        WHERE status = :assigned AND courier_id IS NOT NULL
+        ORDER BY courier_id, delivery_period_end ASC NULLS LAST, id
+    ),
+    steps AS (
+        SELECT
+            couriers.id,
+            GREATEST(-couriers.speed, LEAST(targets.location_x - positions.location_x, couriers.speed)) AS move_x,
+            targets.location_y - positions.location_y AS dif_y,
+            couriers.speed AS speed
+        FROM couriers
+        JOIN courier_positions AS positions ON positions.courier_id = couriers.id
+        JOIN targets ON targets.courier_id = couriers.id
+    )
+    UPDATE courier_positions
+    SET
+        location_x = courier_positions.location_x + steps.move_x,
+        location_y = courier_positions.location_y
+            + GREATEST(ABS(steps.move_x) - steps.speed, LEAST(steps.dif_y, steps.speed - ABS(steps.move_x)))
+    FROM steps
+    WHERE courier_positions.courier_id = steps.id
+    """
+)
+
+# Завершает заказы, до которых курьер дошёл, и освобождает их места хранения
+_COMPLETE_ARRIVED_ORDERS_SQL: typing.Final = sqlalchemy.text(
+    """
+    WITH completed AS (
+        UPDATE orders
+        SET status = :completed
+        FROM courier_positions
+        WHERE orders.status = :assigned
+            AND orders.courier_id = courier_positions.courier_id
+            AND orders.location_x = courier_positions.location_x
+            AND orders.location_y = courier_positions.location_y
+        RETURNING orders.id, orders.delivery_period_end
+    ),
+    cleared AS (
+        UPDATE storage_places
+        SET order_id = NULL
+        FROM completed
+        WHERE storage_places.order_id = completed.id
+    )
+    SELECT id, delivery_period_end IS NOT NULL AND delivery_period_end < :completed_at AS is_missed
+    FROM completed
+    """
+)
+
+# Поля payload совпадают с OrderCompletedDomainEvent.model_dump, как у OutboxDomainEventPublisher.
+# is_deleted задаётся явно: его default=False есть только у модели, а у колонки нет значения по умолчанию
+_INSERT_COMPLETED_EVENTS_SQL: typing.Final = sqlalchemy.text(
+    """
+    WITH events AS (
+        SELECT gen_random_uuid() AS event_id, order_id
+        FROM unnest(CAST(:order_ids AS uuid[])) AS order_id
+    )
+    INSERT INTO outbox (
+        id, event_type, aggregate_id, aggregate_type, payload, occurred_on_utc, processed_on_utc, is_deleted
+    )
+    SELECT
+        event_id,
+        CAST(:event_type AS varchar),
+        order_id,
+        CAST(:aggregate_type AS varchar),
+        json_build_object(
+            'event_id', event_id,
+            'occurred_on_utc', CAST(:occurred_on_utc_json AS text),
+            'order_id', order_id
+        )::text,
+        :occurred_on_utc,
+        NULL,
+        FALSE
+    FROM events
+    """
+)
+
+
+class SetBasedMoveCouriersCommandHandlerImpl(MoveCouriersCommandHandler):
+    """Выполняет тик движения несколькими SQL-запросами над всем парком, не загружая агрегаты в память.
+
+    Каждый тик открывает свою сессию, как единица работы: задачи планировщика идут параллельно,
+    и общая сессия позволила бы одной из них закоммитить или откатить работу другой.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], AbstractAsyncContextManager[sa_async.AsyncSession]],
+        dispatch_trigger: DispatchTrigger | None = None,
+        delivery_metrics: DeliveryMetrics | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._dispatch_trigger = dispatch_trigger
+        self._delivery_metrics = delivery_metrics
+
+    async def handle(self, command: MoveCouriersCommand) -> UnitResult[Error]:  # noqa: ARG002
+        completed_at: typing.Final = dt.datetime.now(dt.UTC)
+        async with self._session_factory() as session:
+            try:
+                await session.execute(_MOVE_COURIERS_SQL, {"assigned": OrderStatus.ASSIGNED.value})
+                completed_result: typing.Final = await session.execute(
+                    _COMPLETE_ARRIVED_ORDERS_SQL,
+                    {
+                        "assigned": OrderStatus.ASSIGNED.value,
+                        "completed": OrderStatus.COMPLETED.value,
+                        "completed_at": completed_at,
+                    },
+                )
+                completed_orders: typing.Final = completed_result.all()
+                if completed_orders:
+                    await session.execute(
+                        _INSERT_COMPLETED_EVENTS_SQL,
+                        {
+                            "order_ids": [row.id for row in completed_orders],
+                            "event_type": OrderCompletedDomainEvent.__name__,
+                            "aggregate_type": Order.__name__,
+                            "occurred_on_utc": completed_at,
+                            "occurred_on_utc_json": completed_at.isoformat().replace("+00:00", "Z"),
+                        },
+                    )
+            except Exception:
+                await session.rollback()
+                raise
+            await session.commit()
+
+        missed_windows: typing.Final = sum(1 for row in completed_orders if row.is_missed)
+        if missed_windows and self._delivery_metrics is not None:
+            self._delivery_metrics.record_missed_delivery_windows(missed_windows)
+
+        if completed_orders and self._dispatch_trigger is not None:
+            self._dispatch_trigger.notify()
+
+        return UnitResult.success()
@@ -0,0 +1,10 @@
+from .command import RebalanceCouriersCommand
+from .handler import RebalanceCouriersCommandHandler
+from .handler_impl import RebalanceCouriersCommandHandlerImpl
+
+
+__all__ = [
+    "RebalanceCouriersCommand",
+    "RebalanceCouriersCommandHandler",
+    "RebalanceCouriersCommandHandlerImpl",
+]
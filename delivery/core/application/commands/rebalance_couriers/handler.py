@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+
+from delivery.libs.errs.error import Error
+from delivery.libs.errs.result import UnitResult
+from .command import RebalanceCouriersCommand
+
+
+class RebalanceCouriersCommandHandler(ABC):
+    @abstractmethod
+    async def handle(self, command: RebalanceCouriersCommand) -> UnitResult[Error]:
+        pass
@@ -0,0 +1,83 @@
+import collections
+import typing
+
+from delivery.core.domain.model.courier.courier import Courier
+from delivery.core.domain.service.courier_rebalancing import plan_rebalancing
+from delivery.core.domain.service.demand_heatmap import DemandHeatmap
+from delivery.core.ports.courier_position_buffer import CourierPositionBuffer
+from delivery.core.ports.unit_of_work import DeliveryUnitOfWork
+from delivery.libs.errs.error import Error
+from delivery.libs.errs.result import UnitResult
+from .command import RebalanceCouriersCommand
+from .handler import RebalanceCouriersCommandHandler
+
+
+if typing.TYPE_CHECKING:
+    from uuid import UUID
+
+
+# Без тепловой карты спрос оценивается по открытым заказам: завершённые выпадают из выборки сами
+_DEMAND_SAMPLE_SIZE: typing.Final = 1000
+
+
+class RebalanceCouriersCommandHandlerImpl(RebalanceCouriersCommandHandler):
+    """Делает шаг свободных курьеров к клеткам с наибольшим спросом."""
+
+    def __init__(
+        self,
+        moves_per_tick: int,
+        position_buffer: CourierPositionBuffer | None = None,
+        demand_heatmap: DemandHeatmap | None = None,
+    ) -> None:
+        self._moves_per_tick = moves_per_tick
+        self._position_buffer = position_buffer
+        self._demand_heatmap = demand_heatmap
+
+    async def handle(self, command: RebalanceCouriersCommand) -> UnitResult[Error]:  # noqa: ARG002
+        async with DeliveryUnitOfWork.start() as uow:
+            idle_couriers: typing.Final = await uow.courier.get_all_free()
+            if not idle_couriers:
+                return UnitResult.success()
+
+            # Клеток, уже занятых свободными курьерами, может быть не больше, чем самих курьеров
+            hotspots_limit: typing.Final = self._moves_per_tick + len(idle_couriers)
+            if self._demand_heatmap is not None:
+                hotspots = self._demand_heatmap.hotspots(hotspots_limit)
+            else:
+                created_orders = await uow.order.get_all_by_status_created(_DEMAND_SAMPLE_SIZE)
+                assigned_orders = await uow.order.get_all_assigned()
+                demand = collections.Counter(order.location for order in [*created_orders, *assigned_orders])
+                hotspots = [location for location, _ in demand.most_common(hotspots_limit)]
+
+            for idle_courier in idle_couriers:
+                self._apply_buffered_location(uow, idle_courier)
+
+            for planned_courier, hotspot in plan_rebalancing(idle_couriers, hotspots, self._moves_per_tick):
+                # Свободные курьеры прочитаны без блокировки: курьера, которого держит или уже занял диспетчер,
+                # оставляем на месте, чтобы не двигать его и не затереть его место хранения
+                courier = await uow.courier.claim_by_id(typing.cast("UUID", planned_courier.id))
+                if courier is None or any(place.is_occupied() for place in courier.storage_places):
+                    continue
+
+                self._apply_buffered_location(uow, courier)
+                move_result = courier.move(hotspot)
+                if move_result.is_failure:
+                    uow.discard()
+                    return UnitResult.failure(move_result.get_error())
+
+                # Перемещений за запуск немного, поэтому их пишет единица работы, а буфер лишь узнаёт новую позицию
+                if self._position_buffer is not None:
+                    self._position_buffer.set_location(typing.cast("UUID", courier.id), courier.location)
+
+        return UnitResult.success()
+
+    def _apply_buffered_location(self, uow: DeliveryUnitOfWork, courier: Courier) -> None:
+        if self._position_buffer is None:
+            return
+
+        # Последняя позиция курьера могла ещё не попасть в базу
+        buffered_location: typing.Final = self._position_buffer.get_location(typing.cast("UUID", courier.id))
+        if buffered_location is not None:
+            courier.relocate(buffered_location)
+            # Эту позицию уже хранит буфер, писать её в базу незачем
+            uow.courier.mark_persisted(courier)
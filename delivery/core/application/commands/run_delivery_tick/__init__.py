@@ -0,0 +1,10 @@
+from .command import RunDeliveryTickCommand
+from .handler import RunDeliveryTickCommandHandler
+from .handler_impl import RunDeliveryTickCommandHandlerImpl
+
+
+__all__ = [
+    "RunDeliveryTickCommand",
+    "RunDeliveryTickCommandHandler",
+    "RunDeliveryTickCommandHandlerImpl",
+]
@@ -0,0 +1,92 @@
+import time
+import typing
+
+from delivery.core.application.commands.assign_order_to_courier import AssignOrderToCourierCommandHandlerImpl
+from delivery.core.application.commands.move_couriers import (
+    MoveCouriersCommand,
+    MoveCouriersCommandHandler,
+    MoveCouriersCommandHandlerImpl,
+)
+from delivery.core.ports.delivery_metrics import DeliveryMetrics
+from delivery.core.ports.unit_of_work import DeliveryUnitOfWork
+from delivery.libs.errs.error import Error
+from delivery.libs.errs.result import UnitResult
+from .command import RunDeliveryTickCommand
+from .handler import RunDeliveryTickCommandHandler
+
+
+class RunDeliveryTickCommandHandlerImpl(RunDeliveryTickCommandHandler):
+    """Двигает курьеров, завершает доставки и назначает заказы за один тик в одной транзакции.
+
+    Этапы работают в общей сессии: изменения курьеров, освободившихся на этом тике, сбрасываются в неё
+    до выборки свободных курьеров, поэтому назначение видит их сразу, а не на следующем тике.
+    Общую сессию поддерживает только доменное движение, и его передают отдельно как fleet_move_handler.
+    Без него движение идёт через move_couriers_handler в своей транзакции, а назначение следом, после её коммита.
+    """
+
+    def __init__(
+        self,
+        move_couriers_handler: MoveCouriersCommandHandler,
+        assign_orders_handler: AssignOrderToCourierCommandHandlerImpl,
+        delivery_metrics: DeliveryMetrics | None = None,
+        *,
+        fleet_move_handler: MoveCouriersCommandHandlerImpl | None = None,
+    ) -> None:
+        self._move_couriers_handler = move_couriers_handler
+        self._assign_orders_handler = assign_orders_handler
+        self._delivery_metrics = delivery_metrics
+        self._fleet_move_handler = fleet_move_handler
+
+    async def handle(self, command: RunDeliveryTickCommand) -> UnitResult[Error]:  # noqa: ARG002
+        if self._fleet_move_handler is None:
+            return await self._handle_in_separate_transactions()
+        return await self._handle_in_shared_unit_of_work(self._fleet_move_handler)
+
+    async def _handle_in_shared_unit_of_work(
+        self, fleet_move_handler: MoveCouriersCommandHandlerImpl
+    ) -> UnitResult[Error]:
+        started_at = time.perf_counter()
+        async with DeliveryUnitOfWork.start() as uow:
+            fleet_move_result = await fleet_move_handler.move_fleet(uow)
+            if fleet_move_result.is_failure:
+                uow.discard()
+                return UnitResult.failure(fleet_move_result.get_error())
+            started_at = self._record_stage("move", started_at)
+
+            completion_result = await fleet_move_handler.complete_arrivals(uow, fleet_move_result.get_value())
+            if completion_result.is_failure:
+                uow.discard()
+                return UnitResult.failure(completion_result.get_error())
+            started_at = self._record_stage("complete", started_at)
+
+            assign_result: typing.Final = await self._assign_orders_handler.assign(uow)
+            started_at = self._record_stage("assign", started_at)
+        self._record_stage("commit", started_at)
+
+        await fleet_move_handler.finish_tick(completion_result.get_value())
+        # Нехватка свободных курьеров не отменяет движение: оно уже закоммичено, ошибка лишь сообщается
+        if assign_result.is_failure:
+            return UnitResult.failure(assign_result.get_error())
+        return UnitResult.success()
+
+    async def _handle_in_separate_transactions(self) -> UnitResult[Error]:
+        started_at = time.perf_counter()
+        move_result: typing.Final = await self._move_couriers_handler.handle(MoveCouriersCommand())
+        if move_result.is_failure:
+            return move_result
+        started_at = self._record_stage("move", started_at)
+
+        async with DeliveryUnitOfWork.start() as uow:
+            assign_result: typing.Final = await self._assign_orders_handler.assign(uow)
+            started_at = self._record_stage("assign", started_at)
+        self._record_stage("commit", started_at)
+
+        if assign_result.is_failure:
+            return UnitResult.failure(assign_result.get_error())
+        return UnitResult.success()
+
+    def _record_stage(self, stage: str, started_at: float) -> float:
+        finished_at: typing.Final = time.perf_counter()
+        if self._delivery_metrics is not None:
+            self._delivery_metrics.record_tick_stage_duration(stage, finished_at - started_at)
+        return finished_at
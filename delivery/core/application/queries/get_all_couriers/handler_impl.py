@@ -1,9 +1,14 @@
+import collections
+import datetime as dt
 import typing
 
 import sqlalchemy
 import sqlalchemy.ext.asyncio as sa_async
 
-from delivery.database.models import CourierModel
+from delivery.core.domain.model.kernel import Location
+from delivery.core.domain.model.order.order_status import OrderStatus
+from delivery.core.domain.service.courier_route import locate_on_route
+from delivery.database.models import CourierModel, CourierPositionModel, OrderModel
 from delivery.libs.errs.error import Error
 from delivery.libs.errs.result import Result
 from .dto import CourierDto
@@ -11,24 +16,53 @@ from .handler import GetAllCouriersQueryHandler
 from .query import GetAllCouriersQuery
 
 
+if typing.TYPE_CHECKING:
+    from uuid import UUID
+
+
 class GetAllCouriersQueryHandlerImpl(GetAllCouriersQueryHandler):
     def __init__(self, session: sa_async.AsyncSession) -> None:
         self._session = session
 
     async def handle(self, query: GetAllCouriersQuery) -> Result[list[CourierDto], Error]:  # noqa: ARG002
-        stmt: typing.Final = sqlalchemy.select(CourierModel)
-
-        result: typing.Final = await self._session.execute(stmt)
-        courier_models: typing.Final = result.scalars().unique().all()
-
-        dto_list: typing.Final[list[CourierDto]] = [
-            CourierDto(
-                id=courier_model.id,
-                name=courier_model.name,
-                location_x=courier_model.location_x,
-                location_y=courier_model.location_y,
-            )
-            for courier_model in courier_models
-        ]
+        # Только нужные колонки и выполнение на соединении: ни сущностей с местами хранения, ни identity map
+        connection: typing.Final = await self._session.connection()
+        couriers_stmt: typing.Final = sqlalchemy.select(
+            CourierModel.id,
+            CourierModel.name,
+            CourierModel.speed,
+            CourierPositionModel.location_x,
+            CourierPositionModel.location_y,
+        ).join(CourierPositionModel, CourierPositionModel.courier_id == CourierModel.id)
+        couriers: typing.Final = (await connection.execute(couriers_stmt)).all()
+
+        # В режиме eta позиция в базе - точка отправления, текущая выводится из расчётного прибытия к заказам
+        stops_stmt: typing.Final = sqlalchemy.select(
+            OrderModel.courier_id,
+            OrderModel.location_x,
+            OrderModel.location_y,
+            OrderModel.estimated_arrival_at,
+        ).where(
+            OrderModel.status == OrderStatus.ASSIGNED.value,
+            OrderModel.estimated_arrival_at.is_not(None),
+        )
+        # Условие отсекает NULL, которые типы колонок ещё допускают: у назначенного заказа с прибытием есть курьер
+        stop_rows: typing.Final = typing.cast(
+            "sqlalchemy.Result[UUID, int, int, dt.datetime]", await connection.execute(stops_stmt)
+        )
+        stops_by_courier: typing.Final[dict[UUID, list[tuple[Location, dt.datetime]]]] = collections.defaultdict(list)
+        for courier_id, stop_x, stop_y, arrives_at in stop_rows:
+            stops_by_courier[courier_id].append((Location.must_create(stop_x, stop_y), arrives_at))
+
+        now: typing.Final = dt.datetime.now(dt.UTC)
+        dto_list: typing.Final[list[CourierDto]] = []
+        for courier_id, name, speed, stored_x, stored_y in couriers:
+            stops = stops_by_courier.get(courier_id)
+            if not stops:
+                dto_list.append(CourierDto(id=courier_id, name=name, location_x=stored_x, location_y=stored_y))
+                continue
+
+            location = locate_on_route(Location.must_create(stored_x, stored_y), speed, stops, now)
+            dto_list.append(CourierDto(id=courier_id, name=name, location_x=location.x, location_y=location.y))
 
         return Result.success(dto_list)
@@ -3,6 +3,7 @@ import typing
 import sqlalchemy
 import sqlalchemy.ext.asyncio as sa_async
 
+from delivery.core.domain.model.order.order_status import OrderStatus
 from delivery.database.models import OrderModel
 from delivery.libs.errs.error import Error
 from delivery.libs.errs.result import Result
@@ -16,18 +17,15 @@ class GetAllIncompleteOrdersQueryHandlerImpl(GetAllIncompleteOrdersQueryHandler)
         self._session = session
 
     async def handle(self, query: GetAllIncompleteOrdersQuery) -> Result[list[IncompleteOrderDto], Error]:  # noqa: ARG002
-        stmt: typing.Final = sqlalchemy.select(OrderModel).where(OrderModel.status.in_(["Created", "Assigned"]))
-
-        result: typing.Final = await self._session.execute(stmt)
-        order_models: typing.Final = result.scalars().unique().all()
+        # Только нужные колонки и выполнение на соединении: DTO строятся прямо из строк, без сущностей и identity map
+        stmt: typing.Final = sqlalchemy.select(OrderModel.id, OrderModel.location_x, OrderModel.location_y).where(
+            OrderModel.status.in_([OrderStatus.CREATED.value, OrderStatus.ASSIGNED.value])
+        )
 
+        connection: typing.Final = await self._session.connection()
         dto_list: typing.Final[list[IncompleteOrderDto]] = [
-            IncompleteOrderDto(
-                id=order_model.id,
-                location_x=order_model.location_x,
-                location_y=order_model.location_y,
-            )
-            for order_model in order_models
+            IncompleteOrderDto(id=order_id, location_x=location_x, location_y=location_y)
+            for order_id, location_x, location_y in await connection.execute(stmt)
         ]
 
         return Result.success(dto_list)
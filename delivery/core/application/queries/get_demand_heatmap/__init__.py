@@ -0,0 +1,12 @@
+from .dto import DemandHeatmapDto
+from .handler import GetDemandHeatmapQueryHandler
+from .handler_impl import GetDemandHeatmapQueryHandlerImpl
+from .query import GetDemandHeatmapQuery
+
+
+__all__ = [
+    "DemandHeatmapDto",
+    "GetDemandHeatmapQuery",
+    "GetDemandHeatmapQueryHandler",
+    "GetDemandHeatmapQueryHandlerImpl",
+]
@@ -0,0 +1,8 @@
+import dataclasses
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class DemandHeatmapDto:
+    grid_size: int
+    # cells[x - 1][y - 1] - затухший спрос в клетке (x, y)
+    cells: list[list[float]]
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+from delivery.libs.errs.error import Error
+from delivery.libs.errs.result import Result
+from .dto import DemandHeatmapDto
+from .query import GetDemandHeatmapQuery
+
+
+class GetDemandHeatmapQueryHandler(ABC):
+    @abstractmethod
+    async def handle(self, query: GetDemandHeatmapQuery) -> Result[DemandHeatmapDto, Error]:
+        pass
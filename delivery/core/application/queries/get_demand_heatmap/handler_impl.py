@@ -0,0 +1,30 @@
+import datetime as dt
+import math
+import typing
+
+from delivery.core.domain.service.demand_heatmap import DemandHeatmap
+from delivery.libs.errs.error import Error
+from delivery.libs.errs.result import Result
+from .dto import DemandHeatmapDto
+from .handler import GetDemandHeatmapQueryHandler
+from .query import GetDemandHeatmapQuery
+
+
+# Трёх знаков достаточно для визуализации и заметно сокращает ответ
+_PRECISION: typing.Final = 3
+
+
+class GetDemandHeatmapQueryHandlerImpl(GetDemandHeatmapQueryHandler):
+    """Отдаёт тепловую карту спроса из памяти, не обращаясь к базе."""
+
+    def __init__(self, demand_heatmap: DemandHeatmap) -> None:
+        self._demand_heatmap = demand_heatmap
+
+    async def handle(self, query: GetDemandHeatmapQuery) -> Result[DemandHeatmapDto, Error]:  # noqa: ARG002
+        snapshot: typing.Final = self._demand_heatmap.snapshot(dt.datetime.now(dt.UTC))
+        grid_size: typing.Final = math.isqrt(len(snapshot))
+        cells: typing.Final = [
+            [round(intensity, _PRECISION) for intensity in snapshot[row : row + grid_size]]
+            for row in range(0, len(snapshot), grid_size)
+        ]
+        return Result.success(DemandHeatmapDto(grid_size=grid_size, cells=cells))
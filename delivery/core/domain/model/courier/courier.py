@@ -3,6 +3,7 @@ from uuid import UUID, uuid4
 
 from delivery.core.domain.model.courier.storage_place import StoragePlace
 from delivery.core.domain.model.kernel import Location, Volume
+from delivery.core.domain.model.travel_time import get_travel_time_table
 from delivery.libs.ddd.aggregate import Aggregate
 from delivery.libs.errs.error import Error
 from delivery.libs.errs.guard import Guard
@@ -139,9 +140,7 @@ class Courier(Aggregate[UUID]):
         )
 
     def calculate_time_to_location(self, target: Location) -> int:
-        distance: typing.Final = self._location.distance_to(target)
-        steps: typing.Final = (distance + self._speed - 1) // self._speed
-        return steps
+        return get_travel_time_table().steps(self._speed, self._location, target)
 
     def move(self, target: Location) -> UnitResult[Error]:
         if target is None:
@@ -167,6 +166,14 @@ class Courier(Aggregate[UUID]):
         self._location = new_location_result.get_value()
         return UnitResult.success()
 
+    def relocate(self, location: Location) -> UnitResult[Error]:
+        """Переносит курьера в позицию, рассчитанную пакетным шагом движения."""
+        if location is None:
+            return UnitResult.failure(Error.of("value.is.required", "location is required"))
+
+        self._location = location
+        return UnitResult.success()
+
     def __repr__(self) -> str:
         occupied_count: typing.Final = sum(1 for p in self._storage_places if p.is_occupied())
         return (
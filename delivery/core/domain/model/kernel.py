@@ -1,3 +1,4 @@
+import datetime as dt
 import typing
 
 from delivery.libs.ddd.value_object import ValueObject
@@ -9,10 +10,12 @@ from delivery.libs.errs.result import Result
 class Location(ValueObject["Location"]):
     _MIN_COORDINATE: typing.Final[int] = 1
     _MAX_COORDINATE: typing.Final[int] = 10
+    _GRID_SIZE: typing.Final[int] = _MAX_COORDINATE - _MIN_COORDINATE + 1
 
     def __init__(self, x: int, y: int) -> None:
         self._x = x
         self._y = y
+        self._cell_id = (x - Location._MIN_COORDINATE) * Location._GRID_SIZE + (y - Location._MIN_COORDINATE)
 
     @staticmethod
     def create(x: int, y: int) -> Result["Location", Error]:
@@ -29,6 +32,19 @@ class Location(ValueObject["Location"]):
     def must_create(x: int, y: int) -> "Location":
         return Location.create(x, y).get_value_or_throw()
 
+    @staticmethod
+    def from_cell_id(cell_id: int) -> "Location":
+        x_offset, y_offset = divmod(cell_id, Location._GRID_SIZE)
+        return Location.must_create(x_offset + Location._MIN_COORDINATE, y_offset + Location._MIN_COORDINATE)
+
+    @staticmethod
+    def cells_count() -> int:
+        return Location._GRID_SIZE * Location._GRID_SIZE
+
+    @staticmethod
+    def max_distance() -> int:
+        return 2 * (Location._MAX_COORDINATE - Location._MIN_COORDINATE)
+
     @property
     def x(self) -> int:
         return self._x
@@ -37,6 +53,11 @@ class Location(ValueObject["Location"]):
     def y(self) -> int:
         return self._y
 
+    @property
+    def cell_id(self) -> int:
+        """Номер клетки карты от 0 до cells_count() - 1 для индексации в плоских таблицах."""
+        return self._cell_id
+
     def distance_to(self, other: "Location") -> int:
         return abs(self._x - other.x) + abs(self._y - other.y)
 
@@ -77,6 +98,52 @@ class Volume(ValueObject["Volume"]):
         return f"Volume(value={self._value})"
 
 
+class DeliveryPeriod(ValueObject["DeliveryPeriod"]):
+    def __init__(self, start: dt.datetime, end: dt.datetime) -> None:
+        self._start = start
+        self._end = end
+
+    @staticmethod
+    def create(start: dt.datetime, end: dt.datetime) -> Result["DeliveryPeriod", Error]:
+        err: typing.Final = Guard.combine(
+            Guard.against_null(start, "start"),
+            Guard.against_null(end, "end"),
+        )
+        if err is not None:
+            return Result.failure(err)
+
+        if end <= start:
+            return Result.failure(
+                Error.of(
+                    "delivery.period.invalid",
+                    f"Delivery period end {end.isoformat()} must be after start {start.isoformat()}",
+                )
+            )
+
+        return Result.success(DeliveryPeriod(start, end))
+
+    @staticmethod
+    def must_create(start: dt.datetime, end: dt.datetime) -> "DeliveryPeriod":
+        return DeliveryPeriod.create(start, end).get_value_or_throw()
+
+    @property
+    def start(self) -> dt.datetime:
+        return self._start
+
+    @property
+    def end(self) -> dt.datetime:
+        return self._end
+
+    def is_missed_at(self, moment: dt.datetime) -> bool:
+        return moment > self._end
+
+    def equality_components(self) -> typing.Iterable[object]:
+        return [self._start, self._end]
+
+    def __repr__(self) -> str:
+        return f"DeliveryPeriod(start={self._start.isoformat()}, end={self._end.isoformat()})"
+
+
 class Address(ValueObject["Address"]):
     def __init__(
         self,
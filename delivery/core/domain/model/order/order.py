@@ -1,7 +1,8 @@
+import datetime as dt
 import typing
 from uuid import UUID
 
-from delivery.core.domain.model.kernel import Location, Volume
+from delivery.core.domain.model.kernel import DeliveryPeriod, Location, Volume
 from delivery.core.domain.model.order.events import OrderCompletedDomainEvent, OrderCreatedDomainEvent
 from delivery.core.domain.model.order.order_status import OrderStatus
 from delivery.libs.ddd.aggregate import Aggregate
@@ -11,25 +12,33 @@ from delivery.libs.errs.result import Result, UnitResult
 
 
 class Order(Aggregate[UUID]):
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         id_: UUID,
         location: Location,
         volume: Volume,
         status: OrderStatus,
+        *,
         courier_id: UUID | None = None,
+        reserved_courier_id: UUID | None = None,
+        delivery_period: DeliveryPeriod | None = None,
+        estimated_arrival_at: dt.datetime | None = None,
     ) -> None:
         super().__init__(id_)
         self._location = location
         self._volume = volume
         self._status = status
         self._courier_id = courier_id
+        self._reserved_courier_id = reserved_courier_id
+        self._delivery_period = delivery_period
+        self._estimated_arrival_at = estimated_arrival_at
 
     @staticmethod
     def create(
         id_: UUID,
         location: Location,
         volume: Volume,
+        delivery_period: DeliveryPeriod | None = None,
     ) -> Result["Order", Error]:
         if location is None:
             return Result.failure(Error.of("value.is.required", "location is required"))
@@ -47,6 +56,7 @@ class Order(Aggregate[UUID]):
             volume=volume,
             status=OrderStatus.CREATED,
             courier_id=None,
+            delivery_period=delivery_period,
         )
         order.raise_domain_event(OrderCreatedDomainEvent(typing.cast("UUID", order.id)))
         return Result.success(order)
@@ -56,8 +66,9 @@ class Order(Aggregate[UUID]):
         id_: UUID,
         location: Location,
         volume: Volume,
+        delivery_period: DeliveryPeriod | None = None,
     ) -> "Order":
-        return Order.create(id_, location, volume).get_value_or_throw()
+        return Order.create(id_, location, volume, delivery_period).get_value_or_throw()
 
     @property
     def location(self) -> Location:
@@ -75,6 +86,38 @@ class Order(Aggregate[UUID]):
     def courier_id(self) -> UUID | None:
         return self._courier_id
 
+    @property
+    def delivery_period(self) -> DeliveryPeriod | None:
+        return self._delivery_period
+
+    @property
+    def reserved_courier_id(self) -> UUID | None:
+        return self._reserved_courier_id
+
+    @property
+    def estimated_arrival_at(self) -> dt.datetime | None:
+        return self._estimated_arrival_at
+
+    def reserve(self, courier_id: UUID) -> UnitResult[Error]:
+        """Резервирует заказ за курьером, который освободится раньше, чем доедет любой свободный."""
+        err: typing.Final = Guard.against_null_or_empty_uuid(courier_id, "courier_id")
+        if err is not None:
+            return UnitResult.failure(err)
+
+        if self._status != OrderStatus.CREATED:
+            return UnitResult.failure(
+                Error.of(
+                    "order.already.assigned",
+                    f"Order {self.id} is already in status {self._status.value}",
+                )
+            )
+
+        self._reserved_courier_id = courier_id
+        return UnitResult.success()
+
+    def release_reservation(self) -> None:
+        self._reserved_courier_id = None
+
     def assign(self, courier_id: UUID) -> UnitResult[Error]:
         err: typing.Final = Guard.against_null_or_empty_uuid(courier_id, "courier_id")
         if err is not None:
@@ -97,9 +140,26 @@ class Order(Aggregate[UUID]):
             )
 
         self._courier_id = courier_id
+        self._reserved_courier_id = None
         self._status = OrderStatus.ASSIGNED
         return UnitResult.success()
 
+    def schedule_arrival(self, arrives_at: dt.datetime) -> UnitResult[Error]:
+        """Запоминает момент, когда назначенный курьер дойдёт до заказа."""
+        if arrives_at is None:
+            return UnitResult.failure(Error.of("value.is.required", "arrives_at is required"))
+
+        if self._status != OrderStatus.ASSIGNED:
+            return UnitResult.failure(
+                Error.of(
+                    "order.not.assigned",
+                    f"Cannot schedule arrival for order {self.id} in status {self._status.value}",
+                )
+            )
+
+        self._estimated_arrival_at = arrives_at
+        return UnitResult.success()
+
     def complete(self) -> UnitResult[Error]:
         if self._status != OrderStatus.ASSIGNED:
             return UnitResult.failure(
@@ -0,0 +1,39 @@
+import array
+import functools
+import typing
+
+from delivery.core.domain.model.kernel import Location
+
+
+class TravelTimeTable:
+    """Предрасчитанные расстояния и число шагов между всеми парами клеток карты.
+
+    Клетки адресуются Location.cell_id, поэтому поиск сводится к индексации плоского массива.
+    Любая скорость не меньше максимального расстояния на карте проходит его за один шаг,
+    поэтому таблицы строятся для скоростей 1..max_distance, а более быстрые курьеры пользуются последней.
+    """
+
+    def __init__(self) -> None:
+        cells: typing.Final = [Location.from_cell_id(cell_id) for cell_id in range(Location.cells_count())]
+
+        self._cells_count: typing.Final = len(cells)
+        self._max_speed: typing.Final = max(Location.max_distance(), 1)
+        self._distances: typing.Final = array.array(
+            "H",
+            (source.distance_to(target) for source in cells for target in cells),
+        )
+        self._steps: typing.Final = tuple(
+            array.array("H", ((distance + speed - 1) // speed for distance in self._distances))
+            for speed in range(1, self._max_speed + 1)
+        )
+
+    def distance(self, source: Location, target: Location) -> int:
+        return self._distances[source.cell_id * self._cells_count + target.cell_id]
+
+    def steps(self, speed: int, source: Location, target: Location) -> int:
+        return self._steps[min(speed, self._max_speed) - 1][source.cell_id * self._cells_count + target.cell_id]
+
+
+@functools.cache
+def get_travel_time_table() -> TravelTimeTable:
+    return TravelTimeTable()
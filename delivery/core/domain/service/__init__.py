@@ -1,4 +1,12 @@
-from delivery.core.domain.service.order_dispatch_service import OrderDispatchDomainService
+from delivery.core.domain.service.delivery_deadline_queue import DeliveryDeadlineQueue
+from delivery.core.domain.service.dispatch_strategy import DispatchStrategy, DispatchStrategyRegistry
+from delivery.core.domain.service.order_dispatch_service import OrderAssignment, OrderDispatchDomainService
 
 
-__all__ = ["OrderDispatchDomainService"]
+__all__ = [
+    "DeliveryDeadlineQueue",
+    "DispatchStrategy",
+    "DispatchStrategyRegistry",
+    "OrderAssignment",
+    "OrderDispatchDomainService",
+]
@@ -0,0 +1,78 @@
+import typing
+
+import numpy as np
+import numpy.typing as npt
+
+from delivery.core.domain.model.courier.courier import Courier
+from delivery.core.domain.model.kernel import Location
+
+
+if typing.TYPE_CHECKING:
+    from uuid import UUID
+
+
+_NO_CAPACITY: typing.Final[int] = 0
+_UNSUITABLE_TIME: typing.Final[int] = np.iinfo(np.int64).max
+
+
+def _max_free_volume(courier: Courier) -> int:
+    return max(
+        (place.total_volume for place in courier.storage_places if not place.is_occupied()),
+        default=_NO_CAPACITY,
+    )
+
+
+class CourierFleetArrays:
+    """Снимок парка курьеров в непрерывных массивах для векторной оценки кандидатов.
+
+    Курьер может взять заказ, если объём его самого большого свободного места не меньше
+    объёма заказа, что эквивалентно Courier.can_take_order. При равном времени argmin
+    выбирает курьера с меньшим индексом, как min() по исходному списку.
+    """
+
+    def __init__(self, couriers: list[Courier]) -> None:
+        self._couriers: typing.Final = list(couriers)
+        self._positions: typing.Final[dict[UUID, int]] = {
+            typing.cast("UUID", courier.id): position for position, courier in enumerate(self._couriers)
+        }
+
+        count: typing.Final = len(self._couriers)
+        self._x: typing.Final[npt.NDArray[np.int64]] = np.fromiter(
+            (courier.location.x for courier in self._couriers), dtype=np.int64, count=count
+        )
+        self._y: typing.Final[npt.NDArray[np.int64]] = np.fromiter(
+            (courier.location.y for courier in self._couriers), dtype=np.int64, count=count
+        )
+        self._speed: typing.Final[npt.NDArray[np.int64]] = np.fromiter(
+            (courier.speed for courier in self._couriers), dtype=np.int64, count=count
+        )
+        self._max_free_volume: typing.Final[npt.NDArray[np.int64]] = np.fromiter(
+            (_max_free_volume(courier) for courier in self._couriers), dtype=np.int64, count=count
+        )
+
+    def __len__(self) -> int:
+        return len(self._couriers)
+
+    def __contains__(self, courier_id: object) -> bool:
+        return courier_id in self._positions
+
+    def __iter__(self) -> typing.Iterator[Courier]:
+        return iter(self._couriers)
+
+    def exclude(self, courier: Courier) -> None:
+        """Исключает курьера из дальнейшего выбора, например после того как ему достался заказ в пакете."""
+        self._max_free_volume[self._positions[typing.cast("UUID", courier.id)]] = _NO_CAPACITY
+
+    def times_to_location(self, target: Location) -> npt.NDArray[np.int64]:
+        # Та же формула, по которой строится TravelTimeTable, но сразу по всему парку: выборка из таблицы
+        # шла бы по курьеру за раз, потому что у каждой скорости своя таблица, и свела бы векторизацию на нет
+        distance: typing.Final = np.abs(self._x - target.x) + np.abs(self._y - target.y)
+        return (distance + self._speed - 1) // self._speed
+
+    def find_fastest(self, target: Location, order_volume: int) -> Courier | None:
+        suitable: typing.Final = self._max_free_volume >= order_volume
+        if not suitable.any():
+            return None
+
+        times: typing.Final = np.where(suitable, self.times_to_location(target), _UNSUITABLE_TIME)
+        return self._couriers[int(np.argmin(times))]
@@ -0,0 +1,54 @@
+import dataclasses
+import typing
+
+import numpy as np
+import numpy.typing as npt
+
+from delivery.core.domain.model.courier.courier import Courier
+from delivery.core.domain.model.kernel import Location
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CourierMovementStep:
+    x: npt.NDArray[np.int64]
+    y: npt.NDArray[np.int64]
+    arrived: npt.NDArray[np.bool_]
+
+    def __len__(self) -> int:
+        return len(self.arrived)
+
+    def location(self, position: int) -> Location:
+        # Новая позиция лежит между двумя корректными точками карты, поэтому повторная проверка границ не нужна
+        return Location(int(self.x[position]), int(self.y[position]))
+
+
+def move_towards(
+    x: npt.NDArray[np.int64],
+    y: npt.NDArray[np.int64],
+    target_x: npt.NDArray[np.int64],
+    target_y: npt.NDArray[np.int64],
+    speed: npt.NDArray[np.int64],
+) -> CourierMovementStep:
+    """Делает один шаг для всех курьеров сразу с той же отсечкой, что и Courier.move.
+
+    Сначала курьер идёт по x не дальше своей скорости, затем остаток хода тратит на y.
+    """
+    move_x: typing.Final = np.clip(target_x - x, -speed, speed)
+    remaining_range: typing.Final = speed - np.abs(move_x)
+    move_y: typing.Final = np.clip(target_y - y, -remaining_range, remaining_range)
+
+    new_x: typing.Final = x + move_x
+    new_y: typing.Final = y + move_y
+    return CourierMovementStep(x=new_x, y=new_y, arrived=(new_x == target_x) & (new_y == target_y))
+
+
+def move_couriers_towards(couriers: list[Courier], targets: list[Location]) -> CourierMovementStep:
+    """Сдвигает i-го курьера к i-й цели; сами агрегаты не меняются, позиции применяются через Courier.relocate."""
+    count: typing.Final = len(couriers)
+    return move_towards(
+        np.fromiter((courier.location.x for courier in couriers), dtype=np.int64, count=count),
+        np.fromiter((courier.location.y for courier in couriers), dtype=np.int64, count=count),
+        np.fromiter((target.x for target in targets), dtype=np.int64, count=count),
+        np.fromiter((target.y for target in targets), dtype=np.int64, count=count),
+        np.fromiter((courier.speed for courier in couriers), dtype=np.int64, count=count),
+    )
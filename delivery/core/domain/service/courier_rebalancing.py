@@ -0,0 +1,37 @@
+import typing
+from collections.abc import Sequence
+
+from delivery.core.domain.model.courier.courier import Courier
+from delivery.core.domain.model.kernel import Location
+from delivery.core.domain.model.travel_time import get_travel_time_table
+
+
+def plan_rebalancing(
+    idle_couriers: Sequence[Courier],
+    hotspots: Sequence[Location],
+    budget: int,
+) -> list[tuple[Courier, Location]]:
+    """Сопоставляет клетки спроса, от самой нагруженной, ближайшим свободным курьерам, не больше budget перемещений.
+
+    Клетка, на которой уже стоит свободный курьер, считается покрытой и оставляет этого курьера на месте.
+    """
+    if budget <= 0 or not idle_couriers:
+        return []
+
+    table: typing.Final = get_travel_time_table()
+    available: typing.Final = list(idle_couriers)
+    moves: typing.Final[list[tuple[Courier, Location]]] = []
+    for hotspot in hotspots:
+        if len(moves) >= budget or not available:
+            break
+
+        standing = next((courier for courier in available if courier.location == hotspot), None)
+        if standing is not None:
+            available.remove(standing)
+            continue
+
+        nearest = min(available, key=lambda courier: table.distance(courier.location, hotspot))
+        available.remove(nearest)
+        moves.append((nearest, hotspot))
+
+    return moves
@@ -0,0 +1,84 @@
+import datetime as dt
+import typing
+
+from delivery.core.domain.model.kernel import Location
+from delivery.core.domain.model.order.order import Order
+from delivery.core.domain.model.travel_time import get_travel_time_table
+from delivery.core.domain.service.order_dispatch_service import OrderAssignment
+from delivery.libs.errs.error import Error
+from delivery.libs.errs.result import UnitResult
+
+
+if typing.TYPE_CHECKING:
+    from uuid import UUID
+
+
+# Один тик - один запуск задачи перемещения курьеров
+TICK_DURATION: typing.Final = dt.timedelta(seconds=1)
+
+
+def advance_along_route(origin: Location, target: Location, speed: int, ticks: int) -> Location:
+    """Позиция после ticks шагов Courier.move: путь всегда идёт сначала по x, затем по y."""
+    cruising_range: int = speed * ticks
+    dif_x: typing.Final = target.x - origin.x
+    move_x: typing.Final = max(-cruising_range, min(dif_x, cruising_range))
+    cruising_range -= abs(move_x)
+    dif_y: typing.Final = target.y - origin.y
+    move_y: typing.Final = max(-cruising_range, min(dif_y, cruising_range))
+    # Точка лежит на пути между двумя корректными точками карты
+    return Location(origin.x + move_x, origin.y + move_y)
+
+
+def estimate_arrival(origin: Location, departure_at: dt.datetime, target: Location, speed: int) -> dt.datetime:
+    return departure_at + TICK_DURATION * get_travel_time_table().steps(speed, origin, target)
+
+
+def schedule_after_route(
+    route_orders: list[Order],
+    assignments: list[OrderAssignment],
+    now: dt.datetime,
+) -> UnitResult[Error]:
+    """Рассчитывает прибытие к новым заказам: курьер едет к ним после уже запланированных остановок."""
+    route_ends: typing.Final[dict[UUID, tuple[Location, dt.datetime]]] = {}
+    for order in route_orders:
+        courier_id = typing.cast("UUID", order.courier_id)
+        arrives_at = order.estimated_arrival_at
+        if arrives_at is not None and (courier_id not in route_ends or arrives_at > route_ends[courier_id][1]):
+            route_ends[courier_id] = (order.location, arrives_at)
+
+    for assignment in assignments:
+        courier_id = typing.cast("UUID", assignment.courier.id)
+        origin, free_at = route_ends.get(courier_id, (assignment.courier.location, now))
+        arrives_at = estimate_arrival(origin, max(free_at, now), assignment.order.location, assignment.courier.speed)
+        schedule_result = assignment.order.schedule_arrival(arrives_at)
+        if schedule_result.is_failure:
+            return schedule_result
+
+        route_ends[courier_id] = (assignment.order.location, arrives_at)
+
+    return UnitResult.success()
+
+
+def locate_on_route(
+    origin: Location,
+    speed: int,
+    stops: list[tuple[Location, dt.datetime]],
+    moment: dt.datetime,
+) -> Location:
+    """Восстанавливает позицию курьера на момент moment по точке отправления и заказам маршрута.
+
+    Каждый участок начинается в момент прибытия на предыдущую остановку, поэтому время отправления
+    выводится из расчётного прибытия и хранить его отдельно не нужно.
+    """
+    position = origin
+    for target, arrives_at in sorted(stops, key=lambda stop: stop[1]):
+        if moment >= arrives_at:
+            position = target
+            continue
+
+        departure_at = arrives_at - TICK_DURATION * get_travel_time_table().steps(speed, position, target)
+        if moment <= departure_at:
+            return position
+        return advance_along_route(position, target, speed, (moment - departure_at) // TICK_DURATION)
+
+    return position
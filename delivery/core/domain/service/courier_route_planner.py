@@ -0,0 +1,72 @@
+import typing
+from collections.abc import Collection, Sequence
+from uuid import UUID
+
+from delivery.core.domain.model.courier.courier import Courier
+from delivery.core.domain.model.kernel import Location
+from delivery.core.domain.model.order.order import Order
+from delivery.core.domain.model.travel_time import get_travel_time_table
+
+
+def plan_stop_sequence(origin: Location, stops: Sequence[Location]) -> list[int]:
+    """Порядок обхода остановок: жадный ближайший сосед, улучшенный 2-opt по манхэттенскому расстоянию.
+
+    Маршрут открытый: начинается в origin и заканчивается на последней остановке, возвращаться некуда.
+    """
+    table: typing.Final = get_travel_time_table()
+    remaining: typing.Final = list(range(len(stops)))
+    sequence: typing.Final[list[int]] = []
+    position = origin
+    while remaining:
+        nearest = min(remaining, key=lambda stop: table.distance(position, stops[stop]))
+        remaining.remove(nearest)
+        sequence.append(nearest)
+        position = stops[nearest]
+
+    path: typing.Final = [origin, *(stops[stop] for stop in sequence)]
+    improved = True
+    while improved:
+        improved = False
+        for start in range(1, len(path) - 1):
+            for end in range(start + 1, len(path)):
+                # Разворот участка path[start..end] меняет только рёбра на его концах
+                before: int = table.distance(path[start - 1], path[start])
+                after: int = table.distance(path[start - 1], path[end])
+                if end + 1 < len(path):
+                    before += table.distance(path[end], path[end + 1])
+                    after += table.distance(path[start], path[end + 1])
+                if after < before:
+                    path[start : end + 1] = path[start : end + 1][::-1]
+                    sequence[start - 1 : end] = sequence[start - 1 : end][::-1]
+                    improved = True
+
+    return sequence
+
+
+class CourierRoutePlanner:
+    """Хранит последовательность остановок каждого курьера между тиками.
+
+    Маршрут пересчитывается от текущей позиции курьера, только когда меняется набор его заказов:
+    заказ назначен или завершён. В остальные тики курьер идёт по уже спланированному маршруту.
+    """
+
+    def __init__(self) -> None:
+        self._routes: typing.Final[dict[UUID, tuple[UUID, ...]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._routes)
+
+    def sequence(self, courier: Courier, orders: Sequence[Order]) -> list[Order]:
+        courier_id: typing.Final = typing.cast("UUID", courier.id)
+        orders_by_id: typing.Final = {typing.cast("UUID", order.id): order for order in orders}
+        route = self._routes.get(courier_id)
+        if route is None or len(route) != len(orders_by_id) or not orders_by_id.keys() >= set(route):
+            stop_sequence = plan_stop_sequence(courier.location, [order.location for order in orders])
+            route = tuple(typing.cast("UUID", orders[stop].id) for stop in stop_sequence)
+            self._routes[courier_id] = route
+        return [orders_by_id[order_id] for order_id in route]
+
+    def retain(self, courier_ids: Collection[UUID]) -> None:
+        """Забывает маршруты курьеров, у которых не осталось назначенных заказов."""
+        for courier_id in self._routes.keys() - set(courier_ids):
+            del self._routes[courier_id]
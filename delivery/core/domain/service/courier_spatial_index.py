@@ -0,0 +1,90 @@
+import collections
+import itertools
+import typing
+
+from delivery.core.domain.model.courier.courier import Courier
+from delivery.core.domain.model.kernel import Location
+
+
+if typing.TYPE_CHECKING:
+    from uuid import UUID
+
+
+class CourierSpatialIndex:
+    """Индекс курьеров по клеткам карты.
+
+    Строится на время одного пакетного распределения по уже загруженным курьерам
+    и отбирает для каждого заказа ближайших кандидатов вместо перебора всего парка.
+
+    Кандидаты перебираются кольцами растущего манхэттенского расстояния от точки заказа.
+    Перебор останавливается, как только нижняя граница времени для следующего кольца
+    (расстояние, делённое на максимальную скорость в индексе) хуже уже найденных кандидатов.
+    При равном времени побеждает курьер, добавленный в индекс раньше, как у min() по списку.
+    """
+
+    def __init__(self, couriers: typing.Iterable[Courier] = ()) -> None:
+        self._buckets: dict[tuple[int, int], dict[UUID, Courier]] = collections.defaultdict(dict)
+        self._cells: dict[UUID, tuple[int, int]] = {}
+        self._sequence: dict[UUID, int] = {}
+        self._speeds: collections.Counter[int] = collections.Counter()
+        self._next_sequence = itertools.count()
+
+        for courier in couriers:
+            self.add(courier)
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def add(self, courier: Courier) -> None:
+        courier_id: typing.Final = typing.cast("UUID", courier.id)
+        cell: typing.Final = (courier.location.x, courier.location.y)
+        self._buckets[cell][courier_id] = courier
+        self._cells[courier_id] = cell
+        self._sequence[courier_id] = next(self._next_sequence)
+        self._speeds[courier.speed] += 1
+
+    def find_nearest(self, target: Location, order_volume: int, limit: int = 1) -> list[Courier]:
+        """Возвращает до limit курьеров, способных взять заказ, по возрастанию времени до target."""
+        if limit <= 0 or not self._cells:
+            return []
+
+        max_speed: typing.Final = max(self._speeds)
+        candidates: typing.Final[list[tuple[int, int, Courier]]] = []
+        visited = 0
+
+        for distance in itertools.count():
+            if len(candidates) >= limit:
+                worst_time = candidates[limit - 1][0]
+                lower_bound = (distance + max_speed - 1) // max_speed
+                if lower_bound > worst_time:
+                    break
+
+            for cell in self._ring(target, distance):
+                bucket = self._buckets.get(cell)
+                if not bucket:
+                    continue
+
+                visited += len(bucket)
+                for courier_id, courier in bucket.items():
+                    if courier.can_take_order(order_volume):
+                        candidates.append(
+                            (courier.calculate_time_to_location(target), self._sequence[courier_id], courier)
+                        )
+
+            candidates.sort(key=lambda candidate: candidate[:2])
+            if visited == len(self._cells):
+                break
+
+        return [courier for _, _, courier in candidates[:limit]]
+
+    @staticmethod
+    def _ring(center: Location, distance: int) -> typing.Iterator[tuple[int, int]]:
+        if distance == 0:
+            yield center.x, center.y
+            return
+
+        for dx in range(-distance, distance + 1):
+            dy = distance - abs(dx)
+            yield center.x + dx, center.y + dy
+            if dy != 0:
+                yield center.x + dx, center.y - dy
@@ -0,0 +1,37 @@
+import datetime as dt
+import heapq
+import itertools
+import typing
+
+from delivery.core.domain.model.order.order import Order
+
+
+_NO_DEADLINE: typing.Final = dt.datetime.max.replace(tzinfo=dt.UTC)
+
+
+class DeliveryDeadlineQueue:
+    """Очередь ожидающих заказов по времени закрытия окна доставки.
+
+    Заказы без окна идут после всех заказов с окном, при равном сроке сохраняется порядок добавления.
+    """
+
+    def __init__(self, orders: typing.Iterable[Order] = ()) -> None:
+        self._heap: list[tuple[bool, dt.datetime, int, Order]] = []
+        self._next_sequence = itertools.count()
+
+        for order in orders:
+            self.push(order)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def push(self, order: Order) -> None:
+        period: typing.Final = order.delivery_period
+        deadline: typing.Final = _NO_DEADLINE if period is None else period.end
+        heapq.heappush(self._heap, (period is None, deadline, next(self._next_sequence), order))
+
+    def pop(self) -> Order:
+        return heapq.heappop(self._heap)[-1]
+
+    def pop_many(self, count: int) -> list[Order]:
+        return [self.pop() for _ in range(min(count, len(self._heap)))]
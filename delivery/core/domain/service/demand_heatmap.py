@@ -0,0 +1,74 @@
+import datetime as dt
+import heapq
+import math
+import typing
+
+from delivery.core.domain.model.kernel import Location
+
+
+# Вес заказа старше десяти периодов полураспада меньше тысячной, такие заказы можно не учитывать
+_MEMORY_HALF_LIVES: typing.Final = 10
+# Запас до переполнения float при масштабировании счётчиков
+_MAX_EXPONENT: typing.Final = 50.0
+
+
+class DemandHeatmap:
+    """Спрос по клеткам карты с экспоненциальным затуханием.
+
+    Счётчики хранятся в масштабе опорного момента: новый заказ добавляет вес exp(λ·t) в свою клетку,
+    вместо того чтобы уменьшать все остальные, поэтому запись стоит O(1). Когда масштаб становится
+    слишком большим, счётчики один раз пересчитываются к новому опорному моменту.
+    """
+
+    def __init__(self, half_life: dt.timedelta) -> None:
+        self._half_life: typing.Final = half_life
+        self._decay_rate: typing.Final = math.log(2) / half_life.total_seconds()
+        self._counters: typing.Final = [0.0] * Location.cells_count()
+        self._reference_at: dt.datetime | None = None
+
+    @property
+    def memory(self) -> dt.timedelta:
+        """Насколько далеко в прошлое имеет смысл восстанавливать заказы."""
+        return self._half_life * _MEMORY_HALF_LIVES
+
+    def record(self, location: Location, moment: dt.datetime) -> None:
+        if self._reference_at is None:
+            self._reference_at = moment
+
+        exponent = self._exponent(moment)
+        if exponent > _MAX_EXPONENT:
+            self._rebase(moment)
+            exponent = 0.0
+        self._counters[location.cell_id] += math.exp(exponent)
+
+    def intensity(self, location: Location, moment: dt.datetime) -> float:
+        return self._counters[location.cell_id] * self._scale(moment)
+
+    def snapshot(self, moment: dt.datetime) -> list[float]:
+        """Затухший спрос по всем клеткам в порядке Location.cell_id."""
+        scale: typing.Final = self._scale(moment)
+        return [counter * scale for counter in self._counters]
+
+    def hotspots(self, limit: int) -> list[Location]:
+        """До limit клеток с наибольшим спросом, начиная с самой нагруженной."""
+        # Общий множитель затухания не меняет порядок клеток, поэтому сравниваются сырые счётчики
+        cell_ids: typing.Final = heapq.nlargest(
+            limit,
+            (cell_id for cell_id, counter in enumerate(self._counters) if counter > 0),
+            key=self._counters.__getitem__,
+        )
+        return [Location.from_cell_id(cell_id) for cell_id in cell_ids]
+
+    def _exponent(self, moment: dt.datetime) -> float:
+        if self._reference_at is None:
+            return 0.0
+        return self._decay_rate * (moment - self._reference_at).total_seconds()
+
+    def _scale(self, moment: dt.datetime) -> float:
+        return math.exp(-self._exponent(moment))
+
+    def _rebase(self, moment: dt.datetime) -> None:
+        scale: typing.Final = self._scale(moment)
+        for cell_id, counter in enumerate(self._counters):
+            self._counters[cell_id] = counter * scale
+        self._reference_at = moment
@@ -0,0 +1,107 @@
+import typing
+from abc import ABC, abstractmethod
+
+from delivery.core.domain.model.courier.courier import Courier
+from delivery.core.domain.model.order.order import Order
+from delivery.core.domain.service.courier_fleet_arrays import CourierFleetArrays
+from delivery.core.domain.service.delivery_deadline_queue import DeliveryDeadlineQueue
+from delivery.core.domain.service.order_dispatch_service import OrderAssignment, OrderDispatchDomainService
+from delivery.libs.errs.error import Error
+from delivery.libs.errs.guard import Guard
+from delivery.libs.errs.result import Result
+
+
+class DispatchStrategy(ABC):
+    # Стратегия раскладывает заказы по свободным местам частично загруженных курьеров,
+    # поэтому ей нужны все курьеры со свободной вместимостью, а не только полностью свободные
+    uses_partially_loaded_couriers: typing.ClassVar[bool] = False
+
+    def __init__(self, order_dispatch_service: OrderDispatchDomainService) -> None:
+        self._order_dispatch_service = order_dispatch_service
+
+    @abstractmethod
+    def dispatch(self, orders: list[Order], couriers: list[Courier]) -> Result[list[OrderAssignment], Error]: ...
+
+
+class DispatchStrategyRegistry:
+    _strategies: typing.ClassVar[dict[str, type[DispatchStrategy]]] = {}
+
+    @classmethod
+    def register[T: DispatchStrategy](cls, name: str) -> typing.Callable[[type[T]], type[T]]:
+        def decorator(strategy_class: type[T]) -> type[T]:
+            cls._strategies[name] = strategy_class
+            return strategy_class
+
+        return decorator
+
+    @classmethod
+    def get_all_names(cls) -> list[str]:
+        return list(cls._strategies.keys())
+
+    @classmethod
+    def create(cls, name: str, order_dispatch_service: OrderDispatchDomainService) -> DispatchStrategy:
+        if name not in cls._strategies:
+            raise ValueError(f"Unknown dispatch strategy: {name}, available: {', '.join(cls._strategies)}")
+        return cls._strategies[name](order_dispatch_service)
+
+
+@DispatchStrategyRegistry.register("greedy_nearest")
+class GreedyNearestDispatchStrategy(DispatchStrategy):
+    """Заказы по очереди (по сроку окна доставки) получают самого быстрого из оставшихся курьеров.
+
+    Курьеры оцениваются векторно по снимку парка, назначенный курьер исключается из снимка.
+    """
+
+    def dispatch(self, orders: list[Order], couriers: list[Courier]) -> Result[list[OrderAssignment], Error]:
+        error: typing.Final = Guard.combine(
+            Guard.against_null_or_empty_collection(orders, "orders"),
+            Guard.against_null_or_empty_collection(couriers, "couriers"),
+        )
+        if error is not None:
+            return Result.failure(error)
+
+        fleet: typing.Final = CourierFleetArrays(couriers)
+        pending: typing.Final = DeliveryDeadlineQueue(orders)
+        assignments: typing.Final[list[OrderAssignment]] = []
+        while pending and len(assignments) < len(couriers):
+            order = pending.pop()
+            dispatch_result = self._order_dispatch_service.dispatch_order_vectorized(order, fleet)
+            if dispatch_result.is_failure:
+                continue
+
+            courier = dispatch_result.get_value()
+            fleet.exclude(courier)
+            assignments.append(OrderAssignment(order=order, courier=courier))
+
+        if not assignments:
+            return Result.failure(
+                Error.of(
+                    "order.dispatch.no.suitable.courier",
+                    f"No suitable courier found for any of {len(orders)} orders",
+                )
+            )
+
+        return Result.success(assignments)
+
+
+@DispatchStrategyRegistry.register("batch_matching")
+class BatchMatchingDispatchStrategy(DispatchStrategy):
+    """Минимизирует суммарное время для самых срочных заказов, которых хватает на всех свободных курьеров."""
+
+    def dispatch(self, orders: list[Order], couriers: list[Courier]) -> Result[list[OrderAssignment], Error]:
+        if not orders or not couriers or len(orders) <= len(couriers):
+            return self._order_dispatch_service.dispatch_orders(orders, couriers)
+
+        # Курьеров не хватает на всех: сопоставляем только заказы, чьё окно закрывается раньше
+        urgent_orders: typing.Final = DeliveryDeadlineQueue(orders).pop_many(len(couriers))
+        return self._order_dispatch_service.dispatch_orders(urgent_orders, couriers)
+
+
+@DispatchStrategyRegistry.register("capacity_aware")
+class CapacityAwareDispatchStrategy(DispatchStrategy):
+    """Раскладывает заказы по свободным местам хранения, в том числе у частично загруженных курьеров."""
+
+    uses_partially_loaded_couriers = True
+
+    def dispatch(self, orders: list[Order], couriers: list[Courier]) -> Result[list[OrderAssignment], Error]:
+        return self._order_dispatch_service.dispatch_orders_by_capacity(orders, couriers)
@@ -0,0 +1,73 @@
+import math
+import typing
+
+
+def solve_min_cost_matching(costs: list[list[int]]) -> list[tuple[int, int]]:
+    """Решает прямоугольную задачу о назначениях (венгерский алгоритм с потенциалами).
+
+    Возвращает пары (строка, столбец) паросочетания минимальной суммарной стоимости,
+    покрывающего min(строк, столбцов) элементов.
+    """
+    if not costs or not costs[0]:
+        return []
+
+    rows_count: typing.Final = len(costs)
+    columns_count: typing.Final = len(costs[0])
+    if rows_count > columns_count:
+        transposed: typing.Final = [list(column) for column in zip(*costs, strict=True)]
+        return sorted((row, column) for column, row in _solve(transposed))
+
+    return _solve(costs)
+
+
+def _solve(costs: list[list[int]]) -> list[tuple[int, int]]:  # noqa: C901
+    rows_count: typing.Final = len(costs)
+    columns_count: typing.Final = len(costs[0])
+
+    row_potential: typing.Final[list[float]] = [0] * (rows_count + 1)
+    column_potential: typing.Final[list[float]] = [0] * (columns_count + 1)
+    column_owner: typing.Final = [0] * (columns_count + 1)
+    way: typing.Final = [0] * (columns_count + 1)
+
+    for row in range(1, rows_count + 1):
+        column_owner[0] = row
+        current_column = 0
+        min_reduced: list[float] = [math.inf] * (columns_count + 1)
+        used: list[bool] = [False] * (columns_count + 1)
+
+        while True:
+            used[current_column] = True
+            current_row = column_owner[current_column]
+            delta = math.inf
+            next_column = 0
+
+            for column in range(1, columns_count + 1):
+                if used[column]:
+                    continue
+                reduced = costs[current_row - 1][column - 1] - row_potential[current_row] - column_potential[column]
+                if reduced < min_reduced[column]:
+                    min_reduced[column] = reduced
+                    way[column] = current_column
+                if min_reduced[column] < delta:
+                    delta = min_reduced[column]
+                    next_column = column
+
+            for column in range(columns_count + 1):
+                if used[column]:
+                    row_potential[column_owner[column]] += delta
+                    column_potential[column] -= delta
+                else:
+                    min_reduced[column] -= delta
+
+            current_column = next_column
+            if column_owner[current_column] == 0:
+                break
+
+        while current_column != 0:
+            previous_column = way[current_column]
+            column_owner[current_column] = column_owner[previous_column]
+            current_column = previous_column
+
+    return sorted(
+        (column_owner[column] - 1, column - 1) for column in range(1, columns_count + 1) if column_owner[column] != 0
+    )
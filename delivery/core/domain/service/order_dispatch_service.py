@@ -1,12 +1,25 @@
+import bisect
+import dataclasses
 import typing
 
 from delivery.core.domain.model.courier.courier import Courier
 from delivery.core.domain.model.order.order import Order
+from delivery.core.domain.model.travel_time import get_travel_time_table
+from delivery.core.domain.service.courier_fleet_arrays import CourierFleetArrays
+from delivery.core.domain.service.courier_spatial_index import CourierSpatialIndex
+from delivery.core.domain.service.min_cost_matching import solve_min_cost_matching
 from delivery.libs.errs.error import Error
 from delivery.libs.errs.guard import Guard
 from delivery.libs.errs.result import Result
 
 
+@dataclasses.dataclass(frozen=True, slots=True)
+class OrderAssignment:
+    order: Order
+    courier: Courier
+    is_reservation: bool = False
+
+
 class OrderDispatchDomainService:
     def dispatch_order(
         self,
@@ -38,3 +51,193 @@ class OrderDispatchDomainService:
         )
 
         return Result.success(courier_with_min_time)
+
+    def dispatch_order_vectorized(
+        self,
+        order: Order,
+        fleet: CourierFleetArrays,
+    ) -> Result[Courier, Error]:
+        error: typing.Final = Guard.combine(
+            Guard.against_null(order, "order"),
+            Guard.against_null_or_empty_collection(fleet, "couriers"),
+        )
+        if error is not None:
+            return Result.failure(error)
+
+        fastest: typing.Final = fleet.find_fastest(order.location, order.volume.value)
+        if fastest is None:
+            return Result.failure(
+                Error.of(
+                    "order.dispatch.no.suitable.courier",
+                    f"No suitable courier found for order {order.id} with volume {order.volume.value}",
+                )
+            )
+
+        return Result.success(fastest)
+
+    def dispatch_order_with_lookahead(
+        self,
+        order: Order,
+        free_couriers: list[Courier],
+        busy_deliveries: list[OrderAssignment],
+    ) -> Result[OrderAssignment, Error]:
+        """Выбирает курьера с учётом занятых, которые вот-вот освободятся.
+
+        Занятый курьер из busy_deliveries оценивается как оставшиеся шаги до его текущего заказа
+        плюс шаги от точки доставки до нового заказа. Если так он успевает строго раньше любого
+        свободного курьера, возвращается резервирование (is_reservation=True), иначе назначение свободному.
+        """
+        error: typing.Final = Guard.against_null(order, "order")
+        if error is not None:
+            return Result.failure(error)
+
+        best_free: typing.Final = min(
+            (
+                (courier.calculate_time_to_location(order.location), courier)
+                for courier in free_couriers
+                if courier.can_take_order(order.volume.value)
+            ),
+            key=lambda candidate: candidate[0],
+            default=None,
+        )
+
+        travel_time_table: typing.Final = get_travel_time_table()
+        best_busy: tuple[int, Courier] | None = None
+        for delivery in busy_deliveries:
+            courier = delivery.courier
+            if not self._can_take_after_delivery(courier, delivery.order, order.volume.value):
+                continue
+
+            time = courier.calculate_time_to_location(delivery.order.location) + travel_time_table.steps(
+                courier.speed, delivery.order.location, order.location
+            )
+            if best_busy is None or time < best_busy[0]:
+                best_busy = (time, courier)
+
+        if best_busy is not None and (best_free is None or best_busy[0] < best_free[0]):
+            return Result.success(OrderAssignment(order=order, courier=best_busy[1], is_reservation=True))
+
+        if best_free is None:
+            return Result.failure(
+                Error.of(
+                    "order.dispatch.no.suitable.courier",
+                    f"No suitable courier found for order {order.id} with volume {order.volume.value}",
+                )
+            )
+
+        return Result.success(OrderAssignment(order=order, courier=best_free[1]))
+
+    @staticmethod
+    def _can_take_after_delivery(courier: Courier, delivered_order: Order, order_volume: int) -> bool:
+        return any(
+            order_volume <= place.total_volume and (not place.is_occupied() or place.order_id == delivered_order.id)
+            for place in courier.storage_places
+        )
+
+    def dispatch_orders(
+        self,
+        orders: list[Order],
+        couriers: list[Courier],
+    ) -> Result[list[OrderAssignment], Error]:
+        error: typing.Final = Guard.combine(
+            Guard.against_null_or_empty_collection(orders, "orders"),
+            Guard.against_null_or_empty_collection(couriers, "couriers"),
+        )
+        if error is not None:
+            return Result.failure(error)
+
+        # Оптимальное назначение всегда можно собрать только из len(orders) ближайших
+        # к каждому заказу курьеров, поэтому остальной парк в матрицу не попадает
+        index: typing.Final = CourierSpatialIndex(couriers)
+        candidate_ids: typing.Final = {
+            courier.id
+            for order in orders
+            for courier in index.find_nearest(order.location, order.volume.value, limit=len(orders))
+        }
+        candidates: typing.Final = [courier for courier in couriers if courier.id in candidate_ids]
+        if not candidates:
+            return Result.failure(
+                Error.of(
+                    "order.dispatch.no.suitable.courier",
+                    f"No suitable courier found for any of {len(orders)} orders",
+                )
+            )
+
+        times: typing.Final[list[list[int | None]]] = [
+            [
+                courier.calculate_time_to_location(order.location)
+                if courier.can_take_order(order.volume.value)
+                else None
+                for courier in candidates
+            ]
+            for order in orders
+        ]
+
+        known_times: typing.Final = [time for row in times for time in row if time is not None]
+
+        # Стоимость недопустимой пары больше суммы любых допустимых, поэтому
+        # решение сначала максимизирует число назначений, а затем минимизирует суммарное время
+        unreachable_cost: typing.Final = (max(known_times) + 1) * len(orders)
+        costs: typing.Final = [[unreachable_cost if time is None else time for time in row] for row in times]
+
+        assignments: typing.Final = [
+            OrderAssignment(order=orders[order_index], courier=candidates[courier_index])
+            for order_index, courier_index in solve_min_cost_matching(costs)
+            if times[order_index][courier_index] is not None
+        ]
+
+        return Result.success(assignments)
+
+    def dispatch_orders_by_capacity(
+        self,
+        orders: list[Order],
+        couriers: list[Courier],
+    ) -> Result[list[OrderAssignment], Error]:
+        """Раскладывает заказы по свободным местам хранения, в том числе у частично загруженных курьеров.
+
+        Заказы обрабатываются по убыванию объёма. Каждому достаётся курьер с минимальным временем
+        до заказа, а при равенстве тот, у кого подходящее место меньше (best-fit, как в Courier.take_order).
+        Назначения возвращаются в порядке обработки: если применять take_order в этом же порядке,
+        курьеры займут ровно те места, которые были зарезервированы здесь.
+        """
+        error: typing.Final = Guard.combine(
+            Guard.against_null_or_empty_collection(orders, "orders"),
+            Guard.against_null_or_empty_collection(couriers, "couriers"),
+        )
+        if error is not None:
+            return Result.failure(error)
+
+        free_volumes: typing.Final = [
+            sorted(place.total_volume for place in courier.storage_places if not place.is_occupied())
+            for courier in couriers
+        ]
+
+        assignments: typing.Final[list[OrderAssignment]] = []
+        for order in sorted(orders, key=lambda order: order.volume.value, reverse=True):
+            best: tuple[int, int, int] | None = None
+            for position, courier in enumerate(couriers):
+                volumes = free_volumes[position]
+                fit_index = bisect.bisect_left(volumes, order.volume.value)
+                if fit_index == len(volumes):
+                    continue
+
+                candidate = (courier.calculate_time_to_location(order.location), volumes[fit_index], position)
+                if best is None or candidate < best:
+                    best = candidate
+
+            if best is None:
+                continue
+
+            _, fit_volume, position = best
+            free_volumes[position].remove(fit_volume)
+            assignments.append(OrderAssignment(order=order, courier=couriers[position]))
+
+        if not assignments:
+            return Result.failure(
+                Error.of(
+                    "order.dispatch.no.suitable.courier",
+                    f"No suitable courier found for any of {len(orders)} orders",
+                )
+            )
+
+        return Result.success(assignments)
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from delivery.core.domain.model.kernel import Location
+
+
+class CourierPositionBuffer(ABC):
+    @abstractmethod
+    def get_location(self, courier_id: UUID) -> Location | None: ...
+
+    @abstractmethod
+    def set_location(self, courier_id: UUID, location: Location) -> None: ...
+
+    @abstractmethod
+    async def complete_tick(self, force_flush: bool = False) -> None: ...
+
+    @abstractmethod
+    async def flush(self) -> None: ...
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Collection
 from uuid import UUID
 
 from delivery.core.domain.model.courier.courier import Courier
@@ -9,10 +10,31 @@ class CourierRepository(ABC):
     async def add(self, courier: Courier) -> None: ...
 
     @abstractmethod
-    async def update(self, courier: Courier) -> None: ...
+    async def update_many(self, couriers: Collection[Courier]) -> None: ...
+
+    @abstractmethod
+    def mark_persisted(self, courier: Courier) -> None:
+        """Принимает текущее состояние курьера за сохранённое, например когда позицию записывает буфер."""
+
+    @abstractmethod
+    def tracked(self) -> list[Courier]:
+        """Курьеры, загруженные или добавленные в этой транзакции."""
+
+    @abstractmethod
+    async def flush_changes(self) -> None:
+        """Пишет курьеров, изменившихся с момента загрузки."""
 
     @abstractmethod
     async def get_by_id(self, courier_id: UUID) -> Courier | None: ...
 
+    @abstractmethod
+    async def claim_by_id(self, courier_id: UUID) -> Courier | None: ...
+
+    @abstractmethod
+    async def get_all_by_ids(self, courier_ids: Collection[UUID]) -> list[Courier]: ...
+
     @abstractmethod
     async def get_all_free(self) -> list[Courier]: ...
+
+    @abstractmethod
+    async def get_all_with_free_capacity(self, volume: int) -> list[Courier]: ...
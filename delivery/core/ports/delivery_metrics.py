@@ -0,0 +1,9 @@
+from abc import ABC, abstractmethod
+
+
+class DeliveryMetrics(ABC):
+    @abstractmethod
+    def record_missed_delivery_windows(self, count: int) -> None: ...
+
+    @abstractmethod
+    def record_tick_stage_duration(self, stage: str, seconds: float) -> None: ...
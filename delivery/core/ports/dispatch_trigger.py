@@ -0,0 +1,6 @@
+from abc import ABC, abstractmethod
+
+
+class DispatchTrigger(ABC):
+    @abstractmethod
+    def notify(self) -> None: ...
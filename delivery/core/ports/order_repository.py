@@ -1,4 +1,6 @@
+import datetime as dt
 from abc import ABC, abstractmethod
+from collections.abc import Collection
 from uuid import UUID
 
 from delivery.core.domain.model.order.order import Order
@@ -9,7 +11,16 @@ class OrderRepository(ABC):
     async def add(self, order: Order) -> None: ...
 
     @abstractmethod
-    async def update(self, order: Order) -> None: ...
+    async def update_many(self, orders: Collection[Order]) -> int:
+        """Возвращает число обновлённых строк: заказы, которые уже изменила другая транзакция, не считаются."""
+
+    @abstractmethod
+    def tracked(self) -> list[Order]:
+        """Заказы, загруженные или добавленные в этой транзакции."""
+
+    @abstractmethod
+    async def flush_changes(self) -> None:
+        """Пишет заказы, изменившиеся с момента загрузки; падает, если часть из них уже изменила другая транзакция."""
 
     @abstractmethod
     async def get_by_id(self, order_id: UUID) -> Order | None: ...
@@ -17,5 +28,20 @@ class OrderRepository(ABC):
     @abstractmethod
     async def get_first_by_status_created(self) -> Order | None: ...
 
+    @abstractmethod
+    async def get_all_by_status_created(self, limit: int) -> list[Order]: ...
+
+    @abstractmethod
+    async def claim_all_created(self, limit: int) -> list[Order]: ...
+
     @abstractmethod
     async def get_all_assigned(self) -> list[Order]: ...
+
+    @abstractmethod
+    async def get_all_assigned_by_courier_ids(self, courier_ids: Collection[UUID]) -> list[Order]: ...
+
+    @abstractmethod
+    async def get_all_arrived(self, moment: dt.datetime) -> list[Order]: ...
+
+    @abstractmethod
+    async def get_all_unscheduled(self) -> list[Order]: ...
@@ -12,12 +12,25 @@ from delivery.libs.ddd import DomainEventPublisher
 from delivery.settings import settings
 
 
+@dataclasses.dataclass(slots=True)
+class _UnitOfWorkState:
+    discarded: bool = False
+
+
 @dataclasses.dataclass(frozen=True, kw_only=True, slots=True)
 class DeliveryUnitOfWork:
     order: OrderRepository
     courier: CourierRepository
     outbox: OutboxRepository
     domain_event_publisher: DomainEventPublisher
+    _state: _UnitOfWorkState = dataclasses.field(default_factory=_UnitOfWorkState)
+
+    def discard(self) -> None:
+        """Отменяет единицу работы: при выходе изменения агрегатов откатываются, а не сохраняются.
+
+        Обработчик вызывает его, прежде чем вернуть ошибку после того, как уже изменил агрегаты.
+        """
+        self._state.discarded = True
 
     @classmethod
     @contextlib.asynccontextmanager
@@ -45,12 +58,23 @@ class DeliveryUnitOfWork:
                 outbox_repo: typing.Final = OutboxRepositoryImpl(session=session)
                 publisher: typing.Final = OutboxDomainEventPublisher(outbox_repo)
 
-                yield cls(
+                unit_of_work: typing.Final = cls(
                     order=order_repo,
                     courier=courier_repo,
                     outbox=outbox_repo,
                     domain_event_publisher=publisher,
                 )
+                yield unit_of_work
+
+                if unit_of_work._state.discarded:  # noqa: SLF001
+                    await session.rollback()
+                    return
+
+                # Обработчики не сохраняют агрегаты сами: изменившиеся пишутся пачкой на таблицу перед коммитом
+                await order_repo.flush_changes()
+                await courier_repo.flush_changes()
+                # События попадают в outbox вместе с изменениями, даже если обработчик не опубликовал их сам
+                await publisher.publish([*order_repo.tracked(), *courier_repo.tracked()])
             except Exception:
                 await session.rollback()
                 raise
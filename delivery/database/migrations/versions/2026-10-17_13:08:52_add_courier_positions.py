@@ -0,0 +1,51 @@
+"""add courier positions.
+
+Revision: 8a4f0c2d9b13
+Revises: 5d31a8c7e6f2
+Creation Date: 2026-10-17 13:08:52.604117
+
+"""  # noqa: N999
+
+import typing
+
+import sqlalchemy
+from alembic import op as alembic_operations
+
+
+revision: typing.Final = "8a4f0c2d9b13"
+down_revision: typing.Final = "5d31a8c7e6f2"
+branch_labels: typing.Final = None
+depends_on: typing.Final = None
+
+# Запас свободного места на странице, чтобы новая версия строки позиции помещалась рядом со старой (HOT update)
+COURIER_POSITIONS_FILLFACTOR: typing.Final = 70
+
+
+def upgrade() -> None:
+    alembic_operations.create_table(
+        "courier_positions",
+        sqlalchemy.Column("courier_id", sqlalchemy.Uuid(), nullable=False),
+        sqlalchemy.Column("location_x", sqlalchemy.Integer(), nullable=False),
+        sqlalchemy.Column("location_y", sqlalchemy.Integer(), nullable=False),
+        sqlalchemy.ForeignKeyConstraint(["courier_id"], ["couriers.id"], ondelete="CASCADE"),
+        sqlalchemy.PrimaryKeyConstraint("courier_id"),
+    )
+    alembic_operations.execute(f"ALTER TABLE courier_positions SET (fillfactor = {COURIER_POSITIONS_FILLFACTOR})")
+    alembic_operations.execute(
+        "INSERT INTO courier_positions (courier_id, location_x, location_y) "
+        "SELECT id, location_x, location_y FROM couriers"
+    )
+    alembic_operations.drop_column("couriers", "location_y")
+    alembic_operations.drop_column("couriers", "location_x")
+
+
+def downgrade() -> None:
+    alembic_operations.add_column("couriers", sqlalchemy.Column("location_x", sqlalchemy.Integer(), nullable=True))
+    alembic_operations.add_column("couriers", sqlalchemy.Column("location_y", sqlalchemy.Integer(), nullable=True))
+    alembic_operations.execute(
+        "UPDATE couriers SET location_x = positions.location_x, location_y = positions.location_y "
+        "FROM courier_positions AS positions WHERE positions.courier_id = couriers.id"
+    )
+    alembic_operations.alter_column("couriers", "location_x", nullable=False)
+    alembic_operations.alter_column("couriers", "location_y", nullable=False)
+    alembic_operations.drop_table("courier_positions")
@@ -7,7 +7,13 @@ import sqlalchemy.orm
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
-class BaseServiceModel(DeclarativeBase):
+class BaseModel(DeclarativeBase):
+    pass
+
+
+class BaseServiceModel(BaseModel):
+    __abstract__ = True
+
     publishing_datetime: Mapped[datetime.datetime] = mapped_column(
         sqlalchemy.types.DateTime, server_default=sqlalchemy.text("CURRENT_DATE"), nullable=True
     )
@@ -28,6 +34,10 @@ class BaseServiceModel(DeclarativeBase):
 
 class OrderModel(BaseServiceModel):
     __tablename__ = "orders"
+    __table_args__ = (
+        sqlalchemy.Index("ix_orders_status_delivery_period_end", "status", "delivery_period_end"),
+        sqlalchemy.Index("ix_orders_status_estimated_arrival_at", "status", "estimated_arrival_at"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(sqlalchemy.types.Uuid, primary_key=True)
     location_x: Mapped[int]
@@ -35,6 +45,16 @@ class OrderModel(BaseServiceModel):
     volume: Mapped[int]
     status: Mapped[str]
     courier_id: Mapped[uuid.UUID | None] = mapped_column(sqlalchemy.types.Uuid, nullable=True)
+    reserved_courier_id: Mapped[uuid.UUID | None] = mapped_column(sqlalchemy.types.Uuid, nullable=True)
+    delivery_period_start: Mapped[datetime.datetime | None] = mapped_column(
+        sqlalchemy.types.DateTime(timezone=True), nullable=True
+    )
+    delivery_period_end: Mapped[datetime.datetime | None] = mapped_column(
+        sqlalchemy.types.DateTime(timezone=True), nullable=True
+    )
+    estimated_arrival_at: Mapped[datetime.datetime | None] = mapped_column(
+        sqlalchemy.types.DateTime(timezone=True), nullable=True
+    )
 
 
 class StoragePlaceModel(BaseServiceModel):
@@ -51,14 +71,33 @@ class StoragePlaceModel(BaseServiceModel):
     order_id: Mapped[uuid.UUID | None] = mapped_column(sqlalchemy.types.Uuid, nullable=True)
 
 
+class CourierPositionModel(BaseModel):
+    # Позиция меняется каждый тик, поэтому живёт в узкой таблице без служебных колонок и индексов по координатам:
+    # так обновления остаются HOT, а fillfactor задан в миграции
+    __tablename__ = "courier_positions"
+
+    courier_id: Mapped[uuid.UUID] = mapped_column(
+        sqlalchemy.types.Uuid,
+        sqlalchemy.ForeignKey("couriers.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    location_x: Mapped[int]
+    location_y: Mapped[int]
+
+
 class CourierModel(BaseServiceModel):
     __tablename__ = "couriers"
 
     id: Mapped[uuid.UUID] = mapped_column(sqlalchemy.types.Uuid, primary_key=True)
     name: Mapped[str]
     speed: Mapped[int]
-    location_x: Mapped[int]
-    location_y: Mapped[int]
+    position: Mapped[CourierPositionModel] = relationship(
+        CourierPositionModel,
+        lazy="joined",
+        innerjoin=True,
+        uselist=False,
+        cascade="all, delete-orphan",
+    )
     storage_places: Mapped[list[StoragePlaceModel]] = relationship(
         StoragePlaceModel,
         lazy="selectin",
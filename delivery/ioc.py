@@ -1,3 +1,6 @@
+import contextlib
+import datetime as dt
+import functools
 import typing
 
 import psycopg
@@ -8,20 +11,33 @@ from faststream.kafka import KafkaBroker
 from that_depends import ContextScopes, providers
 
 from delivery.adapters.input.kafka.basket_events_consumer import BasketEventsConsumer
+from delivery.adapters.input.scheduler.dispatch_trigger import InProcessDispatchTrigger
 from delivery.adapters.input.scheduler.jobs.outbox_job import OutboxJob
 from delivery.adapters.out.grps.geo_client_impl import GeoClientImpl
 from delivery.adapters.out.kafka.order_events_producer import OrderEventsProducerImpl
+from delivery.adapters.out.postgres.courier_position_buffer import WriteBehindCourierPositionBuffer
 from delivery.adapters.out.postgres.courier_repository import CourierRepositoryImpl
 from delivery.adapters.out.postgres.order_repository import OrderRepositoryImpl
 from delivery.adapters.out.postgres.outbox_domain_event_publisher import OutboxDomainEventPublisher
 from delivery.adapters.out.postgres.outbox_repository import OutboxRepositoryImpl
+from delivery.adapters.out.prometheus.delivery_metrics import PrometheusDeliveryMetrics
 from delivery.core.application.commands.assign_order_to_courier import AssignOrderToCourierCommandHandlerImpl
 from delivery.core.application.commands.create_courier import CreateCourierCommandHandlerImpl
 from delivery.core.application.commands.create_order import CreateOrderCommandHandlerImpl
-from delivery.core.application.commands.move_couriers import MoveCouriersCommandHandlerImpl
+from delivery.core.application.commands.move_couriers import (
+    EtaMoveCouriersCommandHandlerImpl,
+    MoveCouriersCommandHandlerImpl,
+    SetBasedMoveCouriersCommandHandlerImpl,
+)
+from delivery.core.application.commands.rebalance_couriers import RebalanceCouriersCommandHandlerImpl
+from delivery.core.application.commands.run_delivery_tick import RunDeliveryTickCommandHandlerImpl
 from delivery.core.application.queries.get_all_couriers import GetAllCouriersQueryHandlerImpl
 from delivery.core.application.queries.get_all_incomplete_orders import GetAllIncompleteOrdersQueryHandlerImpl
+from delivery.core.application.queries.get_demand_heatmap import GetDemandHeatmapQueryHandlerImpl
 from delivery.core.application.services.kafka_consumer_resolver import KafkaConsumerResolver
+from delivery.core.domain.service.courier_route_planner import CourierRoutePlanner
+from delivery.core.domain.service.demand_heatmap import DemandHeatmap
+from delivery.core.domain.service.dispatch_strategy import DispatchStrategyRegistry
 from delivery.core.domain.service.order_dispatch_service import OrderDispatchDomainService
 from delivery.event_publisher import DefaultDomainEventPublisher
 from delivery.settings import settings
@@ -43,6 +59,13 @@ async def create_database_session(database_engine: sa_async.AsyncEngine) -> typi
         yield session
 
 
+def create_database_session_factory(
+    database_engine: sa_async.AsyncEngine,
+) -> typing.Callable[[], contextlib.AbstractAsyncContextManager[sa_async.AsyncSession]]:
+    # Для обработчиков, которым на каждый запуск нужна своя сессия, а не общая на всё приложение
+    return functools.partial(contextlib.asynccontextmanager(create_database_session), database_engine)
+
+
 def create_kafka_broker() -> KafkaBroker:
     broker: typing.Final = KafkaBroker(
         bootstrap_servers=settings.kafka_bootstrap_servers,
@@ -55,10 +78,33 @@ class IOCContainer(that_depends.BaseContainer):
 
     main_database_engine = providers.Resource(create_database_engine)
     main_database_session = providers.ContextResource(create_database_session, main_database_engine.cast)
+    database_session_factory = providers.Factory(create_database_session_factory, main_database_engine.cast)
     replica_database_engine = providers.Resource(create_database_engine)
     replica_database_session = providers.ContextResource(create_database_session, replica_database_engine.cast)
 
     order_dispatch_service = providers.Factory(OrderDispatchDomainService)
+    dispatch_strategy = providers.Factory(
+        DispatchStrategyRegistry.create,
+        settings.dispatch_strategy,
+        order_dispatch_service.cast,
+    )
+    dispatch_trigger = providers.Singleton(InProcessDispatchTrigger)
+    delivery_metrics = providers.Singleton(PrometheusDeliveryMetrics)
+    courier_position_buffer = providers.Selector(
+        lambda: "write_behind" if settings.courier_position_flush_interval_ticks > 1 else "write_through",
+        write_behind=providers.Singleton(
+            WriteBehindCourierPositionBuffer,
+            main_database_engine.cast,
+            settings.courier_position_flush_interval_ticks,
+            settings.courier_position_max_unflushed,
+        ),
+        write_through=providers.Object(None),
+    )
+    courier_route_planner = providers.Singleton(CourierRoutePlanner)
+    demand_heatmap = providers.Singleton(
+        DemandHeatmap,
+        dt.timedelta(seconds=settings.demand_heatmap_half_life_seconds),
+    )
 
     geo_location_client = providers.Factory(
         GeoClientImpl,
@@ -80,13 +126,37 @@ class IOCContainer(that_depends.BaseContainer):
     create_order_handler = providers.Factory(
         CreateOrderCommandHandlerImpl,
         geo_location_client.cast,
+        dispatch_trigger.cast,
+        demand_heatmap.cast,
     )
-    move_couriers_handler = providers.Factory(
-        MoveCouriersCommandHandlerImpl,
+    move_couriers_handler = providers.Selector(
+        settings.courier_movement_mode,
+        domain=providers.Factory(
+            MoveCouriersCommandHandlerImpl,
+            dispatch_trigger.cast,
+            delivery_metrics.cast,
+            courier_position_buffer.cast,
+            courier_route_planner.cast,
+        ),
+        sql=providers.Factory(
+            SetBasedMoveCouriersCommandHandlerImpl,
+            database_session_factory.cast,
+            dispatch_trigger.cast,
+            delivery_metrics.cast,
+        ),
+        eta=providers.Factory(
+            EtaMoveCouriersCommandHandlerImpl,
+            dispatch_trigger.cast,
+            delivery_metrics.cast,
+        ),
     )
     assign_order_to_courier_handler = providers.Factory(
         AssignOrderToCourierCommandHandlerImpl,
         order_dispatch_service.cast,
+        settings.dispatch_batch_size,
+        dispatch_strategy.cast,
+        settings.dispatch_lookahead,
+        settings.courier_movement_mode == "eta",
     )
     get_all_couriers_handler = providers.Factory(
         GetAllCouriersQueryHandlerImpl,
@@ -96,11 +166,20 @@ class IOCContainer(that_depends.BaseContainer):
         GetAllIncompleteOrdersQueryHandlerImpl,
         main_database_session.cast,
     )
+    get_demand_heatmap_handler = providers.Factory(
+        GetDemandHeatmapQueryHandlerImpl,
+        demand_heatmap.cast,
+    )
 
     app_main_database_session = providers.Resource(create_database_session, main_database_engine.cast)
     app_order_repository = providers.Factory(OrderRepositoryImpl, app_main_database_session.cast)
     app_courier_repository = providers.Factory(CourierRepositoryImpl, app_main_database_session.cast)
     app_order_dispatch_service = providers.Factory(OrderDispatchDomainService)
+    app_dispatch_strategy = providers.Factory(
+        DispatchStrategyRegistry.create,
+        settings.dispatch_strategy,
+        app_order_dispatch_service.cast,
+    )
     app_outbox_repository = providers.Factory(OutboxRepositoryImpl, app_main_database_session.cast)
     app_outbox_domain_event_publisher = providers.Factory(OutboxDomainEventPublisher, app_outbox_repository.cast)
     app_domain_event_publisher = providers.Singleton(DefaultDomainEventPublisher)
@@ -108,9 +187,74 @@ class IOCContainer(that_depends.BaseContainer):
     app_assign_order_to_courier_handler = providers.Factory(
         AssignOrderToCourierCommandHandlerImpl,
         app_order_dispatch_service.cast,
+        settings.dispatch_batch_size,
+        app_dispatch_strategy.cast,
+        settings.dispatch_lookahead,
+        settings.courier_movement_mode == "eta",
     )
-    app_move_couriers_handler = providers.Factory(
+    app_move_couriers_handler = providers.Selector(
+        settings.courier_movement_mode,
+        domain=providers.Factory(
+            MoveCouriersCommandHandlerImpl,
+            dispatch_trigger.cast,
+            delivery_metrics.cast,
+            courier_position_buffer.cast,
+            courier_route_planner.cast,
+        ),
+        sql=providers.Factory(
+            SetBasedMoveCouriersCommandHandlerImpl,
+            database_session_factory.cast,
+            dispatch_trigger.cast,
+            delivery_metrics.cast,
+        ),
+        eta=providers.Factory(
+            EtaMoveCouriersCommandHandlerImpl,
+            dispatch_trigger.cast,
+            delivery_metrics.cast,
+        ),
+    )
+    # Назначение идёт в том же тике, поэтому будить воркеры диспетчеризации незачем
+    app_delivery_tick_domain_move_couriers_handler = providers.Factory(
         MoveCouriersCommandHandlerImpl,
+        None,
+        delivery_metrics.cast,
+        courier_position_buffer.cast,
+        courier_route_planner.cast,
+    )
+    app_delivery_tick_move_couriers_handler = providers.Selector(
+        settings.courier_movement_mode,
+        domain=app_delivery_tick_domain_move_couriers_handler,
+        sql=providers.Factory(
+            SetBasedMoveCouriersCommandHandlerImpl,
+            database_session_factory.cast,
+            None,
+            delivery_metrics.cast,
+        ),
+        eta=providers.Factory(
+            EtaMoveCouriersCommandHandlerImpl,
+            None,
+            delivery_metrics.cast,
+        ),
+    )
+    # Только доменное движение умеет работать в общей с назначением единице работы
+    app_delivery_tick_fleet_move_handler = providers.Selector(
+        settings.courier_movement_mode,
+        domain=app_delivery_tick_domain_move_couriers_handler,
+        sql=providers.Object(None),
+        eta=providers.Object(None),
+    )
+    app_delivery_tick_handler = providers.Factory(
+        RunDeliveryTickCommandHandlerImpl,
+        app_delivery_tick_move_couriers_handler.cast,
+        app_assign_order_to_courier_handler.cast,
+        delivery_metrics.cast,
+        fleet_move_handler=app_delivery_tick_fleet_move_handler.cast,
+    )
+    app_rebalance_couriers_handler = providers.Factory(
+        RebalanceCouriersCommandHandlerImpl,
+        settings.courier_rebalancing_moves_per_tick,
+        courier_position_buffer.cast,
+        demand_heatmap.cast,
     )
 
     outbox_job = providers.Factory(
@@ -4,9 +4,12 @@ import typing
 
 import fastapi
 
-from delivery.adapters.input.scheduler import create_scheduler
+from delivery.adapters.input.scheduler import AssignOrdersJob, DispatchWorker, RunningJobs, create_scheduler
+from delivery.adapters.out.postgres.demand_heatmap_loader import restore_demand_heatmap
+from delivery.core.domain.model.travel_time import get_travel_time_table
 from delivery.ioc import IOCContainer
 from delivery.kafka import setup_kafka_broker
+from delivery.settings import settings
 
 
 logger = logging.getLogger(__name__)
@@ -14,17 +17,42 @@ logger = logging.getLogger(__name__)
 
 @contextlib.asynccontextmanager
 async def run_lifespan(application: fastapi.FastAPI) -> typing.AsyncIterator[None]:
+    # Таблицы времени в пути строятся один раз до первой диспетчеризации, а не на горячем пути
+    get_travel_time_table()
+    # Тепловая карта живёт в памяти, поэтому после рестарта недавний спрос восстанавливается из базы
+    await restore_demand_heatmap(await IOCContainer.main_database_engine(), await IOCContainer.demand_heatmap())
+
     assign_orders_handler: typing.Final = await IOCContainer.app_assign_order_to_courier_handler()
     move_couriers_handler: typing.Final = await IOCContainer.app_move_couriers_handler()
     outbox_repository: typing.Final = await IOCContainer.app_outbox_repository()
     order_events_producer: typing.Final = await IOCContainer.order_events_producer()
+    dispatch_trigger: typing.Final = await IOCContainer.dispatch_trigger()
+    courier_position_buffer: typing.Final = await IOCContainer.courier_position_buffer()
+    delivery_tick_handler: typing.Final = (
+        await IOCContainer.app_delivery_tick_handler() if settings.delivery_tick_enabled else None
+    )
+    rebalance_couriers_handler: typing.Final = (
+        await IOCContainer.app_rebalance_couriers_handler() if settings.courier_rebalancing_enabled else None
+    )
+
+    # Воркеры делят один триггер, а заказы и курьеров разбирают через FOR UPDATE SKIP LOCKED.
+    # В режиме единого тика заказы назначает сам тик, и воркеры не нужны
+    dispatch_workers: typing.Final = [
+        DispatchWorker(AssignOrdersJob(assign_orders_handler), dispatch_trigger)
+        for _ in range(0 if delivery_tick_handler is not None else settings.dispatch_worker_count)
+    ]
+    for dispatch_worker in dispatch_workers:
+        dispatch_worker.start()
 
     scheduler: typing.Final = create_scheduler(
-        assign_orders_handler,
+        dispatch_trigger,
         move_couriers_handler,
         outbox_repository,
         order_events_producer,
+        rebalance_couriers_handler=rebalance_couriers_handler,
+        delivery_tick_handler=delivery_tick_handler,
     )
+    running_jobs: typing.Final = RunningJobs(scheduler)
     scheduler.start()
 
     kafka_broker: typing.Final = await IOCContainer.kafka_broker()
@@ -35,6 +63,13 @@ async def run_lifespan(application: fastapi.FastAPI) -> typing.AsyncIterator[Non
     try:
         yield
     finally:
+        # Начатые тики дожидаются до shutdown, который их отменяет, чтобы последний сброс буфера видел все позиции
+        await running_jobs.drain()
         scheduler.shutdown()
+        # Позиции, накопленные в режиме отложенной записи, сохраняются до закрытия пула соединений
+        if courier_position_buffer is not None:
+            await courier_position_buffer.flush()
+        for dispatch_worker in dispatch_workers:
+            await dispatch_worker.stop()
         await kafka_broker.close()
         await IOCContainer.tear_down()
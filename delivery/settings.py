@@ -23,6 +23,34 @@ class Settings(microbootstrap.FastApiSettings):
     kafka_baskets_events_topic: str = "baskets.events"
     kafka_orders_events_topic: str = "orders.events"
 
+    # Dispatch settings
+    dispatch_batch_size: int = 50
+    # greedy_nearest, batch_matching или capacity_aware, см. DispatchStrategyRegistry
+    dispatch_strategy: str = "batch_matching"
+    dispatch_lookahead: bool = False
+    dispatch_worker_count: int = 1
+    assign_orders_safety_interval_seconds: int = 10
+
+    # Movement settings
+    # domain - шаг через агрегаты, sql - набором запросов внутри Postgres для больших парков,
+    # eta - завершение заказов по расчётному времени прибытия, назначенному диспетчером
+    courier_movement_mode: str = "domain"
+    # Отложенная запись позиций в режиме domain: 1 - писать каждый тик, N > 1 - раз в N тиков, при завершении
+    # заказов и при остановке. Не более N тиков или max_unflushed позиций теряется при падении процесса
+    courier_position_flush_interval_ticks: int = 1
+    courier_position_max_unflushed: int = 10_000
+    # Движение, завершение и назначение одним тиком вместо отдельных задач и воркеров диспетчеризации.
+    # В режиме domain всё идёт одной транзакцией, в режимах sql и eta назначение следует за коммитом движения
+    delivery_tick_enabled: bool = False
+
+    # Rebalancing settings
+    # Свободные курьеры шагают к клеткам с наибольшим числом открытых заказов, не больше moves_per_tick за запуск
+    courier_rebalancing_enabled: bool = False
+    courier_rebalancing_interval_seconds: int = 1
+    courier_rebalancing_moves_per_tick: int = 10
+    # Период полураспада веса заказа в тепловой карте спроса
+    demand_heatmap_half_life_seconds: int = 900
+
     # gRPC settings
     geo_service_grpc_host: str = "0.0.0.0"
     geo_service_grpc_port: int = 5004
@@ -0,0 +1,24 @@
+import datetime as dt
+import typing
+
+import pytest
+
+from delivery.adapters.input.http.controllers.get_demand_heatmap_controller import get_demand_heatmap
+from delivery.core.application.queries.get_demand_heatmap import GetDemandHeatmapQueryHandlerImpl
+from delivery.core.domain.model.kernel import Location
+from delivery.core.domain.service.demand_heatmap import DemandHeatmap
+
+
+class TestGetDemandHeatmapController:
+    @pytest.mark.anyio
+    async def test_get_demand_heatmap_returns_grid(self) -> None:
+        demand_heatmap: typing.Final = DemandHeatmap(dt.timedelta(minutes=15))
+        demand_heatmap.record(Location.must_create(2, 7), dt.datetime.now(dt.UTC))
+
+        result: typing.Final = await get_demand_heatmap(handler=GetDemandHeatmapQueryHandlerImpl(demand_heatmap))
+
+        assert result.grid_size == 10
+        assert len(result.cells) == 10
+        assert all(len(row) == 10 for row in result.cells)
+        assert result.cells[1][6] == pytest.approx(1.0, abs=1e-3)
+        assert sum(map(sum, result.cells)) == pytest.approx(1.0, abs=1e-3)
@@ -0,0 +1,39 @@
+import typing
+import uuid
+
+from delivery.adapters.input.kafka import baskets_events_pb2 as pb2
+from delivery.adapters.input.kafka.mappers.basket_event_mapper import map_basket_confirmed_to_create_order_command
+
+
+class TestBasketEventMapper:
+    @staticmethod
+    def _create_event(**delivery_period: int) -> typing.Any:  # noqa: ANN401
+        event: typing.Final = pb2.BasketConfirmedIntegrationEvent(basket_id=str(uuid.uuid4()), volume=5)
+        event.address.country = "Россия"
+        event.address.city = "Москва"
+        event.address.street = "Тверская"
+        event.address.house = "1"
+        event.address.apartment = "2"
+        if delivery_period:
+            event.delivery_period.CopyFrom(pb2.DeliveryPeriod(**delivery_period))
+        return event
+
+    def test_maps_delivery_period_on_confirmation_day(self) -> None:
+        result: typing.Final = map_basket_confirmed_to_create_order_command(self._create_event(**{"from": 9, "to": 12}))
+
+        assert result.is_success
+        delivery_period: typing.Final = result.get_value().delivery_period
+        assert delivery_period is not None
+        assert (delivery_period.end - delivery_period.start).total_seconds() == 3 * 60 * 60
+
+    def test_missing_delivery_period_creates_order_without_window(self) -> None:
+        result: typing.Final = map_basket_confirmed_to_create_order_command(self._create_event())
+
+        assert result.is_success
+        assert result.get_value().delivery_period is None
+
+    def test_invalid_delivery_period_creates_order_without_window(self) -> None:
+        result: typing.Final = map_basket_confirmed_to_create_order_command(self._create_event(**{"from": 18, "to": 9}))
+
+        assert result.is_success
+        assert result.get_value().delivery_period is None
@@ -0,0 +1,92 @@
+import asyncio
+import typing
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from delivery.adapters.input.scheduler import AssignOrdersJob, DispatchWorker, InProcessDispatchTrigger
+
+
+class TestDispatchWorker:
+    @pytest.mark.anyio
+    async def test_worker_runs_assign_job_when_notified(self) -> None:
+        trigger: typing.Final = InProcessDispatchTrigger()
+        job_finished: typing.Final = asyncio.Event()
+        assign_orders_job: typing.Final = MagicMock(spec=AssignOrdersJob)
+        assign_orders_job.run = AsyncMock(side_effect=job_finished.set)
+        worker: typing.Final = DispatchWorker(assign_orders_job, trigger)
+
+        worker.start()
+        try:
+            await asyncio.sleep(0)
+            assign_orders_job.run.assert_not_called()
+
+            trigger.notify()
+            await asyncio.wait_for(job_finished.wait(), timeout=1)
+        finally:
+            await worker.stop()
+
+        assign_orders_job.run.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_worker_repeats_job_while_batches_are_full(self) -> None:
+        trigger: typing.Final = InProcessDispatchTrigger()
+        backlog_drained: typing.Final = asyncio.Event()
+        runs: typing.Final = iter([True, True, False])
+
+        async def run_job() -> bool:
+            has_backlog = next(runs)
+            if not has_backlog:
+                backlog_drained.set()
+            return has_backlog
+
+        assign_orders_job: typing.Final = MagicMock(spec=AssignOrdersJob)
+        assign_orders_job.run = AsyncMock(side_effect=run_job)
+        worker: typing.Final = DispatchWorker(assign_orders_job, trigger)
+
+        worker.start()
+        try:
+            await asyncio.sleep(0)
+            trigger.notify()
+            await asyncio.wait_for(backlog_drained.wait(), timeout=1)
+        finally:
+            await worker.stop()
+
+        assert assign_orders_job.run.call_count == 3
+
+    @pytest.mark.anyio
+    async def test_notifications_before_wake_up_are_coalesced(self) -> None:
+        trigger: typing.Final = InProcessDispatchTrigger()
+
+        trigger.notify()
+        trigger.notify()
+        await asyncio.wait_for(trigger.wait(), timeout=1)
+
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(trigger.wait(), timeout=0.01)
+
+    @pytest.mark.anyio
+    async def test_all_workers_sharing_trigger_wake_up(self) -> None:
+        trigger: typing.Final = InProcessDispatchTrigger()
+        workers_count: typing.Final = 3
+        all_started: typing.Final = asyncio.Barrier(workers_count + 1)
+
+        async def run_job() -> bool:
+            await all_started.wait()
+            return False
+
+        assign_orders_job: typing.Final = MagicMock(spec=AssignOrdersJob)
+        assign_orders_job.run = AsyncMock(side_effect=run_job)
+        workers: typing.Final = [DispatchWorker(assign_orders_job, trigger) for _ in range(workers_count)]
+
+        for worker in workers:
+            worker.start()
+        try:
+            await asyncio.sleep(0)
+            trigger.notify()
+            await asyncio.wait_for(all_started.wait(), timeout=1)
+        finally:
+            for worker in workers:
+                await worker.stop()
+
+        assert assign_orders_job.run.call_count == workers_count
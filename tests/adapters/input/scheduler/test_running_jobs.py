@@ -0,0 +1,53 @@
+import asyncio
+import datetime as dt
+import typing
+
+import pytest
+from apscheduler.schedulers.asyncio import AsyncIOScheduler  # type: ignore[import-untyped]
+from apscheduler.triggers.interval import IntervalTrigger  # type: ignore[import-untyped]
+
+from delivery.adapters.input.scheduler import RunningJobs
+
+
+class TestRunningJobs:
+    @pytest.mark.anyio
+    async def test_drain_waits_for_running_job_and_pauses_new_runs(self) -> None:
+        job_started: typing.Final = asyncio.Event()
+        release_job: typing.Final = asyncio.Event()
+        runs: typing.Final[list[str]] = []
+
+        async def run_job() -> None:
+            runs.append("started")
+            job_started.set()
+            await release_job.wait()
+            runs.append("finished")
+
+        scheduler: typing.Final = AsyncIOScheduler()
+        scheduler.add_job(
+            run_job, trigger=IntervalTrigger(seconds=1), next_run_time=dt.datetime.now(dt.UTC), id="test_job"
+        )
+        running_jobs: typing.Final = RunningJobs(scheduler)
+        scheduler.start()
+        try:
+            await asyncio.wait_for(job_started.wait(), timeout=1)
+
+            drain: typing.Final = asyncio.create_task(running_jobs.drain())
+            await asyncio.sleep(0.01)
+            assert not drain.done()
+
+            release_job.set()
+            await asyncio.wait_for(drain, timeout=1)
+        finally:
+            scheduler.shutdown()
+
+        assert runs == ["started", "finished"]
+
+    @pytest.mark.anyio
+    async def test_drain_returns_when_nothing_is_running(self) -> None:
+        scheduler: typing.Final = AsyncIOScheduler()
+        running_jobs: typing.Final = RunningJobs(scheduler)
+        scheduler.start()
+        try:
+            await asyncio.wait_for(running_jobs.drain(), timeout=1)
+        finally:
+            scheduler.shutdown()
@@ -0,0 +1,123 @@
+import typing
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import sqlalchemy.ext.asyncio as sa_async
+
+from delivery.adapters.out.postgres.courier_position_buffer import WriteBehindCourierPositionBuffer
+from delivery.adapters.out.postgres.courier_repository import CourierRepositoryImpl
+from delivery.core.domain.model.courier.courier import Courier
+from delivery.core.domain.model.kernel import Location
+
+
+@pytest.fixture
+def connection() -> MagicMock:
+    connection: typing.Final = MagicMock()
+    connection.execute = AsyncMock()
+    return connection
+
+
+@pytest.fixture
+def engine(connection: MagicMock) -> MagicMock:
+    engine: typing.Final = MagicMock()
+    engine.begin.return_value.__aenter__ = AsyncMock(return_value=connection)
+    engine.begin.return_value.__aexit__ = AsyncMock(return_value=None)
+    return engine
+
+
+class TestWriteBehindCourierPositionBuffer:
+    @pytest.mark.anyio
+    async def test_should_flush_every_interval_in_one_statement(
+        self,
+        engine: MagicMock,
+        connection: MagicMock,
+    ) -> None:
+        buffer: typing.Final = WriteBehindCourierPositionBuffer(engine, flush_interval_ticks=3, max_unflushed=100)
+        first_id: typing.Final = uuid.uuid4()
+        second_id: typing.Final = uuid.uuid4()
+
+        for x in range(1, 4):
+            buffer.set_location(first_id, Location.must_create(x, 1))
+            buffer.set_location(second_id, Location.must_create(1, x))
+            await buffer.complete_tick()
+
+        connection.execute.assert_called_once()
+        parameters: typing.Final = connection.execute.call_args.args[1]
+        positions: typing.Final = dict(
+            zip(parameters["ids"], zip(parameters["xs"], parameters["ys"], strict=True), strict=True)
+        )
+        assert positions == {first_id: (3, 1), second_id: (1, 3)}
+        assert buffer.get_location(first_id) is None
+
+    @pytest.mark.anyio
+    async def test_should_flush_early_when_forced_or_too_many_unflushed(
+        self,
+        engine: MagicMock,
+        connection: MagicMock,
+    ) -> None:
+        buffer: typing.Final = WriteBehindCourierPositionBuffer(engine, flush_interval_ticks=100, max_unflushed=2)
+
+        buffer.set_location(uuid.uuid4(), Location.must_create(1, 1))
+        await buffer.complete_tick(force_flush=True)
+        buffer.set_location(uuid.uuid4(), Location.must_create(1, 1))
+        await buffer.complete_tick()
+        buffer.set_location(uuid.uuid4(), Location.must_create(1, 1))
+        await buffer.complete_tick()
+
+        assert connection.execute.call_count == 2
+
+    @pytest.mark.anyio
+    async def test_should_keep_positions_and_retry_after_failed_flush(
+        self,
+        engine: MagicMock,
+        connection: MagicMock,
+    ) -> None:
+        buffer: typing.Final = WriteBehindCourierPositionBuffer(engine, flush_interval_ticks=1, max_unflushed=100)
+        courier_id: typing.Final = uuid.uuid4()
+        connection.execute.side_effect = [ConnectionError, None]
+
+        buffer.set_location(courier_id, Location.must_create(2, 2))
+        with pytest.raises(ConnectionError):
+            await buffer.complete_tick()
+
+        assert buffer.get_location(courier_id) == Location.must_create(2, 2)
+        await buffer.complete_tick()
+        assert connection.execute.call_args.args[1]["ids"] == [courier_id]
+        assert buffer.get_location(courier_id) is None
+
+    @pytest.mark.anyio
+    async def test_should_not_write_when_nothing_changed(
+        self,
+        engine: MagicMock,
+        connection: MagicMock,
+    ) -> None:
+        buffer: typing.Final = WriteBehindCourierPositionBuffer(engine, flush_interval_ticks=1, max_unflushed=100)
+
+        await buffer.complete_tick()
+        await buffer.flush()
+
+        connection.execute.assert_not_called()
+
+    @pytest.mark.anyio
+    @pytest.mark.usefixtures("_rollback_database")
+    async def test_flush_should_update_courier_rows(self, db_connection: sa_async.AsyncConnection) -> None:
+        courier_repository: typing.Final = CourierRepositoryImpl(
+            sa_async.AsyncSession(db_connection, expire_on_commit=False)
+        )
+        courier: typing.Final = Courier.must_create(name="Test", speed=1, location=Location.must_create(1, 1))
+        await courier_repository.add(courier)
+        engine_on_connection: typing.Final = MagicMock()
+        engine_on_connection.begin.return_value.__aenter__ = AsyncMock(return_value=db_connection)
+        engine_on_connection.begin.return_value.__aexit__ = AsyncMock(return_value=None)
+        buffer: typing.Final = WriteBehindCourierPositionBuffer(
+            engine_on_connection, flush_interval_ticks=2, max_unflushed=100
+        )
+
+        buffer.set_location(courier.id, Location.must_create(7, 3))  # type: ignore[arg-type]
+        await buffer.flush()
+
+        # Свежая сессия, чтобы не получить курьера из identity map первой
+        stored: typing.Final = await CourierRepositoryImpl(sa_async.AsyncSession(db_connection)).get_by_id(courier.id)  # type: ignore[arg-type]
+        assert stored is not None
+        assert stored.location == Location.must_create(7, 3)
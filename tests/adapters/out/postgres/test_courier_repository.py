@@ -2,6 +2,7 @@ import typing
 import uuid
 
 import pytest
+import sqlalchemy
 import sqlalchemy.ext.asyncio as sa_async
 
 from delivery.adapters.out.postgres.courier_repository import CourierRepositoryImpl
@@ -9,6 +10,7 @@ from delivery.core.domain.model.courier.courier import Courier
 from delivery.core.domain.model.kernel import Location, Volume
 from delivery.core.domain.model.order.order import Order
 from delivery.core.ports.courier_repository import CourierRepository
+from delivery.database.models import CourierPositionModel, StoragePlaceModel
 
 
 @pytest.fixture
@@ -56,6 +58,55 @@ class TestCourierRepository:
         assert retrieved.location.y == courier.location.y
         assert len(retrieved.storage_places) == len(courier.storage_places)
 
+    async def test_claim_by_id_returns_courier_with_storage_places(
+        self,
+        courier_repository: CourierRepository,
+    ) -> None:
+        courier: typing.Final = self._create_courier(
+            name="Test Courier",
+            speed=2,
+            location_x=5,
+            location_y=5,
+        )
+        assert courier.add_storage_place("Backpack", 20).is_success
+
+        await courier_repository.add(courier)
+        claimed: typing.Final = await courier_repository.claim_by_id(courier.id)  # type: ignore[arg-type]
+
+        assert claimed is not None
+        assert claimed.id == courier.id
+        assert len(claimed.storage_places) == 2
+
+    async def test_claim_by_id_not_found(
+        self,
+        courier_repository: CourierRepository,
+    ) -> None:
+        claimed: typing.Final = await courier_repository.claim_by_id(uuid.uuid4())
+
+        assert claimed is None
+
+    async def test_get_all_by_ids_returns_requested_couriers_with_storage_places(
+        self,
+        courier_repository: CourierRepository,
+    ) -> None:
+        first: typing.Final = self._create_courier(name="First", speed=1, location_x=1, location_y=1)
+        assert first.add_storage_place("Backpack", 20).is_success
+        second: typing.Final = self._create_courier(name="Second", speed=2, location_x=2, location_y=2)
+        other: typing.Final = self._create_courier(name="Other", speed=3, location_x=3, location_y=3)
+        for courier in [first, second, other]:
+            await courier_repository.add(courier)
+
+        couriers: typing.Final = await courier_repository.get_all_by_ids([first.id, second.id])  # type: ignore[list-item]
+
+        storage_places_by_id: typing.Final = {courier.id: len(courier.storage_places) for courier in couriers}
+        assert storage_places_by_id == {first.id: 2, second.id: 1}
+
+    async def test_get_all_by_ids_with_no_ids(
+        self,
+        courier_repository: CourierRepository,
+    ) -> None:
+        assert await courier_repository.get_all_by_ids([]) == []
+
     async def test_get_by_id_not_found(
         self,
         courier_repository: CourierRepository,
@@ -81,7 +132,7 @@ class TestCourierRepository:
         courier._speed = 20  # noqa: SLF001
         courier._location = Location.must_create(10, 10)  # noqa: SLF001
 
-        await courier_repository.update(courier)
+        await courier_repository.flush_changes()
         retrieved: typing.Final = await courier_repository.get_by_id(courier.id)  # type: ignore[arg-type]
 
         assert retrieved is not None
@@ -107,7 +158,7 @@ class TestCourierRepository:
         extra_storage._name = "Updated Storage"  # noqa: SLF001
         extra_storage._total_volume = 20  # noqa: SLF001
 
-        await courier_repository.update(courier)
+        await courier_repository.flush_changes()
         retrieved: typing.Final = await courier_repository.get_by_id(courier.id)  # type: ignore[arg-type]
 
         assert retrieved is not None
@@ -169,7 +220,7 @@ class TestCourierRepository:
         take_result: typing.Final = occupied_courier.take_order(order.id, Volume.must_create(5))  # type: ignore[arg-type]
         assert take_result.is_success
 
-        await courier_repository.update(occupied_courier)
+        await courier_repository.flush_changes()
 
         free_couriers: typing.Final = await courier_repository.get_all_free()
 
@@ -199,3 +250,187 @@ class TestCourierRepository:
         retrieved: typing.Final = free_couriers[0]
         assert retrieved.id == courier.id
         assert len(retrieved.storage_places) == 2
+
+    async def test_get_all_with_free_capacity_includes_partially_loaded_couriers(
+        self,
+        courier_repository: CourierRepository,
+    ) -> None:
+        partially_loaded: typing.Final = self._create_courier(
+            name="Partially Loaded Courier",
+            speed=10,
+            location_x=1,
+            location_y=1,
+        )
+        assert partially_loaded.add_storage_place("Backpack", 20).is_success
+        fully_loaded: typing.Final = self._create_courier(
+            name="Fully Loaded Courier",
+            speed=10,
+            location_x=2,
+            location_y=2,
+        )
+        small_bag_courier: typing.Final = self._create_courier(
+            name="Small Bag Courier",
+            speed=10,
+            location_x=3,
+            location_y=3,
+        )
+
+        await courier_repository.add(partially_loaded)
+        await courier_repository.add(fully_loaded)
+        await courier_repository.add(small_bag_courier)
+
+        assert partially_loaded.take_order(uuid.uuid4(), Volume.must_create(5)).is_success
+        assert fully_loaded.take_order(uuid.uuid4(), Volume.must_create(5)).is_success
+        await courier_repository.flush_changes()
+
+        couriers: typing.Final = await courier_repository.get_all_with_free_capacity(15)
+
+        assert [courier.id for courier in couriers] == [partially_loaded.id]
+
+    async def test_update_moves_courier_only_in_positions_table(
+        self,
+        db_connection: sa_async.AsyncConnection,
+    ) -> None:
+        session: typing.Final = sa_async.AsyncSession(db_connection, expire_on_commit=False)
+        courier_repository: typing.Final = CourierRepositoryImpl(session)
+        courier: typing.Final = self._create_courier(name="Test Courier", speed=2, location_x=1, location_y=1)
+        await courier_repository.add(courier)
+
+        assert courier.move(Location.must_create(5, 1)).is_success
+        await courier_repository.flush_changes()
+        await session.flush()
+
+        position: typing.Final = (
+            await db_connection.execute(
+                sqlalchemy.select(CourierPositionModel.location_x, CourierPositionModel.location_y).where(
+                    CourierPositionModel.courier_id == courier.id
+                )
+            )
+        ).one()
+        assert tuple(position) == (3, 1)
+
+    async def test_update_many_writes_loaded_couriers(
+        self,
+        courier_repository: CourierRepository,
+    ) -> None:
+        moving: typing.Final = self._create_courier(name="Moving Courier", speed=2, location_x=1, location_y=1)
+        loaded: typing.Final = self._create_courier(name="Loaded Courier", speed=2, location_x=3, location_y=3)
+        await courier_repository.add(moving)
+        await courier_repository.add(loaded)
+
+        couriers: typing.Final = await courier_repository.get_all_by_ids([moving.id, loaded.id])  # type: ignore[list-item]
+        by_id: typing.Final = {courier.id: courier for courier in couriers}
+        assert by_id[moving.id].move(Location.must_create(5, 1)).is_success
+        order_id: typing.Final = uuid.uuid4()
+        assert by_id[loaded.id].take_order(order_id, Volume.must_create(5)).is_success
+
+        await courier_repository.update_many(couriers)
+
+        free_couriers: typing.Final = await courier_repository.get_all_free()
+        retrieved: typing.Final = {
+            courier.id: courier
+            for courier in await courier_repository.get_all_by_ids([moving.id, loaded.id])  # type: ignore[list-item]
+        }
+        assert [courier.id for courier in free_couriers] == [moving.id]
+        assert retrieved[moving.id].location == Location.must_create(3, 1)
+        assert retrieved[loaded.id].storage_places[0].order_id == order_id
+
+    async def test_update_many_writes_only_changed_columns(
+        self,
+        courier_repository: CourierRepository,
+        db_connection: sa_async.AsyncConnection,
+    ) -> None:
+        courier: typing.Final = self._create_courier(name="Test Courier", speed=2, location_x=1, location_y=1)
+        await courier_repository.add(courier)
+        await courier_repository.flush_changes()
+        # Другой писатель успел занять место хранения, пока курьер был загружен
+        order_id: typing.Final = uuid.uuid4()
+        await db_connection.execute(
+            sqlalchemy.update(StoragePlaceModel)
+            .where(StoragePlaceModel.courier_id == courier.id)
+            .values(order_id=order_id)
+        )
+
+        assert courier.move(Location.must_create(5, 1)).is_success
+        await courier_repository.update_many([courier])
+
+        stored: typing.Final = (
+            await db_connection.execute(
+                sqlalchemy.select(
+                    CourierPositionModel.location_x, CourierPositionModel.location_y, StoragePlaceModel.order_id
+                )
+                .join(StoragePlaceModel, StoragePlaceModel.courier_id == CourierPositionModel.courier_id)
+                .where(CourierPositionModel.courier_id == courier.id)
+            )
+        ).one()
+        assert tuple(stored) == (3, 1, order_id)
+
+    async def test_get_all_free_flushes_couriers_changed_in_transaction(
+        self,
+        courier_repository: CourierRepository,
+    ) -> None:
+        courier: typing.Final = self._create_courier(name="Test Courier", speed=2, location_x=1, location_y=1)
+        await courier_repository.add(courier)
+
+        loaded: typing.Final = await courier_repository.get_all_by_ids([courier.id])  # type: ignore[list-item]
+        assert loaded == [courier]
+        assert loaded[0] is courier
+        assert courier.take_order(uuid.uuid4(), Volume.must_create(5)).is_success
+
+        free_couriers: typing.Final = await courier_repository.get_all_free()
+
+        assert free_couriers == []
+
+    async def test_flush_changes_skips_couriers_marked_persisted(
+        self,
+        db_connection: sa_async.AsyncConnection,
+    ) -> None:
+        session: typing.Final = sa_async.AsyncSession(db_connection, expire_on_commit=False)
+        courier_repository: typing.Final = CourierRepositoryImpl(session)
+        courier: typing.Final = self._create_courier(name="Test Courier", speed=2, location_x=1, location_y=1)
+        await courier_repository.add(courier)
+        await session.flush()
+
+        assert courier.move(Location.must_create(5, 1)).is_success
+        courier_repository.mark_persisted(courier)
+        await courier_repository.flush_changes()
+
+        position: typing.Final = (
+            await db_connection.execute(
+                sqlalchemy.select(CourierPositionModel.location_x, CourierPositionModel.location_y).where(
+                    CourierPositionModel.courier_id == courier.id
+                )
+            )
+        ).one()
+        assert tuple(position) == (1, 1)
+
+    async def test_get_all_with_free_capacity_reads_storage_places_in_one_query(
+        self,
+        db_connection: sa_async.AsyncConnection,
+    ) -> None:
+        courier: typing.Final = self._create_courier(name="Test Courier", speed=2, location_x=3, location_y=4)
+        assert courier.add_storage_place("Backpack", 20).is_success
+        order_id: typing.Final = uuid.uuid4()
+        assert courier.take_order(order_id, Volume.must_create(5)).is_success
+        writer: typing.Final = sa_async.AsyncSession(db_connection, expire_on_commit=False)
+        await CourierRepositoryImpl(writer).add(courier)
+        await writer.flush()
+
+        statements: typing.Final[list[str]] = []
+
+        def record(*args: object) -> None:
+            statements.append(typing.cast("str", args[2]))
+
+        reader: typing.Final = CourierRepositoryImpl(sa_async.AsyncSession(db_connection, expire_on_commit=False))
+        sqlalchemy.event.listen(db_connection.sync_connection, "before_cursor_execute", record)
+        try:
+            loaded: typing.Final = await reader.get_all_with_free_capacity(10)
+        finally:
+            sqlalchemy.event.remove(db_connection.sync_connection, "before_cursor_execute", record)
+
+        assert len(statements) == 1
+        assert [loaded_courier.id for loaded_courier in loaded] == [courier.id]
+        assert loaded[0].location == courier.location
+        assert sorted((place.name, place.total_volume, place.order_id) for place in loaded[0].storage_places) == sorted(
+            (place.name, place.total_volume, place.order_id) for place in courier.storage_places
+        )
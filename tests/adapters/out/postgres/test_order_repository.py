@@ -1,14 +1,18 @@
+import datetime as dt
 import typing
 import uuid
 
 import pytest
+import sqlalchemy
 import sqlalchemy.ext.asyncio as sa_async
 
 from delivery.adapters.out.postgres.order_repository import OrderRepositoryImpl
-from delivery.core.domain.model.kernel import Location, Volume
+from delivery.core.domain.model.kernel import DeliveryPeriod, Location, Volume
 from delivery.core.domain.model.order.order import Order
 from delivery.core.domain.model.order.order_status import OrderStatus
 from delivery.core.ports.order_repository import OrderRepository
+from delivery.database.models import OrderModel
+from delivery.libs.errs.error import DomainInvariantError
 
 
 @pytest.fixture
@@ -63,13 +67,130 @@ class TestOrderRepository:
         assign_result: typing.Final = order.assign(courier_id)
         assert assign_result.is_success
 
-        await order_repository.update(order)
+        await order_repository.flush_changes()
         retrieved: typing.Final = await order_repository.get_by_id(order.id)  # type: ignore[arg-type]
 
         assert retrieved is not None
         assert retrieved.status == OrderStatus.ASSIGNED
         assert retrieved.courier_id == courier_id
 
+    async def test_update_many_writes_batch_and_counts_updated_rows(
+        self,
+        order_repository: OrderRepository,
+    ) -> None:
+        location: typing.Final = Location.must_create(5, 5)
+        orders: typing.Final = [self._create_order(location=location, volume=10) for _ in range(2)]
+        for order in orders:
+            await order_repository.add(order)
+
+        courier_id: typing.Final = uuid.uuid4()
+        arrives_at: typing.Final = dt.datetime.now(dt.UTC)
+        assert orders[0].assign(courier_id).is_success
+        assert orders[0].schedule_arrival(arrives_at).is_success
+        assert orders[1].reserve(courier_id).is_success
+
+        updated: typing.Final = await order_repository.update_many(orders)
+        assigned: typing.Final = await order_repository.get_by_id(orders[0].id)  # type: ignore[arg-type]
+        reserved: typing.Final = await order_repository.get_by_id(orders[1].id)  # type: ignore[arg-type]
+
+        assert updated == 2
+        assert assigned is not None
+        assert assigned.status == OrderStatus.ASSIGNED
+        assert assigned.courier_id == courier_id
+        assert assigned.estimated_arrival_at == arrives_at
+        assert reserved is not None
+        assert reserved.reserved_courier_id == courier_id
+
+    async def test_update_many_skips_order_moved_further_by_another_writer(
+        self,
+        order_repository: OrderRepository,
+    ) -> None:
+        order: typing.Final = self._create_order(location=Location.must_create(5, 5), volume=10)
+        await order_repository.add(order)
+        courier_id: typing.Final = uuid.uuid4()
+        assert order.assign(courier_id).is_success
+        assert order.complete().is_success
+        await order_repository.flush_changes()
+
+        stale: typing.Final = Order.must_create(id_=order.id, location=order.location, volume=order.volume)  # type: ignore[arg-type]
+        assert stale.assign(uuid.uuid4()).is_success
+
+        updated: typing.Final = await order_repository.update_many([stale])
+        retrieved: typing.Final = await order_repository.get_by_id(order.id)  # type: ignore[arg-type]
+
+        assert updated == 0
+        assert retrieved is not None
+        assert retrieved.status == OrderStatus.COMPLETED
+        assert retrieved.courier_id == courier_id
+
+    async def test_flush_changes_writes_orders_modified_after_loading(
+        self,
+        order_repository: OrderRepository,
+    ) -> None:
+        location: typing.Final = Location.must_create(5, 5)
+        order: typing.Final = self._create_order(location=location, volume=10)
+        await order_repository.add(order)
+
+        loaded: typing.Final = await order_repository.get_by_id(order.id)  # type: ignore[arg-type]
+        assert loaded is order
+        courier_id: typing.Final = uuid.uuid4()
+        assert order.assign(courier_id).is_success
+
+        # Query methods flush pending changes first, so the database already sees the assignment
+        assigned: typing.Final = await order_repository.get_all_assigned()
+
+        assert assigned == [order]
+        assert assigned[0] is order
+        assert order.courier_id == courier_id
+
+    async def test_flush_changes_fails_when_order_was_moved_further_by_another_writer(
+        self,
+        db_connection: sa_async.AsyncConnection,
+    ) -> None:
+        writer_session: typing.Final = sa_async.AsyncSession(db_connection, expire_on_commit=False)
+        writer: typing.Final = OrderRepositoryImpl(writer_session)
+        order: typing.Final = self._create_order(location=Location.must_create(5, 5), volume=10)
+        await writer.add(order)
+        await writer_session.flush()
+
+        stale_reader: typing.Final = OrderRepositoryImpl(sa_async.AsyncSession(db_connection, expire_on_commit=False))
+        stale: typing.Final = await stale_reader.get_by_id(order.id)  # type: ignore[arg-type]
+        assert stale is not None
+
+        assert order.assign(uuid.uuid4()).is_success
+        assert order.complete().is_success
+        assert await writer.update_many([order]) == 1
+        assert stale.assign(uuid.uuid4()).is_success
+
+        with pytest.raises(DomainInvariantError):
+            await stale_reader.flush_changes()
+
+    async def test_update_many_skips_order_assigned_by_another_writer(
+        self,
+        db_connection: sa_async.AsyncConnection,
+    ) -> None:
+        writer_session: typing.Final = sa_async.AsyncSession(db_connection, expire_on_commit=False)
+        writer: typing.Final = OrderRepositoryImpl(writer_session)
+        order: typing.Final = self._create_order(location=Location.must_create(5, 5), volume=10)
+        await writer.add(order)
+        await writer_session.flush()
+
+        stale_reader: typing.Final = OrderRepositoryImpl(sa_async.AsyncSession(db_connection, expire_on_commit=False))
+        stale: typing.Final = await stale_reader.get_by_id(order.id)  # type: ignore[arg-type]
+        assert stale is not None
+
+        # Оба диспетчера переводят заказ в тот же статус, но разным курьерам
+        courier_id: typing.Final = uuid.uuid4()
+        assert order.assign(courier_id).is_success
+        assert await writer.update_many([order]) == 1
+        assert stale.assign(uuid.uuid4()).is_success
+
+        assert await stale_reader.update_many([stale]) == 0
+        stored_courier_id: typing.Final = await db_connection.scalar(
+            sqlalchemy.select(OrderModel.courier_id).where(OrderModel.id == order.id)
+        )
+        assert stored_courier_id == courier_id
+
     async def test_get_first_by_status_created(
         self,
         order_repository: OrderRepository,
@@ -120,6 +241,80 @@ class TestOrderRepository:
 
         assert retrieved is None
 
+    async def test_get_all_by_status_created_respects_limit(
+        self,
+        order_repository: OrderRepository,
+    ) -> None:
+        location: typing.Final = Location.must_create(5, 5)
+        orders: typing.Final = [self._create_order(location=location, volume=10) for _ in range(3)]
+        assigned_order: typing.Final = self._create_order(location=location, volume=10)
+        assign_result: typing.Final = assigned_order.assign(uuid.uuid4())
+        assert assign_result.is_success
+
+        for order in [*orders, assigned_order]:
+            await order_repository.add(order)
+
+        all_created: typing.Final = await order_repository.get_all_by_status_created(limit=10)
+        limited: typing.Final = await order_repository.get_all_by_status_created(limit=2)
+
+        assert {o.id for o in all_created} == {o.id for o in orders}
+        assert len(limited) == 2
+        assert all(o.status == OrderStatus.CREATED for o in limited)
+
+    async def test_claim_all_created_respects_limit(
+        self,
+        order_repository: OrderRepository,
+    ) -> None:
+        location: typing.Final = Location.must_create(5, 5)
+        orders: typing.Final = [self._create_order(location=location, volume=10) for _ in range(3)]
+        assigned_order: typing.Final = self._create_order(location=location, volume=10)
+        assign_result: typing.Final = assigned_order.assign(uuid.uuid4())
+        assert assign_result.is_success
+
+        for order in [*orders, assigned_order]:
+            await order_repository.add(order)
+
+        claimed: typing.Final = await order_repository.claim_all_created(limit=2)
+
+        assert len(claimed) == 2
+        assert {o.id for o in claimed} <= {o.id for o in orders}
+
+    async def test_claim_all_created_orders_by_delivery_window_end(
+        self,
+        order_repository: OrderRepository,
+    ) -> None:
+        day_start: typing.Final = dt.datetime(2026, 10, 17, tzinfo=dt.UTC)
+        location: typing.Final = Location.must_create(5, 5)
+        without_window: typing.Final = self._create_order(location=location, volume=10)
+        late: typing.Final = Order.must_create(
+            uuid.uuid4(),
+            location,
+            Volume.must_create(10),
+            DeliveryPeriod.must_create(day_start, day_start + dt.timedelta(hours=18)),
+        )
+        early: typing.Final = Order.must_create(
+            uuid.uuid4(),
+            location,
+            Volume.must_create(10),
+            DeliveryPeriod.must_create(day_start, day_start + dt.timedelta(hours=10)),
+        )
+
+        for order in [without_window, late, early]:
+            await order_repository.add(order)
+
+        claimed: typing.Final = await order_repository.claim_all_created(limit=10)
+
+        assert [o.id for o in claimed] == [early.id, late.id, without_window.id]
+        assert claimed[0].delivery_period == early.delivery_period
+
+    async def test_claim_all_created_no_matches(
+        self,
+        order_repository: OrderRepository,
+    ) -> None:
+        claimed: typing.Final = await order_repository.claim_all_created(limit=1)
+
+        assert claimed == []
+
     async def test_get_all_assigned(
         self,
         order_repository: OrderRepository,
@@ -137,8 +332,7 @@ class TestOrderRepository:
         assert assign_result1.is_success
         assert assign_result2.is_success
 
-        await order_repository.update(order1)
-        await order_repository.update(order2)
+        await order_repository.flush_changes()
 
         assigned_orders: typing.Final = await order_repository.get_all_assigned()
 
@@ -176,7 +370,7 @@ class TestOrderRepository:
         assign_result: typing.Final = assigned_order.assign(courier_id)
         assert assign_result.is_success
 
-        await order_repository.update(assigned_order)
+        await order_repository.flush_changes()
 
         assigned_orders: typing.Final = await order_repository.get_all_assigned()
 
@@ -184,6 +378,63 @@ class TestOrderRepository:
         assert assigned_orders[0].id == assigned_order.id
         assert assigned_orders[0].status == OrderStatus.ASSIGNED
 
+    async def test_get_all_arrived_returns_due_arrivals_in_arrival_order(
+        self,
+        order_repository: OrderRepository,
+    ) -> None:
+        now: typing.Final = dt.datetime.now(dt.UTC)
+        courier_id: typing.Final = uuid.uuid4()
+        arrivals: typing.Final = [
+            now - dt.timedelta(seconds=1),
+            now - dt.timedelta(seconds=5),
+            now + dt.timedelta(seconds=5),
+        ]
+        orders: typing.Final = []
+        for arrives_at in arrivals:
+            order = self._create_order(location=Location.must_create(5, 5), volume=1)
+            assert order.assign(courier_id).is_success
+            assert order.schedule_arrival(arrives_at).is_success
+            await order_repository.add(order)
+            orders.append(order)
+
+        arrived: typing.Final = await order_repository.get_all_arrived(now)
+
+        assert [order.id for order in arrived] == [orders[1].id, orders[0].id]
+        assert arrived[0].estimated_arrival_at == arrivals[1]
+
+    async def test_get_all_unscheduled_returns_assigned_orders_without_arrival(
+        self,
+        order_repository: OrderRepository,
+    ) -> None:
+        unscheduled_order: typing.Final = self._create_order(location=Location.must_create(5, 5), volume=1)
+        scheduled_order: typing.Final = self._create_order(location=Location.must_create(5, 5), volume=1)
+        for order in (unscheduled_order, scheduled_order):
+            assert order.assign(uuid.uuid4()).is_success
+        assert scheduled_order.schedule_arrival(dt.datetime.now(dt.UTC)).is_success
+        await order_repository.add(unscheduled_order)
+        await order_repository.add(scheduled_order)
+        await order_repository.add(self._create_order(location=Location.must_create(5, 5), volume=1))
+
+        orders: typing.Final = await order_repository.get_all_unscheduled()
+
+        assert [order.id for order in orders] == [unscheduled_order.id]
+
+    async def test_get_all_assigned_by_courier_ids(
+        self,
+        order_repository: OrderRepository,
+    ) -> None:
+        courier_id: typing.Final = uuid.uuid4()
+        own_order: typing.Final = self._create_order(location=Location.must_create(5, 5), volume=1)
+        other_order: typing.Final = self._create_order(location=Location.must_create(5, 5), volume=1)
+        assert own_order.assign(courier_id).is_success
+        assert other_order.assign(uuid.uuid4()).is_success
+        await order_repository.add(own_order)
+        await order_repository.add(other_order)
+
+        orders: typing.Final = await order_repository.get_all_assigned_by_courier_ids([courier_id])
+
+        assert [order.id for order in orders] == [own_order.id]
+
     async def test_update_order_complete(
         self,
         order_repository: OrderRepository,
@@ -200,7 +451,7 @@ class TestOrderRepository:
         complete_result: typing.Final = order.complete()
         assert complete_result.is_success
 
-        await order_repository.update(order)
+        await order_repository.flush_changes()
         retrieved: typing.Final = await order_repository.get_by_id(order.id)  # type: ignore[arg-type]
 
         assert retrieved is not None
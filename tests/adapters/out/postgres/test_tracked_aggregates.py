@@ -0,0 +1,54 @@
+import typing
+import uuid
+
+from delivery.adapters.out.postgres.order_mapper import to_snapshot
+from delivery.adapters.out.postgres.tracked_aggregates import TrackedAggregates
+from delivery.core.domain.model.kernel import Location, Volume
+from delivery.core.domain.model.order.order import Order
+
+
+def _create_order(order_id: uuid.UUID | None = None) -> Order:
+    return Order.must_create(
+        id_=order_id or uuid.uuid4(), location=Location.must_create(5, 5), volume=Volume.must_create(1)
+    )
+
+
+class TestTrackedAggregates:
+    def test_changed_returns_only_aggregates_modified_after_tracking(self) -> None:
+        tracked: typing.Final = TrackedAggregates[Order](to_snapshot)
+        untouched: typing.Final = _create_order()
+        assigned: typing.Final = _create_order()
+        tracked.mark_persisted(untouched)
+        tracked.mark_persisted(assigned)
+
+        assert assigned.assign(uuid.uuid4()).is_success
+
+        assert tracked.changed() == [assigned]
+
+    def test_mark_persisted_accepts_current_state(self) -> None:
+        tracked: typing.Final = TrackedAggregates[Order](to_snapshot)
+        order: typing.Final = _create_order()
+        tracked.mark_persisted(order)
+        assert order.assign(uuid.uuid4()).is_success
+
+        tracked.mark_persisted(order)
+
+        assert tracked.changed() == []
+
+    def test_refresh_keeps_tracked_instance_while_it_matches_row(self) -> None:
+        tracked: typing.Final = TrackedAggregates[Order](to_snapshot)
+        order: typing.Final = _create_order()
+        tracked.mark_persisted(order)
+
+        assert tracked.refresh(_create_order(order.id)) is order
+
+    def test_refresh_replaces_instance_changed_by_another_transaction(self) -> None:
+        tracked: typing.Final = TrackedAggregates[Order](to_snapshot)
+        order: typing.Final = _create_order()
+        tracked.mark_persisted(order)
+        fresh: typing.Final = _create_order(order.id)
+        assert fresh.assign(uuid.uuid4()).is_success
+
+        assert tracked.refresh(fresh) is fresh
+        assert tracked.get(order.id) is fresh  # type: ignore[arg-type]
+        assert tracked.changed() == []
@@ -0,0 +1,41 @@
+import json
+import pathlib
+import typing
+
+import pytest
+
+from delivery.benchmarks.dispatch import format_reports, generate_scenario, load_scenario, run_strategy
+from delivery.core.domain.service import DispatchStrategyRegistry
+
+
+class TestDispatchBenchmark:
+    @pytest.mark.parametrize("strategy", DispatchStrategyRegistry.get_all_names())
+    def test_run_strategy_delivers_all_orders_of_light_scenario(self, strategy: str) -> None:
+        scenario: typing.Final = generate_scenario(couriers_count=10, orders_count=20, ticks=100, seed=1)
+
+        report: typing.Final = run_strategy(strategy, scenario)
+
+        assert report.orders == 20
+        assert report.delivered <= report.orders
+        assert report.delivered > 0
+        assert report.delivery_steps >= report.delivered
+        assert 0 < report.utilisation <= 1
+        assert report.decision_latencies_ns
+
+    def test_load_scenario_replays_recorded_stream(self, tmp_path: pathlib.Path) -> None:
+        path: typing.Final = tmp_path / "scenario.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "ticks": 10,
+                    "couriers": [{"speed": 1, "x": 1, "y": 1}],
+                    "orders": [{"tick": 0, "x": 1, "y": 3, "volume": 5}],
+                }
+            )
+        )
+
+        report: typing.Final = run_strategy("greedy_nearest", load_scenario(path))
+
+        assert report.delivered == 1
+        assert report.delivery_steps == 2
+        assert "greedy_nearest" in format_reports([report])
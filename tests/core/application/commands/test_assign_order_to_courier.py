@@ -1,4 +1,6 @@
+import datetime as dt
 import typing
+import uuid
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -8,7 +10,10 @@ from delivery.core.application.commands.assign_order_to_courier import (
     AssignOrderToCourierCommandHandler,
     AssignOrderToCourierCommandHandlerImpl,
 )
-from delivery.core.domain.service.order_dispatch_service import OrderDispatchDomainService
+from delivery.core.domain.model.kernel import DeliveryPeriod, Location, Volume
+from delivery.core.domain.model.order.order import Order
+from delivery.core.domain.service.dispatch_strategy import CapacityAwareDispatchStrategy
+from delivery.core.domain.service.order_dispatch_service import OrderAssignment, OrderDispatchDomainService
 from delivery.core.ports.unit_of_work import DeliveryUnitOfWork
 from delivery.libs.errs.result import Result
 from tests.test_fixtures import create_test_courier, create_test_order
@@ -38,7 +43,7 @@ class TestAssignOrderToCourierCommandHandler:
         order: typing.Final = create_test_order()
 
         mock_uow: typing.Final = MagicMock()
-        mock_uow.order.get_first_by_status_created = AsyncMock(return_value=order)
+        mock_uow.order.claim_all_created = AsyncMock(return_value=[order])
         mock_uow.courier.get_all_free = AsyncMock(return_value=[])
         mock_uow.domain_event_publisher.publish = AsyncMock()
 
@@ -64,10 +69,9 @@ class TestAssignOrderToCourierCommandHandler:
         courier: typing.Final = create_test_courier()
 
         mock_uow: typing.Final = MagicMock()
-        mock_uow.order.get_first_by_status_created = AsyncMock(return_value=order)
+        mock_uow.order.claim_all_created = AsyncMock(return_value=[order])
         mock_uow.courier.get_all_free = AsyncMock(return_value=[courier])
-        mock_uow.courier.update = AsyncMock()
-        mock_uow.order.update = AsyncMock()
+        mock_uow.courier.claim_by_id = AsyncMock(return_value=courier)
         mock_uow.domain_event_publisher.publish = AsyncMock()
 
         mock_start_cm: typing.Final = MagicMock()
@@ -75,11 +79,441 @@ class TestAssignOrderToCourierCommandHandler:
         mock_start_cm.__aexit__ = AsyncMock(return_value=None)
 
         monkeypatch.setattr(DeliveryUnitOfWork, "start", lambda: mock_start_cm)
-        mock_order_dispatch_service.dispatch_order = MagicMock(return_value=Result.success(courier))
+        mock_order_dispatch_service.dispatch_orders = MagicMock(
+            return_value=Result.success([OrderAssignment(order=order, courier=courier)])
+        )
 
         await handler.handle(command)
 
-        mock_order_dispatch_service.dispatch_order.assert_called_once_with(order, [courier])
-        mock_uow.order.update.assert_called_once()
-        mock_uow.courier.update.assert_called_once()
+        mock_order_dispatch_service.dispatch_orders.assert_called_once_with([order], [courier])
         mock_uow.domain_event_publisher.publish.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_batch_assign_should_assign_all_matched_orders(
+        self,
+        mock_order_dispatch_service: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        handler: typing.Final = AssignOrderToCourierCommandHandlerImpl(
+            order_dispatch_service=mock_order_dispatch_service,
+            batch_size=10,
+        )
+        command: typing.Final = AssignOrderToCourierCommand()
+        orders: typing.Final = [create_test_order(), create_test_order()]
+        couriers: typing.Final = [create_test_courier(), create_test_courier()]
+
+        mock_uow: typing.Final = MagicMock()
+        mock_uow.order.claim_all_created = AsyncMock(return_value=orders)
+        mock_uow.courier.get_all_free = AsyncMock(return_value=couriers)
+        mock_uow.courier.claim_by_id = AsyncMock(side_effect={courier.id: courier for courier in couriers}.get)
+        mock_uow.domain_event_publisher.publish = AsyncMock()
+
+        mock_start_cm: typing.Final = MagicMock()
+        mock_start_cm.__aenter__ = AsyncMock(return_value=mock_uow)
+        mock_start_cm.__aexit__ = AsyncMock(return_value=None)
+
+        monkeypatch.setattr(DeliveryUnitOfWork, "start", lambda: mock_start_cm)
+        mock_order_dispatch_service.dispatch_orders = MagicMock(
+            return_value=Result.success(
+                [
+                    OrderAssignment(order=orders[0], courier=couriers[1]),
+                    OrderAssignment(order=orders[1], courier=couriers[0]),
+                ]
+            )
+        )
+
+        result: typing.Final = await handler.handle(command)
+
+        assert result.is_success
+        assert result.get_value() is False
+        mock_uow.order.claim_all_created.assert_called_once_with(10)
+        mock_order_dispatch_service.dispatch_orders.assert_called_once_with(orders, couriers)
+        assert orders[0].courier_id == couriers[1].id
+        assert orders[1].courier_id == couriers[0].id
+        mock_uow.domain_event_publisher.publish.assert_called_once_with(orders)
+
+    @pytest.mark.anyio
+    async def test_batch_assign_should_report_backlog_when_batch_is_full(
+        self,
+        mock_order_dispatch_service: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        handler: typing.Final = AssignOrderToCourierCommandHandlerImpl(
+            order_dispatch_service=mock_order_dispatch_service,
+            batch_size=2,
+        )
+        orders: typing.Final = [create_test_order(), create_test_order()]
+        courier: typing.Final = create_test_courier()
+
+        mock_uow: typing.Final = MagicMock()
+        mock_uow.order.claim_all_created = AsyncMock(return_value=orders)
+        mock_uow.courier.get_all_free = AsyncMock(return_value=[courier])
+        mock_uow.courier.claim_by_id = AsyncMock(return_value=courier)
+        mock_uow.domain_event_publisher.publish = AsyncMock()
+
+        mock_start_cm: typing.Final = MagicMock()
+        mock_start_cm.__aenter__ = AsyncMock(return_value=mock_uow)
+        mock_start_cm.__aexit__ = AsyncMock(return_value=None)
+
+        monkeypatch.setattr(DeliveryUnitOfWork, "start", lambda: mock_start_cm)
+        mock_order_dispatch_service.dispatch_orders = MagicMock(
+            return_value=Result.success([OrderAssignment(order=orders[0], courier=courier)])
+        )
+
+        result: typing.Final = await handler.handle(AssignOrderToCourierCommand())
+
+        assert result.is_success
+        assert result.get_value() is True
+
+    @pytest.mark.anyio
+    async def test_batch_assign_should_do_nothing_when_no_created_orders(
+        self,
+        mock_order_dispatch_service: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        handler: typing.Final = AssignOrderToCourierCommandHandlerImpl(
+            order_dispatch_service=mock_order_dispatch_service,
+            batch_size=10,
+        )
+        command: typing.Final = AssignOrderToCourierCommand()
+
+        mock_uow: typing.Final = MagicMock()
+        mock_uow.order.claim_all_created = AsyncMock(return_value=[])
+        mock_uow.courier.get_all_free = AsyncMock()
+
+        mock_start_cm: typing.Final = MagicMock()
+        mock_start_cm.__aenter__ = AsyncMock(return_value=mock_uow)
+        mock_start_cm.__aexit__ = AsyncMock(return_value=None)
+
+        monkeypatch.setattr(DeliveryUnitOfWork, "start", lambda: mock_start_cm)
+
+        result: typing.Final = await handler.handle(command)
+
+        assert result.is_success
+        assert result.get_value() is False
+        mock_uow.courier.get_all_free.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_capacity_aware_assign_should_load_couriers_with_free_capacity(
+        self,
+        mock_order_dispatch_service: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        handler: typing.Final = AssignOrderToCourierCommandHandlerImpl(
+            order_dispatch_service=mock_order_dispatch_service,
+            batch_size=10,
+            dispatch_strategy=CapacityAwareDispatchStrategy(mock_order_dispatch_service),
+        )
+        command: typing.Final = AssignOrderToCourierCommand()
+        orders: typing.Final = [create_test_order(volume=3), create_test_order(volume=2)]
+        courier: typing.Final = create_test_courier()
+        assert courier.add_storage_place("Backpack", 10).is_success
+
+        mock_uow: typing.Final = MagicMock()
+        mock_uow.order.claim_all_created = AsyncMock(return_value=orders)
+        mock_uow.courier.get_all_with_free_capacity = AsyncMock(return_value=[courier])
+        mock_uow.courier.get_all_free = AsyncMock()
+        mock_uow.courier.claim_by_id = AsyncMock(return_value=courier)
+        mock_uow.domain_event_publisher.publish = AsyncMock()
+
+        mock_start_cm: typing.Final = MagicMock()
+        mock_start_cm.__aenter__ = AsyncMock(return_value=mock_uow)
+        mock_start_cm.__aexit__ = AsyncMock(return_value=None)
+
+        monkeypatch.setattr(DeliveryUnitOfWork, "start", lambda: mock_start_cm)
+        mock_order_dispatch_service.dispatch_orders_by_capacity = MagicMock(
+            return_value=Result.success([OrderAssignment(order=order, courier=courier) for order in orders])
+        )
+
+        result: typing.Final = await handler.handle(command)
+
+        assert result.is_success
+        mock_uow.courier.get_all_with_free_capacity.assert_called_once_with(2)
+        mock_uow.courier.get_all_free.assert_not_called()
+        assert all(order.courier_id == courier.id for order in orders)
+        mock_uow.courier.claim_by_id.assert_called_once_with(courier.id)
+
+    @pytest.mark.anyio
+    async def test_batch_assign_should_skip_courier_locked_by_another_dispatcher(
+        self,
+        mock_order_dispatch_service: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        handler: typing.Final = AssignOrderToCourierCommandHandlerImpl(
+            order_dispatch_service=mock_order_dispatch_service,
+            batch_size=10,
+        )
+        command: typing.Final = AssignOrderToCourierCommand()
+        orders: typing.Final = [create_test_order(), create_test_order()]
+        couriers: typing.Final = [create_test_courier(), create_test_courier()]
+
+        mock_uow: typing.Final = MagicMock()
+        mock_uow.order.claim_all_created = AsyncMock(return_value=orders)
+        mock_uow.courier.get_all_free = AsyncMock(return_value=couriers)
+        # Второго курьера уже заблокировал параллельный диспетчер
+        mock_uow.courier.claim_by_id = AsyncMock(side_effect={couriers[0].id: couriers[0]}.get)
+        mock_uow.domain_event_publisher.publish = AsyncMock()
+
+        mock_start_cm: typing.Final = MagicMock()
+        mock_start_cm.__aenter__ = AsyncMock(return_value=mock_uow)
+        mock_start_cm.__aexit__ = AsyncMock(return_value=None)
+
+        monkeypatch.setattr(DeliveryUnitOfWork, "start", lambda: mock_start_cm)
+        mock_order_dispatch_service.dispatch_orders = MagicMock(
+            return_value=Result.success(
+                [
+                    OrderAssignment(order=orders[0], courier=couriers[0]),
+                    OrderAssignment(order=orders[1], courier=couriers[1]),
+                ]
+            )
+        )
+
+        result: typing.Final = await handler.handle(command)
+
+        assert result.is_success
+        assert orders[0].courier_id == couriers[0].id
+        assert orders[1].courier_id is None
+        mock_uow.domain_event_publisher.publish.assert_called_once_with([orders[0]])
+
+    @pytest.mark.anyio
+    async def test_assign_order_should_not_save_when_courier_claim_is_lost(
+        self,
+        handler: AssignOrderToCourierCommandHandler,
+        mock_order_dispatch_service: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        command: typing.Final = AssignOrderToCourierCommand()
+        order: typing.Final = create_test_order()
+        courier: typing.Final = create_test_courier()
+
+        mock_uow: typing.Final = MagicMock()
+        mock_uow.order.claim_all_created = AsyncMock(return_value=[order])
+        mock_uow.courier.get_all_free = AsyncMock(return_value=[courier])
+        mock_uow.courier.claim_by_id = AsyncMock(return_value=None)
+        mock_uow.domain_event_publisher.publish = AsyncMock()
+
+        mock_start_cm: typing.Final = MagicMock()
+        mock_start_cm.__aenter__ = AsyncMock(return_value=mock_uow)
+        mock_start_cm.__aexit__ = AsyncMock(return_value=None)
+
+        monkeypatch.setattr(DeliveryUnitOfWork, "start", lambda: mock_start_cm)
+        mock_order_dispatch_service.dispatch_orders = MagicMock(
+            return_value=Result.success([OrderAssignment(order=order, courier=courier)])
+        )
+
+        result: typing.Final = await handler.handle(command)
+
+        assert result.is_success
+        assert order.courier_id is None
+        mock_uow.domain_event_publisher.publish.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_lookahead_assign_should_persist_reservation(
+        self,
+        mock_order_dispatch_service: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        handler: typing.Final = AssignOrderToCourierCommandHandlerImpl(
+            order_dispatch_service=mock_order_dispatch_service,
+            batch_size=10,
+            lookahead=True,
+        )
+        command: typing.Final = AssignOrderToCourierCommand()
+        busy_courier: typing.Final = create_test_courier()
+        current_order: typing.Final = create_test_order(courier_id=busy_courier.id)
+        order: typing.Final = create_test_order()
+
+        mock_uow: typing.Final = MagicMock()
+        mock_uow.order.claim_all_created = AsyncMock(return_value=[order])
+        mock_uow.order.get_all_assigned = AsyncMock(return_value=[current_order])
+        mock_uow.courier.get_all_free = AsyncMock(return_value=[])
+        mock_uow.courier.get_all_by_ids = AsyncMock(return_value=[busy_courier])
+        mock_uow.courier.claim_by_id = AsyncMock()
+        mock_uow.domain_event_publisher.publish = AsyncMock()
+
+        mock_start_cm: typing.Final = MagicMock()
+        mock_start_cm.__aenter__ = AsyncMock(return_value=mock_uow)
+        mock_start_cm.__aexit__ = AsyncMock(return_value=None)
+
+        monkeypatch.setattr(DeliveryUnitOfWork, "start", lambda: mock_start_cm)
+        mock_order_dispatch_service.dispatch_order_with_lookahead = MagicMock(
+            return_value=Result.success(OrderAssignment(order=order, courier=busy_courier, is_reservation=True))
+        )
+
+        result: typing.Final = await handler.handle(command)
+
+        assert result.is_success
+        mock_order_dispatch_service.dispatch_order_with_lookahead.assert_called_once_with(
+            order,
+            [],
+            [OrderAssignment(order=current_order, courier=busy_courier)],
+        )
+        assert order.reserved_courier_id == busy_courier.id
+        assert order.courier_id is None
+        mock_uow.courier.claim_by_id.assert_not_called()
+        mock_uow.domain_event_publisher.publish.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_lookahead_assign_should_give_reserved_order_to_freed_courier(
+        self,
+        mock_order_dispatch_service: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        handler: typing.Final = AssignOrderToCourierCommandHandlerImpl(
+            order_dispatch_service=mock_order_dispatch_service,
+            batch_size=10,
+            lookahead=True,
+        )
+        command: typing.Final = AssignOrderToCourierCommand()
+        reserved_courier: typing.Final = create_test_courier()
+        other_courier: typing.Final = create_test_courier(location=Location.must_create(5, 5))
+        reserved_order: typing.Final = create_test_order()
+        assert reserved_order.reserve(reserved_courier.id).is_success  # type: ignore[arg-type]
+
+        mock_uow: typing.Final = MagicMock()
+        mock_uow.order.claim_all_created = AsyncMock(return_value=[reserved_order])
+        mock_uow.order.get_all_assigned = AsyncMock(return_value=[])
+        mock_uow.courier.get_all_by_ids = AsyncMock(return_value=[])
+        mock_uow.courier.get_all_free = AsyncMock(return_value=[other_courier, reserved_courier])
+        mock_uow.courier.claim_by_id = AsyncMock(return_value=reserved_courier)
+        mock_uow.domain_event_publisher.publish = AsyncMock()
+
+        mock_start_cm: typing.Final = MagicMock()
+        mock_start_cm.__aenter__ = AsyncMock(return_value=mock_uow)
+        mock_start_cm.__aexit__ = AsyncMock(return_value=None)
+
+        monkeypatch.setattr(DeliveryUnitOfWork, "start", lambda: mock_start_cm)
+        mock_order_dispatch_service.dispatch_order_with_lookahead = MagicMock()
+
+        result: typing.Final = await handler.handle(command)
+
+        assert result.is_success
+        mock_order_dispatch_service.dispatch_order_with_lookahead.assert_not_called()
+        assert reserved_order.courier_id == reserved_courier.id
+        assert reserved_order.reserved_courier_id is None
+
+    @pytest.mark.anyio
+    async def test_lookahead_assign_should_keep_waiting_while_reserved_courier_is_busy(
+        self,
+        mock_order_dispatch_service: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        handler: typing.Final = AssignOrderToCourierCommandHandlerImpl(
+            order_dispatch_service=mock_order_dispatch_service,
+            batch_size=10,
+            lookahead=True,
+        )
+        command: typing.Final = AssignOrderToCourierCommand()
+        reserved_courier: typing.Final = create_test_courier()
+        idle_courier: typing.Final = create_test_courier()
+        current_order: typing.Final = create_test_order(courier_id=reserved_courier.id)
+        reserved_order: typing.Final = create_test_order()
+        assert reserved_order.reserve(reserved_courier.id).is_success  # type: ignore[arg-type]
+
+        mock_uow: typing.Final = MagicMock()
+        mock_uow.order.claim_all_created = AsyncMock(return_value=[reserved_order])
+        mock_uow.order.get_all_assigned = AsyncMock(return_value=[current_order])
+        mock_uow.courier.get_all_free = AsyncMock(return_value=[idle_courier])
+        mock_uow.courier.get_all_by_ids = AsyncMock(return_value=[reserved_courier])
+        mock_uow.courier.claim_by_id = AsyncMock()
+        mock_uow.domain_event_publisher.publish = AsyncMock()
+
+        mock_start_cm: typing.Final = MagicMock()
+        mock_start_cm.__aenter__ = AsyncMock(return_value=mock_uow)
+        mock_start_cm.__aexit__ = AsyncMock(return_value=None)
+
+        monkeypatch.setattr(DeliveryUnitOfWork, "start", lambda: mock_start_cm)
+        mock_order_dispatch_service.dispatch_order_with_lookahead = MagicMock()
+
+        result: typing.Final = await handler.handle(command)
+
+        assert result.is_success
+        mock_order_dispatch_service.dispatch_order_with_lookahead.assert_not_called()
+        assert reserved_order.courier_id is None
+        assert reserved_order.reserved_courier_id == reserved_courier.id
+
+    @pytest.mark.anyio
+    async def test_batch_assign_should_serve_closest_deadlines_when_couriers_are_short(
+        self,
+        mock_order_dispatch_service: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        handler: typing.Final = AssignOrderToCourierCommandHandlerImpl(
+            order_dispatch_service=mock_order_dispatch_service,
+            batch_size=10,
+        )
+        command: typing.Final = AssignOrderToCourierCommand()
+        day_start: typing.Final = dt.datetime(2026, 10, 17, tzinfo=dt.UTC)
+        late_order: typing.Final = Order.must_create(
+            uuid.uuid4(),
+            Location.must_create(5, 5),
+            Volume.must_create(1),
+            DeliveryPeriod.must_create(day_start, day_start + dt.timedelta(hours=20)),
+        )
+        urgent_order: typing.Final = Order.must_create(
+            uuid.uuid4(),
+            Location.must_create(5, 5),
+            Volume.must_create(1),
+            DeliveryPeriod.must_create(day_start, day_start + dt.timedelta(hours=10)),
+        )
+        courier: typing.Final = create_test_courier()
+
+        mock_uow: typing.Final = MagicMock()
+        mock_uow.order.claim_all_created = AsyncMock(return_value=[late_order, urgent_order])
+        mock_uow.courier.get_all_free = AsyncMock(return_value=[courier])
+        mock_uow.courier.claim_by_id = AsyncMock(return_value=courier)
+        mock_uow.domain_event_publisher.publish = AsyncMock()
+
+        mock_start_cm: typing.Final = MagicMock()
+        mock_start_cm.__aenter__ = AsyncMock(return_value=mock_uow)
+        mock_start_cm.__aexit__ = AsyncMock(return_value=None)
+
+        monkeypatch.setattr(DeliveryUnitOfWork, "start", lambda: mock_start_cm)
+        mock_order_dispatch_service.dispatch_orders = MagicMock(
+            return_value=Result.success([OrderAssignment(order=urgent_order, courier=courier)])
+        )
+
+        result: typing.Final = await handler.handle(command)
+
+        assert result.is_success
+        mock_order_dispatch_service.dispatch_orders.assert_called_once_with([urgent_order], [courier])
+        assert urgent_order.courier_id == courier.id
+        assert late_order.courier_id is None
+
+    @pytest.mark.anyio
+    async def test_assign_should_schedule_arrival_after_current_route(
+        self,
+        mock_order_dispatch_service: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        handler: typing.Final = AssignOrderToCourierCommandHandlerImpl(
+            order_dispatch_service=mock_order_dispatch_service,
+            schedule_arrivals=True,
+        )
+        courier: typing.Final = create_test_courier(speed=2, location=Location.must_create(1, 1))
+        current_order: typing.Final = create_test_order(location=Location.must_create(5, 1), courier_id=courier.id)
+        current_arrival: typing.Final = dt.datetime.now(dt.UTC) + dt.timedelta(seconds=30)
+        assert current_order.schedule_arrival(current_arrival).is_success
+        order: typing.Final = create_test_order(location=Location.must_create(5, 9))
+
+        mock_uow: typing.Final = MagicMock()
+        mock_uow.order.claim_all_created = AsyncMock(return_value=[order])
+        mock_uow.order.get_all_assigned_by_courier_ids = AsyncMock(return_value=[current_order])
+        mock_uow.courier.get_all_free = AsyncMock(return_value=[courier])
+        mock_uow.courier.claim_by_id = AsyncMock(return_value=courier)
+        mock_uow.domain_event_publisher.publish = AsyncMock()
+
+        mock_start_cm: typing.Final = MagicMock()
+        mock_start_cm.__aenter__ = AsyncMock(return_value=mock_uow)
+        mock_start_cm.__aexit__ = AsyncMock(return_value=None)
+
+        monkeypatch.setattr(DeliveryUnitOfWork, "start", lambda: mock_start_cm)
+        mock_order_dispatch_service.dispatch_orders = MagicMock(
+            return_value=Result.success([OrderAssignment(order=order, courier=courier)])
+        )
+
+        result: typing.Final = await handler.handle(AssignOrderToCourierCommand())
+
+        assert result.is_success
+        mock_uow.order.get_all_assigned_by_courier_ids.assert_called_once_with({courier.id})
+        assert order.estimated_arrival_at == current_arrival + dt.timedelta(seconds=4)
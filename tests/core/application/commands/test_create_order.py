@@ -1,3 +1,4 @@
+import datetime as dt
 import typing
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
@@ -10,8 +11,11 @@ from delivery.core.application.commands.create_order import (
     CreateOrderCommandHandlerImpl,
 )
 from delivery.core.domain.model.kernel import Address, Location, Volume
+from delivery.core.domain.service.demand_heatmap import DemandHeatmap
+from delivery.core.ports.dispatch_trigger import DispatchTrigger
 from delivery.core.ports.geo_location_client import GeoLocationClient
 from delivery.core.ports.unit_of_work import DeliveryUnitOfWork
+from delivery.libs.errs.error import Error
 from delivery.libs.errs.result import Result
 
 
@@ -70,3 +74,117 @@ class TestCreateOrderCommandHandler:
         added_order: typing.Final = mock_uow.order.add.call_args[0][0]
         assert added_order.id == order_id
         assert added_order.volume == volume
+
+    @pytest.mark.anyio
+    async def test_create_order_should_notify_dispatch_trigger_after_commit(
+        self,
+        mock_geo_location_client: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        dispatch_trigger: typing.Final = MagicMock(spec=DispatchTrigger)
+        handler: typing.Final = CreateOrderCommandHandlerImpl(
+            geo_location_client=mock_geo_location_client,
+            dispatch_trigger=dispatch_trigger,
+        )
+        command: typing.Final = CreateOrderCommand(
+            order_id=uuid4(),
+            address=Address.must_create(
+                country="Россия",
+                city="Москва",
+                street="Тверская",
+                house="1",
+                apartment="1",
+            ),
+            volume=Volume.must_create(5),
+        )
+
+        mock_uow: typing.Final = MagicMock()
+        mock_uow.order.add = AsyncMock()
+        mock_uow.domain_event_publisher.publish = AsyncMock()
+
+        calls: typing.Final[list[str]] = []
+        dispatch_trigger.notify.side_effect = lambda: calls.append("notify")
+
+        async def commit(*_: object) -> None:
+            calls.append("commit")
+
+        mock_start_cm: typing.Final = MagicMock()
+        mock_start_cm.__aenter__ = AsyncMock(return_value=mock_uow)
+        mock_start_cm.__aexit__ = AsyncMock(side_effect=commit)
+
+        monkeypatch.setattr(DeliveryUnitOfWork, "start", lambda: mock_start_cm)
+        mock_geo_location_client.get_location = AsyncMock(return_value=Result.success(Location.must_create(5, 5)))
+
+        result: typing.Final = await handler.handle(command)
+
+        assert result.is_success
+        assert calls == ["commit", "notify"]
+
+    @pytest.mark.anyio
+    async def test_create_order_should_not_notify_dispatch_trigger_on_failure(
+        self,
+        mock_geo_location_client: MagicMock,
+    ) -> None:
+        dispatch_trigger: typing.Final = MagicMock(spec=DispatchTrigger)
+        handler: typing.Final = CreateOrderCommandHandlerImpl(
+            geo_location_client=mock_geo_location_client,
+            dispatch_trigger=dispatch_trigger,
+        )
+        command: typing.Final = CreateOrderCommand(
+            order_id=uuid4(),
+            address=Address.must_create(
+                country="Россия",
+                city="Москва",
+                street="Тверская",
+                house="1",
+                apartment="1",
+            ),
+            volume=Volume.must_create(5),
+        )
+        mock_geo_location_client.get_location = AsyncMock(
+            return_value=Result.failure(Error.of("geo.service.rpc.error", "unavailable"))
+        )
+
+        result: typing.Final = await handler.handle(command)
+
+        assert result.is_failure
+        dispatch_trigger.notify.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_create_order_should_record_demand(
+        self,
+        mock_geo_location_client: MagicMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        demand_heatmap: typing.Final = DemandHeatmap(dt.timedelta(minutes=15))
+        handler: typing.Final = CreateOrderCommandHandlerImpl(
+            geo_location_client=mock_geo_location_client,
+            demand_heatmap=demand_heatmap,
+        )
+        command: typing.Final = CreateOrderCommand(
+            order_id=uuid4(),
+            address=Address.must_create(
+                country="Россия",
+                city="Москва",
+                street="Тверская",
+                house="1",
+                apartment="1",
+            ),
+            volume=Volume.must_create(5),
+        )
+
+        mock_uow: typing.Final = MagicMock()
+        mock_uow.order.add = AsyncMock()
+        mock_uow.domain_event_publisher.publish = AsyncMock()
+
+        mock_start_cm: typing.Final = MagicMock()
+        mock_start_cm.__aenter__ = AsyncMock(return_value=mock_uow)
+        mock_start_cm.__aexit__ = AsyncMock(return_value=None)
+
+        monkeypatch.setattr(DeliveryUnitOfWork, "start", lambda: mock_start_cm)
+        mock_geo_location_client.get_location = AsyncMock(return_value=Result.success(Location.must_create(5, 5)))
+
+        result: typing.Final = await handler.handle(command)
+
+        assert result.is_success
+        assert demand_heatmap.hotspots(limit=3) == [Location.must_create(5, 5)]
@@ -0,0 +1,104 @@
+import datetime as dt
+import typing
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from delivery.core.application.commands.move_couriers import (
+    EtaMoveCouriersCommandHandlerImpl,
+    MoveCouriersCommand,
+)
+from delivery.core.domain.model.kernel import DeliveryPeriod, Location, Volume
+from delivery.core.domain.model.order.order import Order
+from delivery.core.domain.model.order.order_status import OrderStatus
+from delivery.core.ports.delivery_metrics import DeliveryMetrics
+from delivery.core.ports.dispatch_trigger import DispatchTrigger
+from delivery.core.ports.unit_of_work import DeliveryUnitOfWork
+from tests.test_fixtures import create_test_courier, create_test_order
+
+
+class TestEtaMoveCouriersCommandHandler:
+    @staticmethod
+    def _mock_unit_of_work(monkeypatch: pytest.MonkeyPatch, mock_uow: MagicMock) -> None:
+        mock_start_cm: typing.Final = MagicMock()
+        mock_start_cm.__aenter__ = AsyncMock(return_value=mock_uow)
+        mock_start_cm.__aexit__ = AsyncMock(return_value=None)
+        monkeypatch.setattr(DeliveryUnitOfWork, "start", lambda: mock_start_cm)
+
+    @pytest.mark.anyio
+    async def test_should_do_nothing_without_arrivals(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        mock_uow: typing.Final = MagicMock()
+        mock_uow.order.get_all_unscheduled = AsyncMock(return_value=[])
+        mock_uow.order.get_all_arrived = AsyncMock(return_value=[])
+        mock_uow.courier.get_all_by_ids = AsyncMock()
+        self._mock_unit_of_work(monkeypatch, mock_uow)
+
+        result: typing.Final = await EtaMoveCouriersCommandHandlerImpl().handle(MoveCouriersCommand())
+
+        assert result.is_success
+        mock_uow.courier.get_all_by_ids.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_should_complete_arrived_orders_and_leave_courier_at_last_stop(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        dispatch_trigger: typing.Final = MagicMock(spec=DispatchTrigger)
+        delivery_metrics: typing.Final = MagicMock(spec=DeliveryMetrics)
+        handler: typing.Final = EtaMoveCouriersCommandHandlerImpl(dispatch_trigger, delivery_metrics)
+
+        courier: typing.Final = create_test_courier(speed=2, location=Location.must_create(1, 1))
+        assert courier.add_storage_place("Backpack", 20).is_success
+        arrived_at: typing.Final = dt.datetime.now(dt.UTC) - dt.timedelta(seconds=5)
+        late_order: typing.Final = Order.must_create(
+            create_test_order().id,  # type: ignore[arg-type]
+            Location.must_create(3, 1),
+            Volume.must_create(1),
+            DeliveryPeriod.must_create(arrived_at - dt.timedelta(hours=1), arrived_at - dt.timedelta(seconds=1)),
+        )
+        next_order: typing.Final = create_test_order(location=Location.must_create(3, 3))
+        for order, arrives_at in [(late_order, arrived_at), (next_order, arrived_at + dt.timedelta(seconds=1))]:
+            assert order.assign(courier.id).is_success  # type: ignore[arg-type]
+            assert order.schedule_arrival(arrives_at).is_success
+            assert courier.take_order(order.id, order.volume).is_success  # type: ignore[arg-type]
+
+        mock_uow: typing.Final = MagicMock()
+        mock_uow.order.get_all_unscheduled = AsyncMock(return_value=[])
+        mock_uow.order.get_all_arrived = AsyncMock(return_value=[late_order, next_order])
+        mock_uow.courier.get_all_by_ids = AsyncMock(return_value=[courier])
+        mock_uow.domain_event_publisher.publish = AsyncMock()
+        self._mock_unit_of_work(monkeypatch, mock_uow)
+
+        result: typing.Final = await handler.handle(MoveCouriersCommand())
+
+        assert result.is_success
+        assert late_order.status == OrderStatus.COMPLETED
+        assert next_order.status == OrderStatus.COMPLETED
+        assert courier.location == Location.must_create(3, 3)
+        assert all(not place.is_occupied() for place in courier.storage_places)
+        mock_uow.domain_event_publisher.publish.assert_called_once_with([late_order, next_order])
+        delivery_metrics.record_missed_delivery_windows.assert_called_once_with(1)
+        dispatch_trigger.notify.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_should_schedule_orders_assigned_before_eta_mode(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        courier: typing.Final = create_test_courier(speed=2, location=Location.must_create(1, 1))
+        scheduled_order: typing.Final = create_test_order(location=Location.must_create(3, 1))
+        unscheduled_order: typing.Final = create_test_order(location=Location.must_create(3, 5))
+        route_end: typing.Final = dt.datetime.now(dt.UTC) + dt.timedelta(minutes=1)
+        for order in (scheduled_order, unscheduled_order):
+            assert order.assign(courier.id).is_success  # type: ignore[arg-type]
+        assert scheduled_order.schedule_arrival(route_end).is_success
+
+        mock_uow: typing.Final = MagicMock()
+        mock_uow.order.get_all_unscheduled = AsyncMock(return_value=[unscheduled_order])
+        mock_uow.order.get_all_assigned_by_courier_ids = AsyncMock(return_value=[scheduled_order, unscheduled_order])
+        mock_uow.order.get_all_arrived = AsyncMock(return_value=[])
+        mock_uow.courier.get_all_by_ids = AsyncMock(return_value=[courier])
+        self._mock_unit_of_work(monkeypatch, mock_uow)
+
+        result: typing.Final = await EtaMoveCouriersCommandHandlerImpl().handle(MoveCouriersCommand())
+
+        assert result.is_success
+        # Курьер едет к заказу после уже запланированной остановки: 4 клетки по y со скоростью 2
+        assert unscheduled_order.estimated_arrival_at == route_end + dt.timedelta(seconds=2)
@@ -1,3 +1,4 @@
+import datetime as dt
 import typing
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
@@ -10,7 +11,11 @@ from delivery.core.application.commands.move_couriers import (
     MoveCouriersCommandHandlerImpl,
 )
 from delivery.core.domain.model.courier.courier import Courier
-from delivery.core.domain.model.kernel import Location, Volume
+from delivery.core.domain.model.kernel import DeliveryPeriod, Location, Volume
+from delivery.core.domain.model.order.order import Order
+from delivery.core.ports.courier_position_buffer import CourierPositionBuffer
+from delivery.core.ports.delivery_metrics import DeliveryMetrics
+from delivery.core.ports.dispatch_trigger import DispatchTrigger
 from delivery.core.ports.unit_of_work import DeliveryUnitOfWork
 from tests.test_fixtures import create_test_order
 
@@ -30,17 +35,14 @@ class TestMoveCouriersCommandHandler:
     ) -> None:
         command: typing.Final = MoveCouriersCommand()
 
-        courier_id: typing.Final = uuid4()
+        courier: typing.Final = Courier.must_create(name="Test", speed=1, location=Location.must_create(1, 1))
+        courier_id: typing.Final = courier.id
         order_location: typing.Final = Location.must_create(10, 10)
         order: typing.Final = create_test_order(location=order_location, courier_id=courier_id)
 
-        courier: typing.Final = Courier.must_create(name="Test", speed=1, location=Location.must_create(1, 1))
-
         mock_uow: typing.Final = MagicMock()
         mock_uow.order.get_all_assigned = AsyncMock(return_value=[order])
-        mock_uow.courier.get_by_id = AsyncMock(return_value=courier)
-        mock_uow.courier.update = AsyncMock()
-        mock_uow.order.update = AsyncMock()
+        mock_uow.courier.get_all_by_ids = AsyncMock(return_value=[courier])
         mock_uow.domain_event_publisher.publish = AsyncMock()
 
         mock_start_cm: typing.Final = MagicMock()
@@ -52,9 +54,7 @@ class TestMoveCouriersCommandHandler:
         await handler.handle(command)
 
         mock_uow.order.get_all_assigned.assert_called_once()
-        mock_uow.courier.get_by_id.assert_called_once_with(courier_id)
-        mock_uow.courier.update.assert_called_once()
-        mock_uow.order.update.assert_not_called()
+        mock_uow.courier.get_all_by_ids.assert_called_once_with([courier_id])
         mock_uow.domain_event_publisher.publish.assert_not_called()
 
     @pytest.mark.anyio
@@ -66,22 +66,19 @@ class TestMoveCouriersCommandHandler:
         command: typing.Final = MoveCouriersCommand()
 
         location: typing.Final = Location.must_create(5, 5)
-        courier_id: typing.Final = uuid4()
+        courier: typing.Final = Courier.must_create(name="Test", speed=10, location=location)
+        courier_id: typing.Final = courier.id
         order_id: typing.Final = uuid4()
         order: typing.Final = create_test_order(
             order_id=order_id,
             location=location,
             courier_id=courier_id,
         )
-
-        courier: typing.Final = Courier.must_create(name="Test", speed=10, location=location)
         courier.take_order(order_id, Volume.must_create(1))
 
         mock_uow: typing.Final = MagicMock()
         mock_uow.order.get_all_assigned = AsyncMock(return_value=[order])
-        mock_uow.courier.get_by_id = AsyncMock(return_value=courier)
-        mock_uow.courier.update = AsyncMock()
-        mock_uow.order.update = AsyncMock()
+        mock_uow.courier.get_all_by_ids = AsyncMock(return_value=[courier])
         mock_uow.domain_event_publisher.publish = AsyncMock()
 
         mock_start_cm: typing.Final = MagicMock()
@@ -93,7 +90,168 @@ class TestMoveCouriersCommandHandler:
         await handler.handle(command)
 
         mock_uow.order.get_all_assigned.assert_called_once()
-        mock_uow.courier.get_by_id.assert_called_once_with(courier_id)
-        mock_uow.courier.update.assert_called_once()
-        mock_uow.order.update.assert_called_once()
+        mock_uow.courier.get_all_by_ids.assert_called_once_with([courier_id])
         mock_uow.domain_event_publisher.publish.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_move_couriers_should_notify_dispatch_when_courier_freed(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        dispatch_trigger: typing.Final = MagicMock(spec=DispatchTrigger)
+        handler: typing.Final = MoveCouriersCommandHandlerImpl(dispatch_trigger)
+        command: typing.Final = MoveCouriersCommand()
+
+        location: typing.Final = Location.must_create(5, 5)
+        courier: typing.Final = Courier.must_create(name="Test", speed=10, location=location)
+        order: typing.Final = create_test_order(location=location, courier_id=courier.id)
+        courier.take_order(order.id, order.volume)  # type: ignore[arg-type]
+
+        mock_uow: typing.Final = MagicMock()
+        mock_uow.order.get_all_assigned = AsyncMock(return_value=[order])
+        mock_uow.courier.get_all_by_ids = AsyncMock(return_value=[courier])
+        mock_uow.domain_event_publisher.publish = AsyncMock()
+
+        mock_start_cm: typing.Final = MagicMock()
+        mock_start_cm.__aenter__ = AsyncMock(return_value=mock_uow)
+        mock_start_cm.__aexit__ = AsyncMock(return_value=None)
+
+        monkeypatch.setattr(DeliveryUnitOfWork, "start", lambda: mock_start_cm)
+
+        result: typing.Final = await handler.handle(command)
+
+        assert result.is_success
+        dispatch_trigger.notify.assert_called_once()
+
+    @pytest.mark.anyio
+    async def test_move_couriers_should_record_missed_delivery_window(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        delivery_metrics: typing.Final = MagicMock(spec=DeliveryMetrics)
+        handler: typing.Final = MoveCouriersCommandHandlerImpl(delivery_metrics=delivery_metrics)
+        command: typing.Final = MoveCouriersCommand()
+
+        location: typing.Final = Location.must_create(5, 5)
+        courier: typing.Final = Courier.must_create(name="Test", speed=10, location=location)
+        assert courier.add_storage_place("Backpack", 20).is_success
+        window_end: typing.Final = dt.datetime.now(dt.UTC) - dt.timedelta(hours=1)
+        late_order: typing.Final = Order.must_create(
+            uuid4(),
+            location,
+            Volume.must_create(1),
+            DeliveryPeriod.must_create(window_end - dt.timedelta(hours=3), window_end),
+        )
+        on_time_order: typing.Final = create_test_order(location=location)
+        for order in [late_order, on_time_order]:
+            order.assign(courier.id)  # type: ignore[arg-type]
+            courier.take_order(order.id, order.volume)  # type: ignore[arg-type]
+
+        mock_uow: typing.Final = MagicMock()
+        mock_uow.order.get_all_assigned = AsyncMock(return_value=[late_order, on_time_order])
+        mock_uow.courier.get_all_by_ids = AsyncMock(return_value=[courier])
+        mock_uow.domain_event_publisher.publish = AsyncMock()
+
+        mock_start_cm: typing.Final = MagicMock()
+        mock_start_cm.__aenter__ = AsyncMock(return_value=mock_uow)
+        mock_start_cm.__aexit__ = AsyncMock(return_value=None)
+
+        monkeypatch.setattr(DeliveryUnitOfWork, "start", lambda: mock_start_cm)
+
+        result: typing.Final = await handler.handle(command)
+
+        assert result.is_success
+        delivery_metrics.record_missed_delivery_windows.assert_called_once_with(1)
+
+    @pytest.mark.anyio
+    async def test_move_couriers_should_load_and_move_courier_with_several_orders_once(
+        self,
+        handler: MoveCouriersCommandHandler,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        command: typing.Final = MoveCouriersCommand()
+
+        courier: typing.Final = Courier.must_create(name="Test", speed=1, location=Location.must_create(1, 1))
+        assert courier.add_storage_place("Backpack", 20).is_success
+        first_order: typing.Final = create_test_order(location=Location.must_create(1, 5), courier_id=courier.id)
+        second_order: typing.Final = create_test_order(location=Location.must_create(5, 1), courier_id=courier.id)
+        for order in [first_order, second_order]:
+            courier.take_order(order.id, order.volume)  # type: ignore[arg-type]
+
+        mock_uow: typing.Final = MagicMock()
+        mock_uow.order.get_all_assigned = AsyncMock(return_value=[first_order, second_order])
+        mock_uow.courier.get_all_by_ids = AsyncMock(return_value=[courier])
+        mock_uow.domain_event_publisher.publish = AsyncMock()
+
+        mock_start_cm: typing.Final = MagicMock()
+        mock_start_cm.__aenter__ = AsyncMock(return_value=mock_uow)
+        mock_start_cm.__aexit__ = AsyncMock(return_value=None)
+
+        monkeypatch.setattr(DeliveryUnitOfWork, "start", lambda: mock_start_cm)
+
+        result: typing.Final = await handler.handle(command)
+
+        assert result.is_success
+        mock_uow.courier.get_all_by_ids.assert_called_once_with([courier.id])
+        assert courier.location == Location.must_create(1, 2)
+
+    @pytest.mark.anyio
+    async def test_move_couriers_should_follow_planned_route(
+        self,
+        handler: MoveCouriersCommandHandler,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        courier: typing.Final = Courier.must_create(name="Test", speed=1, location=Location.must_create(1, 1))
+        assert courier.add_storage_place("Backpack", 20).is_success
+        far_order: typing.Final = create_test_order(location=Location.must_create(1, 9), courier_id=courier.id)
+        near_order: typing.Final = create_test_order(location=Location.must_create(3, 1), courier_id=courier.id)
+        for order in [far_order, near_order]:
+            courier.take_order(order.id, order.volume)  # type: ignore[arg-type]
+
+        mock_uow: typing.Final = MagicMock()
+        mock_uow.order.get_all_assigned = AsyncMock(return_value=[far_order, near_order])
+        mock_uow.courier.get_all_by_ids = AsyncMock(return_value=[courier])
+        mock_uow.domain_event_publisher.publish = AsyncMock()
+
+        mock_start_cm: typing.Final = MagicMock()
+        mock_start_cm.__aenter__ = AsyncMock(return_value=mock_uow)
+        mock_start_cm.__aexit__ = AsyncMock(return_value=None)
+
+        monkeypatch.setattr(DeliveryUnitOfWork, "start", lambda: mock_start_cm)
+
+        result: typing.Final = await handler.handle(MoveCouriersCommand())
+
+        assert result.is_success
+        assert courier.location == Location.must_create(2, 1)
+
+    @pytest.mark.anyio
+    async def test_move_couriers_should_buffer_positions_of_couriers_still_on_the_way(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        position_buffer: typing.Final = MagicMock(spec=CourierPositionBuffer)
+        position_buffer.complete_tick = AsyncMock()
+        handler: typing.Final = MoveCouriersCommandHandlerImpl(position_buffer=position_buffer)
+
+        courier: typing.Final = Courier.must_create(name="Test", speed=1, location=Location.must_create(1, 1))
+        # В базе курьер ещё в (1, 1), а буфер уже знает, что он дошёл до (1, 3)
+        position_buffer.get_location.return_value = Location.must_create(1, 3)
+        order: typing.Final = create_test_order(location=Location.must_create(1, 9), courier_id=courier.id)
+
+        mock_uow: typing.Final = MagicMock()
+        mock_uow.order.get_all_assigned = AsyncMock(return_value=[order])
+        mock_uow.courier.get_all_by_ids = AsyncMock(return_value=[courier])
+        mock_uow.domain_event_publisher.publish = AsyncMock()
+
+        mock_start_cm: typing.Final = MagicMock()
+        mock_start_cm.__aenter__ = AsyncMock(return_value=mock_uow)
+        mock_start_cm.__aexit__ = AsyncMock(return_value=None)
+
+        monkeypatch.setattr(DeliveryUnitOfWork, "start", lambda: mock_start_cm)
+
+        result: typing.Final = await handler.handle(MoveCouriersCommand())
+
+        assert result.is_success
+        position_buffer.set_location.assert_called_once_with(courier.id, Location.must_create(1, 4))
+        mock_uow.courier.mark_persisted.assert_called_once_with(courier)
+        position_buffer.complete_tick.assert_awaited_once_with(force_flush=False)
@@ -0,0 +1,109 @@
+import datetime as dt
+import typing
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from delivery.core.application.commands.rebalance_couriers import (
+    RebalanceCouriersCommand,
+    RebalanceCouriersCommandHandlerImpl,
+)
+from delivery.core.domain.model.kernel import Location
+from delivery.core.domain.service.demand_heatmap import DemandHeatmap
+from delivery.core.ports.courier_position_buffer import CourierPositionBuffer
+from delivery.core.ports.unit_of_work import DeliveryUnitOfWork
+from tests.test_fixtures import create_test_courier, create_test_order
+
+
+class TestRebalanceCouriersCommandHandler:
+    @staticmethod
+    def _mock_unit_of_work(monkeypatch: pytest.MonkeyPatch, mock_uow: MagicMock) -> None:
+        mock_start_cm: typing.Final = MagicMock()
+        mock_start_cm.__aenter__ = AsyncMock(return_value=mock_uow)
+        mock_start_cm.__aexit__ = AsyncMock(return_value=None)
+        monkeypatch.setattr(DeliveryUnitOfWork, "start", lambda: mock_start_cm)
+
+    @pytest.mark.anyio
+    async def test_should_do_nothing_without_idle_couriers(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        mock_uow: typing.Final = MagicMock()
+        mock_uow.courier.get_all_free = AsyncMock(return_value=[])
+        mock_uow.order.get_all_by_status_created = AsyncMock()
+        self._mock_unit_of_work(monkeypatch, mock_uow)
+
+        result: typing.Final = await RebalanceCouriersCommandHandlerImpl(moves_per_tick=5).handle(
+            RebalanceCouriersCommand()
+        )
+
+        assert result.is_success
+        mock_uow.order.get_all_by_status_created.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_should_step_idle_courier_toward_demand(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        courier: typing.Final = create_test_courier(speed=2, location=Location.must_create(1, 1))
+        position_buffer: typing.Final = MagicMock(spec=CourierPositionBuffer)
+        position_buffer.get_location.return_value = None
+
+        mock_uow: typing.Final = MagicMock()
+        mock_uow.courier.get_all_free = AsyncMock(return_value=[courier])
+        mock_uow.courier.claim_by_id = AsyncMock(return_value=courier)
+        mock_uow.order.get_all_by_status_created = AsyncMock(
+            return_value=[create_test_order(location=Location.must_create(6, 1))]
+        )
+        mock_uow.order.get_all_assigned = AsyncMock(return_value=[])
+        self._mock_unit_of_work(monkeypatch, mock_uow)
+
+        handler: typing.Final = RebalanceCouriersCommandHandlerImpl(moves_per_tick=5, position_buffer=position_buffer)
+        result: typing.Final = await handler.handle(RebalanceCouriersCommand())
+
+        assert result.is_success
+        assert courier.location == Location.must_create(3, 1)
+        mock_uow.courier.mark_persisted.assert_not_called()
+        position_buffer.set_location.assert_called_once_with(courier.id, Location.must_create(3, 1))
+
+    @pytest.mark.anyio
+    async def test_should_take_hotspots_from_heatmap(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        courier: typing.Final = create_test_courier(speed=1, location=Location.must_create(5, 5))
+        demand_heatmap: typing.Final = DemandHeatmap(dt.timedelta(minutes=15))
+        demand_heatmap.record(Location.must_create(5, 9), dt.datetime.now(dt.UTC))
+
+        mock_uow: typing.Final = MagicMock()
+        mock_uow.courier.get_all_free = AsyncMock(return_value=[courier])
+        mock_uow.courier.claim_by_id = AsyncMock(return_value=courier)
+        mock_uow.order.get_all_by_status_created = AsyncMock()
+        self._mock_unit_of_work(monkeypatch, mock_uow)
+
+        handler: typing.Final = RebalanceCouriersCommandHandlerImpl(moves_per_tick=5, demand_heatmap=demand_heatmap)
+        result: typing.Final = await handler.handle(RebalanceCouriersCommand())
+
+        assert result.is_success
+        assert courier.location == Location.must_create(5, 6)
+        mock_uow.order.get_all_by_status_created.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_should_leave_couriers_taken_by_dispatcher(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        locked_courier: typing.Final = create_test_courier(speed=1, location=Location.must_create(5, 5))
+        busy_courier: typing.Final = create_test_courier(speed=1, location=Location.must_create(5, 5))
+        assert busy_courier.add_storage_place("Backpack", 10).is_success
+        # Пока планировалось перемещение, диспетчер успел отдать курьеру заказ
+        claimed_busy_courier: typing.Final = create_test_courier(speed=1, location=Location.must_create(5, 5))
+        assert claimed_busy_courier.add_storage_place("Backpack", 10).is_success
+        order: typing.Final = create_test_order(location=Location.must_create(5, 9))
+        assert claimed_busy_courier.take_order(order.id, order.volume).is_success  # type: ignore[arg-type]
+        demand_heatmap: typing.Final = DemandHeatmap(dt.timedelta(minutes=15))
+        demand_heatmap.record(Location.must_create(5, 9), dt.datetime.now(dt.UTC))
+        demand_heatmap.record(Location.must_create(5, 1), dt.datetime.now(dt.UTC))
+
+        mock_uow: typing.Final = MagicMock()
+        mock_uow.courier.get_all_free = AsyncMock(return_value=[locked_courier, busy_courier])
+        mock_uow.courier.claim_by_id = AsyncMock(
+            side_effect=lambda courier_id: None if courier_id == locked_courier.id else claimed_busy_courier
+        )
+        self._mock_unit_of_work(monkeypatch, mock_uow)
+
+        handler: typing.Final = RebalanceCouriersCommandHandlerImpl(moves_per_tick=5, demand_heatmap=demand_heatmap)
+        result: typing.Final = await handler.handle(RebalanceCouriersCommand())
+
+        assert result.is_success
+        assert mock_uow.courier.claim_by_id.await_count == 2
+        assert locked_courier.location == Location.must_create(5, 5)
+        assert claimed_busy_courier.location == Location.must_create(5, 5)
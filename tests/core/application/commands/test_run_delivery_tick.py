@@ -0,0 +1,135 @@
+import typing
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from delivery.core.application.commands.assign_order_to_courier import AssignOrderToCourierCommandHandlerImpl
+from delivery.core.application.commands.move_couriers import (
+    FleetMove,
+    MoveCouriersCommandHandler,
+    MoveCouriersCommandHandlerImpl,
+    TickCompletion,
+)
+from delivery.core.application.commands.run_delivery_tick import (
+    RunDeliveryTickCommand,
+    RunDeliveryTickCommandHandlerImpl,
+)
+from delivery.core.ports.delivery_metrics import DeliveryMetrics
+from delivery.core.ports.unit_of_work import DeliveryUnitOfWork
+from delivery.libs.errs.error import Error
+from delivery.libs.errs.result import Result, UnitResult
+
+
+class TestRunDeliveryTickCommandHandler:
+    @pytest.fixture
+    def calls(self) -> list[str]:
+        return []
+
+    @pytest.fixture
+    def mock_uow(self, monkeypatch: pytest.MonkeyPatch, calls: list[str]) -> MagicMock:
+        mock_uow: typing.Final = MagicMock()
+
+        async def commit(*_: object) -> None:
+            calls.append("commit")
+
+        mock_start_cm: typing.Final = MagicMock()
+        mock_start_cm.__aenter__ = AsyncMock(return_value=mock_uow)
+        mock_start_cm.__aexit__ = AsyncMock(side_effect=commit)
+        monkeypatch.setattr(DeliveryUnitOfWork, "start", lambda: mock_start_cm)
+        return mock_uow
+
+    @pytest.fixture
+    def move_couriers_handler(self, calls: list[str]) -> MagicMock:
+        async def move_fleet(*_: object) -> Result[FleetMove, Error]:
+            calls.append("move")
+            return Result.success(FleetMove())
+
+        async def complete_arrivals(*_: object) -> Result[TickCompletion, Error]:
+            calls.append("complete")
+            return Result.success(TickCompletion())
+
+        async def finish_tick(*_: object) -> None:
+            calls.append("finish")
+
+        handler: typing.Final = MagicMock(spec=MoveCouriersCommandHandlerImpl)
+        handler.move_fleet = AsyncMock(side_effect=move_fleet)
+        handler.complete_arrivals = AsyncMock(side_effect=complete_arrivals)
+        handler.finish_tick = AsyncMock(side_effect=finish_tick)
+        return handler
+
+    @pytest.fixture
+    def assign_orders_handler(self, calls: list[str]) -> MagicMock:
+        async def assign(*_: object) -> Result[bool, Error]:
+            calls.append("assign")
+            return Result.success(False)
+
+        handler: typing.Final = MagicMock(spec=AssignOrderToCourierCommandHandlerImpl)
+        handler.assign = AsyncMock(side_effect=assign)
+        return handler
+
+    @pytest.mark.anyio
+    async def test_should_run_stages_in_one_unit_of_work_and_time_them(
+        self,
+        mock_uow: MagicMock,
+        move_couriers_handler: MagicMock,
+        assign_orders_handler: MagicMock,
+        calls: list[str],
+    ) -> None:
+        delivery_metrics: typing.Final = MagicMock(spec=DeliveryMetrics)
+        own_transaction_handler: typing.Final = MagicMock(spec=MoveCouriersCommandHandler)
+        handler: typing.Final = RunDeliveryTickCommandHandlerImpl(
+            own_transaction_handler, assign_orders_handler, delivery_metrics, fleet_move_handler=move_couriers_handler
+        )
+
+        result: typing.Final = await handler.handle(RunDeliveryTickCommand())
+
+        assert result.is_success
+        assert calls == ["move", "complete", "assign", "commit", "finish"]
+        move_couriers_handler.move_fleet.assert_awaited_once_with(mock_uow)
+        assign_orders_handler.assign.assert_awaited_once_with(mock_uow)
+        own_transaction_handler.handle.assert_not_called()
+        assert [call.args[0] for call in delivery_metrics.record_tick_stage_duration.call_args_list] == [
+            "move",
+            "complete",
+            "assign",
+            "commit",
+        ]
+
+    @pytest.mark.anyio
+    async def test_should_skip_assignment_when_move_fails(
+        self,
+        mock_uow: MagicMock,  # noqa: ARG002
+        move_couriers_handler: MagicMock,
+        assign_orders_handler: MagicMock,
+    ) -> None:
+        move_couriers_handler.move_fleet = AsyncMock(return_value=Result.failure(Error.of("move.failed", "Failed")))
+        handler: typing.Final = RunDeliveryTickCommandHandlerImpl(
+            MagicMock(spec=MoveCouriersCommandHandler), assign_orders_handler, fleet_move_handler=move_couriers_handler
+        )
+
+        result: typing.Final = await handler.handle(RunDeliveryTickCommand())
+
+        assert result.is_failure
+        assign_orders_handler.assign.assert_not_called()
+        move_couriers_handler.finish_tick.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_should_assign_after_own_transaction_of_other_movement_modes(
+        self,
+        mock_uow: MagicMock,
+        assign_orders_handler: MagicMock,
+        calls: list[str],
+    ) -> None:
+        async def move(*_: object) -> UnitResult[Error]:
+            calls.append("move")
+            return UnitResult.success()
+
+        move_couriers_handler: typing.Final = MagicMock(spec=MoveCouriersCommandHandler)
+        move_couriers_handler.handle = AsyncMock(side_effect=move)
+        handler: typing.Final = RunDeliveryTickCommandHandlerImpl(move_couriers_handler, assign_orders_handler)
+
+        result: typing.Final = await handler.handle(RunDeliveryTickCommand())
+
+        assert result.is_success
+        assert calls == ["move", "assign", "commit"]
+        assign_orders_handler.assign.assert_awaited_once_with(mock_uow)
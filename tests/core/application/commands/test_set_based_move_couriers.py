@@ -0,0 +1,103 @@
+import contextlib
+import datetime as dt
+import json
+import typing
+import uuid
+from unittest.mock import MagicMock
+
+import pytest
+import sqlalchemy
+import sqlalchemy.ext.asyncio as sa_async
+
+from delivery.adapters.out.postgres.courier_repository import CourierRepositoryImpl
+from delivery.adapters.out.postgres.order_repository import OrderRepositoryImpl
+from delivery.core.application.commands.move_couriers import (
+    MoveCouriersCommand,
+    SetBasedMoveCouriersCommandHandlerImpl,
+)
+from delivery.core.domain.model.courier.courier import Courier
+from delivery.core.domain.model.kernel import DeliveryPeriod, Location, Volume
+from delivery.core.domain.model.order.order import Order
+from delivery.core.domain.model.order.order_status import OrderStatus
+from delivery.core.ports.delivery_metrics import DeliveryMetrics
+from delivery.core.ports.dispatch_trigger import DispatchTrigger
+from delivery.database.models import OutboxMessageModel
+
+
+@pytest.fixture
+def session(db_connection: sa_async.AsyncConnection) -> sa_async.AsyncSession:
+    return sa_async.AsyncSession(db_connection, expire_on_commit=False)
+
+
+@pytest.mark.usefixtures("_rollback_database")
+class TestSetBasedMoveCouriersCommandHandler:
+    @staticmethod
+    async def _add_assigned_order(
+        session: sa_async.AsyncSession,
+        courier: Courier,
+        location: Location,
+        delivery_period: DeliveryPeriod | None = None,
+    ) -> Order:
+        order: typing.Final = Order.must_create(uuid.uuid4(), location, Volume.must_create(1), delivery_period)
+        assert order.assign(courier.id).is_success  # type: ignore[arg-type]
+        assert courier.take_order(order.id, order.volume).is_success  # type: ignore[arg-type]
+        await OrderRepositoryImpl(session).add(order)
+        return order
+
+    async def test_should_move_couriers_like_domain_move(self, session: sa_async.AsyncSession) -> None:
+        courier: typing.Final = Courier.must_create(name="Test", speed=3, location=Location.must_create(1, 1))
+        courier_repository: typing.Final = CourierRepositoryImpl(session)
+        await courier_repository.add(courier)
+        order: typing.Final = await self._add_assigned_order(session, courier, Location.must_create(2, 9))
+        await courier_repository.flush_changes()
+        await session.flush()
+
+        result: typing.Final = await SetBasedMoveCouriersCommandHandlerImpl(
+            lambda: contextlib.nullcontext(session)
+        ).handle(MoveCouriersCommand())
+
+        assert result.is_success
+        assert courier.move(order.location).is_success
+        moved: typing.Final = await CourierRepositoryImpl(session).get_by_id(courier.id)  # type: ignore[arg-type]
+        assert moved is not None
+        assert moved.location == courier.location
+
+    async def test_should_complete_arrived_orders_and_write_outbox(self, session: sa_async.AsyncSession) -> None:
+        dispatch_trigger: typing.Final = MagicMock(spec=DispatchTrigger)
+        delivery_metrics: typing.Final = MagicMock(spec=DeliveryMetrics)
+        courier: typing.Final = Courier.must_create(name="Test", speed=5, location=Location.must_create(4, 4))
+        courier_repository: typing.Final = CourierRepositoryImpl(session)
+        await courier_repository.add(courier)
+        window_end: typing.Final = dt.datetime.now(dt.UTC) - dt.timedelta(hours=1)
+        order: typing.Final = await self._add_assigned_order(
+            session,
+            courier,
+            Location.must_create(5, 5),
+            DeliveryPeriod.must_create(window_end - dt.timedelta(hours=2), window_end),
+        )
+        await courier_repository.flush_changes()
+        await session.flush()
+
+        result: typing.Final = await SetBasedMoveCouriersCommandHandlerImpl(
+            lambda: contextlib.nullcontext(session), dispatch_trigger, delivery_metrics
+        ).handle(MoveCouriersCommand())
+
+        assert result.is_success
+        completed: typing.Final = await OrderRepositoryImpl(session).get_by_id(order.id)  # type: ignore[arg-type]
+        assert completed is not None
+        assert completed.status == OrderStatus.COMPLETED
+        freed: typing.Final = await CourierRepositoryImpl(session).get_by_id(courier.id)  # type: ignore[arg-type]
+        assert freed is not None
+        assert all(not place.is_occupied() for place in freed.storage_places)
+
+        outbox: typing.Final = (
+            await session.execute(
+                sqlalchemy.select(OutboxMessageModel).where(OutboxMessageModel.aggregate_id == order.id)
+            )
+        ).scalar_one()
+        assert outbox.event_type == "OrderCompletedDomainEvent"
+        assert outbox.aggregate_type == "Order"
+        assert json.loads(outbox.payload)["order_id"] == str(order.id)
+        assert json.loads(outbox.payload)["event_id"] == str(outbox.id)
+        dispatch_trigger.notify.assert_called_once()
+        delivery_metrics.record_missed_delivery_windows.assert_called_once_with(1)
@@ -1,3 +1,4 @@
+import datetime as dt
 import typing
 from unittest.mock import AsyncMock, MagicMock
 
@@ -18,6 +19,17 @@ class TestGetAllCouriersQueryHandler:
     def mock_session(self) -> MagicMock:
         return MagicMock()
 
+    @staticmethod
+    def _mock_connection(
+        mock_session: MagicMock, couriers: list[tuple[object, ...]], stops: list[tuple[object, ...]]
+    ) -> MagicMock:
+        couriers_result: typing.Final = MagicMock()
+        couriers_result.all.return_value = couriers
+        mock_connection: typing.Final = MagicMock()
+        mock_connection.execute = AsyncMock(side_effect=[couriers_result, stops])
+        mock_session.connection = AsyncMock(return_value=mock_connection)
+        return mock_connection
+
     @pytest.fixture
     def handler(
         self,
@@ -35,9 +47,7 @@ class TestGetAllCouriersQueryHandler:
     ) -> None:
         query: typing.Final = GetAllCouriersQuery()
 
-        mock_result: typing.Final = MagicMock()
-        mock_result.scalars.return_value.unique.return_value.all.return_value = []
-        mock_session.execute = AsyncMock(return_value=mock_result)
+        self._mock_connection(mock_session, couriers=[], stops=[])
 
         result: typing.Final = await handler.handle(query)
 
@@ -55,21 +65,14 @@ class TestGetAllCouriersQueryHandler:
         courier1: typing.Final = create_test_courier(name="Courier 1", location=Location.must_create(1, 1))
         courier2: typing.Final = create_test_courier(name="Courier 2", location=Location.must_create(2, 2))
 
-        mock_model1: typing.Final = MagicMock()
-        mock_model1.id = courier1.id
-        mock_model1.name = courier1.name
-        mock_model1.location_x = 1
-        mock_model1.location_y = 1
-
-        mock_model2: typing.Final = MagicMock()
-        mock_model2.id = courier2.id
-        mock_model2.name = courier2.name
-        mock_model2.location_x = 2
-        mock_model2.location_y = 2
-
-        mock_result: typing.Final = MagicMock()
-        mock_result.scalars.return_value.unique.return_value.all.return_value = [mock_model1, mock_model2]
-        mock_session.execute = AsyncMock(return_value=mock_result)
+        self._mock_connection(
+            mock_session,
+            couriers=[
+                (courier1.id, courier1.name, courier1.speed, 1, 1),
+                (courier2.id, courier2.name, courier2.speed, 2, 2),
+            ],
+            stops=[],
+        )
 
         result: typing.Final = await handler.handle(query)
 
@@ -81,3 +84,25 @@ class TestGetAllCouriersQueryHandler:
         assert dto_list[0].name == "Courier 1"
         assert dto_list[0].location_x == 1
         assert dto_list[0].location_y == 1
+
+    @pytest.mark.anyio
+    async def test_get_all_couriers_should_derive_location_on_route(
+        self,
+        handler: GetAllCouriersQueryHandler,
+        mock_session: MagicMock,
+    ) -> None:
+        courier: typing.Final = create_test_courier(speed=2, location=Location.must_create(1, 1))
+
+        # Четыре шага по 2 клетки, из которых один уже пройден
+        arrives_at: typing.Final = dt.datetime.now(dt.UTC) + dt.timedelta(seconds=2, milliseconds=500)
+        self._mock_connection(
+            mock_session,
+            couriers=[(courier.id, courier.name, 2, 1, 1)],
+            stops=[(courier.id, 9, 1, arrives_at)],
+        )
+
+        result: typing.Final = await handler.handle(GetAllCouriersQuery())
+
+        assert result.is_success
+        dto: typing.Final = result.get_value()[0]
+        assert (dto.location_x, dto.location_y) == (3, 1)
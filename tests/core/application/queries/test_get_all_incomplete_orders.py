@@ -1,4 +1,5 @@
 import typing
+import uuid
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -10,7 +11,6 @@ from delivery.core.application.queries.get_all_incomplete_orders import (
     GetAllIncompleteOrdersQueryHandlerImpl,
     IncompleteOrderDto,
 )
-from delivery.database.models import OrderModel
 
 
 class TestGetAllIncompleteOrdersQueryHandler:
@@ -35,9 +35,9 @@ class TestGetAllIncompleteOrdersQueryHandler:
     ) -> None:
         query: typing.Final = GetAllIncompleteOrdersQuery()
 
-        mock_result: typing.Final = MagicMock()
-        mock_result.scalars().unique().all = MagicMock(return_value=[])
-        mock_session.execute = AsyncMock(return_value=mock_result)
+        mock_connection: typing.Final = MagicMock(spec=sa_async.AsyncConnection)
+        mock_connection.execute = AsyncMock(return_value=[])
+        mock_session.connection = AsyncMock(return_value=mock_connection)
 
         result: typing.Final = await handler.handle(query)
 
@@ -53,21 +53,12 @@ class TestGetAllIncompleteOrdersQueryHandler:
         # Arrange
         query: typing.Final = GetAllIncompleteOrdersQuery()
 
-        order_model1: typing.Final = MagicMock(spec=OrderModel)
-        order_model1.id = "11111111-1111-1111-1111-111111111111"
-        order_model1.location_x = 5
-        order_model1.location_y = 6
-        order_model1.status = "Created"
+        order_id1: typing.Final = uuid.UUID("11111111-1111-1111-1111-111111111111")
+        order_id2: typing.Final = uuid.UUID("22222222-2222-2222-2222-222222222222")
 
-        order_model2: typing.Final = MagicMock(spec=OrderModel)
-        order_model2.id = "22222222-2222-2222-2222-222222222222"
-        order_model2.location_x = 7
-        order_model2.location_y = 8
-        order_model2.status = "Assigned"
-
-        mock_result: typing.Final = MagicMock()
-        mock_result.scalars().unique().all = MagicMock(return_value=[order_model1, order_model2])
-        mock_session.execute = AsyncMock(return_value=mock_result)
+        mock_connection: typing.Final = MagicMock(spec=sa_async.AsyncConnection)
+        mock_connection.execute = AsyncMock(return_value=[(order_id1, 5, 6), (order_id2, 7, 8)])
+        mock_session.connection = AsyncMock(return_value=mock_connection)
 
         # Act
         result: typing.Final = await handler.handle(query)
@@ -77,6 +68,6 @@ class TestGetAllIncompleteOrdersQueryHandler:
         dto_list: typing.Final = result.get_value()
         assert len(dto_list) == 2
         assert isinstance(dto_list[0], IncompleteOrderDto)
-        assert str(dto_list[0].id) == str(order_model1.id)
+        assert dto_list[0].id == order_id1
         assert dto_list[0].location_x == 5
         assert dto_list[0].location_y == 6
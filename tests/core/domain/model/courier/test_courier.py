@@ -374,6 +374,22 @@ class TestCourierMove:
         error: typing.Final = result.get_error()
         assert "value.is.required" in error.code
 
+    def test_relocate(self) -> None:
+        courier: typing.Final = Courier.must_create("Иван", 2, Location.must_create(5, 5))
+
+        result: typing.Final = courier.relocate(Location.must_create(6, 6))
+
+        assert result.is_success
+        assert courier.location == Location.must_create(6, 6)
+
+    def test_relocate_with_none_location(self) -> None:
+        courier: typing.Final = Courier.must_create("Иван", 2, Location.must_create(5, 5))
+
+        result: typing.Final = courier.relocate(None)  # type: ignore[arg-type]
+
+        assert result.is_failure
+        assert "value.is.required" in result.get_error().code
+
     def test_move_out_of_bounds(self) -> None:
         location: typing.Final = Location.must_create(10, 10)
         target: typing.Final = Location.must_create(1, 1)
@@ -1,3 +1,4 @@
+import datetime as dt
 import typing
 from uuid import uuid4
 
@@ -119,6 +120,61 @@ class TestOrderAssign:
         assert "order.already.assigned" in error.code
 
 
+class TestOrderReserve:
+    def test_reserve_created_order(self) -> None:
+        order: typing.Final = Order.must_create(uuid4(), Location.must_create(5, 5), Volume.must_create(10))
+        courier_id: typing.Final = uuid4()
+
+        result: typing.Final = order.reserve(courier_id)
+
+        assert result.is_success
+        assert order.status == OrderStatus.CREATED
+        assert order.reserved_courier_id == courier_id
+        assert order.courier_id is None
+
+    def test_reserve_assigned_order(self) -> None:
+        order: typing.Final = Order.must_create(uuid4(), Location.must_create(5, 5), Volume.must_create(10))
+        order.assign(uuid4())
+
+        result: typing.Final = order.reserve(uuid4())
+
+        assert result.is_failure
+        assert "order.already.assigned" in result.get_error().code
+        assert order.reserved_courier_id is None
+
+    def test_assign_clears_reservation(self) -> None:
+        order: typing.Final = Order.must_create(uuid4(), Location.must_create(5, 5), Volume.must_create(10))
+        courier_id: typing.Final = uuid4()
+        order.reserve(courier_id)
+
+        result: typing.Final = order.assign(courier_id)
+
+        assert result.is_success
+        assert order.courier_id == courier_id
+        assert order.reserved_courier_id is None
+
+
+class TestOrderScheduleArrival:
+    def test_schedule_arrival_for_assigned_order(self) -> None:
+        order: typing.Final = Order.must_create(uuid4(), Location.must_create(5, 5), Volume.must_create(10))
+        order.assign(uuid4())
+        arrives_at: typing.Final = dt.datetime(2026, 1, 1, 12, tzinfo=dt.UTC)
+
+        result: typing.Final = order.schedule_arrival(arrives_at)
+
+        assert result.is_success
+        assert order.estimated_arrival_at == arrives_at
+
+    def test_schedule_arrival_for_created_order(self) -> None:
+        order: typing.Final = Order.must_create(uuid4(), Location.must_create(5, 5), Volume.must_create(10))
+
+        result: typing.Final = order.schedule_arrival(dt.datetime(2026, 1, 1, 12, tzinfo=dt.UTC))
+
+        assert result.is_failure
+        assert "order.not.assigned" in result.get_error().code
+        assert order.estimated_arrival_at is None
+
+
 class TestOrderComplete:
     def test_complete_assigned_order(self) -> None:
         order_id: typing.Final = uuid4()
@@ -1,8 +1,9 @@
+import datetime as dt
 import typing
 
 import pytest
 
-from delivery.core.domain.model.kernel import Location
+from delivery.core.domain.model.kernel import DeliveryPeriod, Location
 from delivery.libs.errs.error import DomainInvariantError
 
 
@@ -168,3 +169,47 @@ class TestLocationDistance:
         distance: typing.Final = location1.distance_to(location2)
 
         assert distance == expected_distance
+
+
+class TestLocationCellId:
+    def test_cell_ids_are_dense_and_unique(self) -> None:
+        cell_ids: typing.Final = [Location.must_create(x, y).cell_id for x in range(1, 11) for y in range(1, 11)]
+
+        assert sorted(cell_ids) == list(range(Location.cells_count()))
+
+    @pytest.mark.parametrize(
+        ("x", "y"),
+        [(1, 1), (10, 10), (3, 7), (10, 1)],
+    )
+    def test_from_cell_id_restores_location(self, x: int, y: int) -> None:
+        location: typing.Final = Location.must_create(x, y)
+
+        assert Location.from_cell_id(location.cell_id) == location
+
+
+class TestDeliveryPeriod:
+    def test_create_valid_period(self) -> None:
+        start: typing.Final = dt.datetime(2026, 10, 17, 9, tzinfo=dt.UTC)
+        end: typing.Final = dt.datetime(2026, 10, 17, 12, tzinfo=dt.UTC)
+
+        result: typing.Final = DeliveryPeriod.create(start, end)
+
+        assert result.is_success
+        assert result.get_value().start == start
+        assert result.get_value().end == end
+
+    def test_create_period_with_end_before_start(self) -> None:
+        start: typing.Final = dt.datetime(2026, 10, 17, 12, tzinfo=dt.UTC)
+        end: typing.Final = dt.datetime(2026, 10, 17, 9, tzinfo=dt.UTC)
+
+        result: typing.Final = DeliveryPeriod.create(start, end)
+
+        assert result.is_failure
+        assert result.get_error().code == "delivery.period.invalid"
+
+    def test_is_missed_only_after_end(self) -> None:
+        end: typing.Final = dt.datetime(2026, 10, 17, 12, tzinfo=dt.UTC)
+        period: typing.Final = DeliveryPeriod.must_create(end - dt.timedelta(hours=3), end)
+
+        assert not period.is_missed_at(end)
+        assert period.is_missed_at(end + dt.timedelta(seconds=1))
@@ -0,0 +1,31 @@
+import typing
+
+import pytest
+
+from delivery.core.domain.model.kernel import Location
+from delivery.core.domain.model.travel_time import TravelTimeTable, get_travel_time_table
+
+
+class TestTravelTimeTable:
+    @pytest.fixture
+    def table(self) -> TravelTimeTable:
+        return get_travel_time_table()
+
+    def test_distance_matches_location_distance_for_all_cells(self, table: TravelTimeTable) -> None:
+        cells: typing.Final = [Location.from_cell_id(cell_id) for cell_id in range(Location.cells_count())]
+
+        for source in cells:
+            for target in cells:
+                assert table.distance(source, target) == source.distance_to(target)
+
+    @pytest.mark.parametrize("speed", [1, 2, 3, 7, 17, 18, 19, 100])
+    def test_steps_match_ceil_division(self, table: TravelTimeTable, speed: int) -> None:
+        cells: typing.Final = [Location.from_cell_id(cell_id) for cell_id in range(Location.cells_count())]
+
+        for source in cells:
+            for target in cells:
+                distance = source.distance_to(target)
+                assert table.steps(speed, source, target) == (distance + speed - 1) // speed
+
+    def test_table_is_built_once(self) -> None:
+        assert get_travel_time_table() is get_travel_time_table()
@@ -0,0 +1,103 @@
+import random
+import typing
+import uuid
+
+import pytest
+
+from delivery.core.domain.model.courier.courier import Courier
+from delivery.core.domain.model.kernel import Location, Volume
+from delivery.core.domain.model.order.order import Order
+from delivery.core.domain.service import OrderDispatchDomainService
+from delivery.core.domain.service.courier_fleet_arrays import CourierFleetArrays
+
+
+class TestCourierFleetArrays:
+    @pytest.fixture
+    def dispatch_service(self) -> OrderDispatchDomainService:
+        return OrderDispatchDomainService()
+
+    @staticmethod
+    def _create_courier(speed: int, x: int, y: int) -> Courier:
+        return Courier.must_create(name="Courier", speed=speed, location=Location.must_create(x, y))
+
+    @staticmethod
+    def _create_order(x: int, y: int, volume: int) -> Order:
+        return Order.must_create(
+            id_=uuid.uuid4(),
+            location=Location.must_create(x, y),
+            volume=Volume.must_create(volume),
+        )
+
+    def test_times_to_location_match_courier(self) -> None:
+        couriers: typing.Final = [
+            self._create_courier(speed=1, x=1, y=1),
+            self._create_courier(speed=3, x=10, y=2),
+            self._create_courier(speed=7, x=4, y=9),
+        ]
+        fleet: typing.Final = CourierFleetArrays(couriers)
+        target: typing.Final = Location.must_create(6, 6)
+
+        times: typing.Final = fleet.times_to_location(target)
+
+        assert times.tolist() == [courier.calculate_time_to_location(target) for courier in couriers]
+
+    def test_find_fastest_returns_none_without_capacity(self) -> None:
+        courier: typing.Final = self._create_courier(speed=1, x=1, y=1)
+        courier.take_order(uuid.uuid4(), Volume.must_create(1))
+        fleet: typing.Final = CourierFleetArrays([courier])
+
+        assert fleet.find_fastest(Location.must_create(2, 2), 1) is None
+
+    def test_find_fastest_breaks_ties_by_list_order(self) -> None:
+        first: typing.Final = self._create_courier(speed=2, x=7, y=5)
+        second: typing.Final = self._create_courier(speed=2, x=5, y=6)
+        fleet: typing.Final = CourierFleetArrays([first, second])
+
+        assert fleet.find_fastest(Location.must_create(5, 5), 1) is first
+
+    def test_exclude_skips_courier(self) -> None:
+        near: typing.Final = self._create_courier(speed=1, x=5, y=5)
+        far: typing.Final = self._create_courier(speed=1, x=10, y=10)
+        fleet: typing.Final = CourierFleetArrays([near, far])
+
+        fleet.exclude(near)
+
+        assert fleet.find_fastest(Location.must_create(5, 5), 1) is far
+
+    def test_dispatch_order_vectorized_no_suitable_courier(
+        self,
+        dispatch_service: OrderDispatchDomainService,
+    ) -> None:
+        fleet: typing.Final = CourierFleetArrays([self._create_courier(speed=1, x=1, y=1)])
+        order: typing.Final = self._create_order(x=5, y=5, volume=50)
+
+        result: typing.Final = dispatch_service.dispatch_order_vectorized(order, fleet)
+
+        assert result.is_failure
+        assert result.get_error().code == "order.dispatch.no.suitable.courier"
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_dispatch_order_vectorized_matches_reference(
+        self,
+        dispatch_service: OrderDispatchDomainService,
+        seed: int,
+    ) -> None:
+        rng: typing.Final = random.Random(seed)
+        couriers: typing.Final = []
+        for _ in range(rng.randint(1, 40)):
+            courier = self._create_courier(speed=rng.randint(1, 3), x=rng.randint(1, 10), y=rng.randint(1, 10))
+            courier.add_storage_place("Extra", rng.randint(1, 20))
+            if rng.random() < 0.5:
+                courier.take_order(uuid.uuid4(), Volume.must_create(rng.randint(1, 10)))
+            couriers.append(courier)
+        fleet: typing.Final = CourierFleetArrays(couriers)
+
+        for _ in range(20):
+            order = self._create_order(x=rng.randint(1, 10), y=rng.randint(1, 10), volume=rng.randint(1, 20))
+
+            expected = dispatch_service.dispatch_order(order, couriers)
+            actual = dispatch_service.dispatch_order_vectorized(order, fleet)
+
+            assert actual.is_success == expected.is_success
+            if expected.is_success:
+                assert actual.get_value() is expected.get_value()
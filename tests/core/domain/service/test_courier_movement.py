@@ -0,0 +1,59 @@
+import random
+import typing
+
+import numpy as np
+
+from delivery.core.domain.model.courier.courier import Courier
+from delivery.core.domain.model.kernel import Location
+from delivery.core.domain.service.courier_movement import move_couriers_towards, move_towards
+
+
+class TestCourierMovement:
+    @staticmethod
+    def _create_courier(speed: int, x: int, y: int) -> Courier:
+        return Courier.must_create(name="Courier", speed=speed, location=Location.must_create(x, y))
+
+    def test_step_matches_scalar_move(self) -> None:
+        rng: typing.Final = random.Random(42)
+        couriers: typing.Final = [
+            self._create_courier(speed=rng.randint(1, 20), x=rng.randint(1, 10), y=rng.randint(1, 10))
+            for _ in range(500)
+        ]
+        targets: typing.Final = [Location.must_create(rng.randint(1, 10), rng.randint(1, 10)) for _ in couriers]
+
+        step: typing.Final = move_couriers_towards(couriers, targets)
+
+        for position, (courier, target) in enumerate(zip(couriers, targets, strict=True)):
+            assert courier.move(target).is_success
+            assert step.location(position) == courier.location
+            assert bool(step.arrived[position]) == (courier.location == target)
+
+    def test_step_moves_x_first_then_spends_remaining_range_on_y(self) -> None:
+        step: typing.Final = move_towards(
+            x=np.array([1, 5], dtype=np.int64),
+            y=np.array([1, 5], dtype=np.int64),
+            target_x=np.array([3, 5], dtype=np.int64),
+            target_y=np.array([10, 1], dtype=np.int64),
+            speed=np.array([4, 2], dtype=np.int64),
+        )
+
+        assert step.x.tolist() == [3, 5]
+        assert step.y.tolist() == [3, 3]
+        assert step.arrived.tolist() == [False, False]
+
+    def test_step_marks_arrived_couriers(self) -> None:
+        couriers: typing.Final = [
+            self._create_courier(speed=3, x=2, y=2),
+            self._create_courier(speed=1, x=4, y=4),
+        ]
+        targets: typing.Final = [Location.must_create(3, 4), Location.must_create(4, 4)]
+
+        step: typing.Final = move_couriers_towards(couriers, targets)
+
+        assert step.arrived.tolist() == [True, True]
+        assert step.location(0) == Location.must_create(3, 4)
+
+    def test_step_with_no_couriers(self) -> None:
+        step: typing.Final = move_couriers_towards([], [])
+
+        assert len(step) == 0
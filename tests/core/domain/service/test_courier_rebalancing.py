@@ -0,0 +1,32 @@
+import typing
+
+from delivery.core.domain.model.courier.courier import Courier
+from delivery.core.domain.model.kernel import Location
+from delivery.core.domain.service.courier_rebalancing import plan_rebalancing
+
+
+class TestPlanRebalancing:
+    def test_should_send_nearest_courier_to_busiest_cell(self) -> None:
+        near: typing.Final = Courier.must_create(name="Near", speed=1, location=Location.must_create(8, 8))
+        far: typing.Final = Courier.must_create(name="Far", speed=1, location=Location.must_create(1, 1))
+        hotspots: typing.Final = [Location.must_create(9, 9), Location.must_create(2, 2)]
+
+        moves: typing.Final = plan_rebalancing([far, near], hotspots, budget=1)
+
+        assert moves == [(near, Location.must_create(9, 9))]
+
+    def test_should_keep_courier_already_standing_on_hotspot(self) -> None:
+        standing: typing.Final = Courier.must_create(name="Standing", speed=1, location=Location.must_create(9, 9))
+        other: typing.Final = Courier.must_create(name="Other", speed=1, location=Location.must_create(1, 1))
+        hotspots: typing.Final = [Location.must_create(9, 9), Location.must_create(2, 2)]
+
+        moves: typing.Final = plan_rebalancing([standing, other], hotspots, budget=5)
+
+        assert moves == [(other, Location.must_create(2, 2))]
+
+    def test_should_respect_budget_and_empty_input(self) -> None:
+        courier: typing.Final = Courier.must_create(name="Test", speed=1, location=Location.must_create(1, 1))
+
+        assert plan_rebalancing([courier], [Location.must_create(5, 5)], budget=0) == []
+        assert plan_rebalancing([], [Location.must_create(5, 5)], budget=3) == []
+        assert plan_rebalancing([courier], [], budget=3) == []
@@ -0,0 +1,59 @@
+import datetime as dt
+import random
+import typing
+
+from delivery.core.domain.model.courier.courier import Courier
+from delivery.core.domain.model.kernel import Location
+from delivery.core.domain.service.courier_route import (
+    TICK_DURATION,
+    advance_along_route,
+    estimate_arrival,
+    locate_on_route,
+)
+
+
+class TestCourierRoute:
+    def test_advance_matches_repeated_move(self) -> None:
+        rng: typing.Final = random.Random(7)
+        for _ in range(300):
+            origin = Location.must_create(rng.randint(1, 10), rng.randint(1, 10))
+            target = Location.must_create(rng.randint(1, 10), rng.randint(1, 10))
+            speed = rng.randint(1, 5)
+            ticks = rng.randint(0, 6)
+            courier = Courier.must_create(name="Courier", speed=speed, location=origin)
+            for _ in range(ticks):
+                assert courier.move(target).is_success
+
+            assert advance_along_route(origin, target, speed, ticks) == courier.location
+
+    def test_estimate_arrival_counts_ticks(self) -> None:
+        departure_at: typing.Final = dt.datetime(2026, 1, 1, tzinfo=dt.UTC)
+
+        arrives_at: typing.Final = estimate_arrival(
+            Location.must_create(1, 1), departure_at, Location.must_create(4, 5), speed=2
+        )
+
+        assert arrives_at == departure_at + 4 * TICK_DURATION
+
+    def test_locate_on_route_derives_position_between_stops(self) -> None:
+        departure_at: typing.Final = dt.datetime(2026, 1, 1, tzinfo=dt.UTC)
+        origin: typing.Final = Location.must_create(1, 1)
+        first_stop: typing.Final = Location.must_create(5, 1)
+        second_stop: typing.Final = Location.must_create(5, 9)
+        first_arrival: typing.Final = estimate_arrival(origin, departure_at, first_stop, speed=2)
+        second_arrival: typing.Final = estimate_arrival(first_stop, first_arrival, second_stop, speed=2)
+        stops: typing.Final = [(second_stop, second_arrival), (first_stop, first_arrival)]
+
+        assert locate_on_route(origin, 2, stops, departure_at) == origin
+        assert locate_on_route(origin, 2, stops, departure_at + TICK_DURATION) == Location.must_create(3, 1)
+        assert locate_on_route(origin, 2, stops, first_arrival) == first_stop
+        assert locate_on_route(origin, 2, stops, first_arrival + 3 * TICK_DURATION) == Location.must_create(5, 7)
+        assert locate_on_route(origin, 2, stops, second_arrival + TICK_DURATION) == second_stop
+
+    def test_locate_on_route_waits_at_origin_before_departure(self) -> None:
+        departure_at: typing.Final = dt.datetime(2026, 1, 1, tzinfo=dt.UTC)
+        origin: typing.Final = Location.must_create(1, 1)
+        target: typing.Final = Location.must_create(3, 3)
+        arrives_at: typing.Final = estimate_arrival(origin, departure_at, target, speed=1)
+
+        assert locate_on_route(origin, 1, [(target, arrives_at)], departure_at - TICK_DURATION) == origin
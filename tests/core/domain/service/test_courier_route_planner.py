@@ -0,0 +1,62 @@
+import typing
+import uuid
+
+import pytest
+
+from delivery.core.domain.model.courier.courier import Courier
+from delivery.core.domain.model.kernel import Location
+from delivery.core.domain.service import courier_route_planner
+from delivery.core.domain.service.courier_route_planner import CourierRoutePlanner, plan_stop_sequence
+from tests.test_fixtures import create_test_order
+
+
+class TestPlanStopSequence:
+    def test_should_visit_stops_on_the_way_first(self) -> None:
+        stops: typing.Final = [Location.must_create(9, 1), Location.must_create(2, 1), Location.must_create(5, 1)]
+
+        assert plan_stop_sequence(Location.must_create(1, 1), stops) == [1, 2, 0]
+
+    def test_should_untangle_greedy_route(self) -> None:
+        # Ближайший сосед сначала уходит вправо и возвращается за (2, 10): 24 клетки вместо 16
+        stops: typing.Final = [
+            Location.must_create(9, 3),
+            Location.must_create(6, 10),
+            Location.must_create(8, 10),
+            Location.must_create(2, 10),
+        ]
+
+        assert plan_stop_sequence(Location.must_create(4, 10), stops) == [3, 1, 2, 0]
+
+    def test_should_return_empty_sequence_without_stops(self) -> None:
+        assert plan_stop_sequence(Location.must_create(1, 1), []) == []
+
+
+class TestCourierRoutePlanner:
+    def test_should_replan_only_when_orders_change(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        plans: typing.Final[list[int]] = []
+        original_plan: typing.Final = courier_route_planner.plan_stop_sequence
+
+        def counting_plan(origin: Location, stops: list[Location]) -> list[int]:
+            plans.append(len(stops))
+            return original_plan(origin, stops)
+
+        monkeypatch.setattr(courier_route_planner, "plan_stop_sequence", counting_plan)
+        planner: typing.Final = CourierRoutePlanner()
+        courier: typing.Final = Courier.must_create(name="Test", speed=1, location=Location.must_create(1, 1))
+        far: typing.Final = create_test_order(location=Location.must_create(9, 1), courier_id=courier.id)
+        near: typing.Final = create_test_order(location=Location.must_create(3, 1), courier_id=courier.id)
+
+        assert planner.sequence(courier, [far, near]) == [near, far]
+        assert planner.sequence(courier, [far, near]) == [near, far]
+        assert planner.sequence(courier, [far]) == [far]
+
+        assert plans == [2, 1]
+
+    def test_retain_should_forget_couriers_without_orders(self) -> None:
+        planner: typing.Final = CourierRoutePlanner()
+        courier: typing.Final = Courier.must_create(name="Test", speed=1, location=Location.must_create(1, 1))
+        planner.sequence(courier, [create_test_order(location=Location.must_create(3, 1), courier_id=courier.id)])
+
+        planner.retain([uuid.uuid4()])
+
+        assert len(planner) == 0
@@ -0,0 +1,88 @@
+import random
+import typing
+import uuid
+
+import pytest
+
+from delivery.core.domain.model.courier.courier import Courier
+from delivery.core.domain.model.kernel import Location, Volume
+from delivery.core.domain.model.order.order import Order
+from delivery.core.domain.service import OrderDispatchDomainService
+from delivery.core.domain.service.courier_spatial_index import CourierSpatialIndex
+
+
+class TestCourierSpatialIndex:
+    @staticmethod
+    def _create_courier(speed: int, x: int, y: int) -> Courier:
+        return Courier.must_create(name="Courier", speed=speed, location=Location.must_create(x, y))
+
+    @staticmethod
+    def _create_order(x: int, y: int, volume: int) -> Order:
+        return Order.must_create(
+            id_=uuid.uuid4(),
+            location=Location.must_create(x, y),
+            volume=Volume.must_create(volume),
+        )
+
+    @staticmethod
+    def _full_scan(couriers: list[Courier], order: Order, limit: int) -> list[Courier]:
+        def time_to_order(courier: Courier) -> int:
+            return courier.calculate_time_to_location(order.location)
+
+        suitable: typing.Final = [courier for courier in couriers if courier.can_take_order(order.volume.value)]
+        return sorted(suitable, key=time_to_order)[:limit]
+
+    def test_find_nearest_in_empty_index(self) -> None:
+        index: typing.Final = CourierSpatialIndex()
+
+        assert index.find_nearest(Location.must_create(5, 5), 1) == []
+
+    def test_find_nearest_prefers_faster_courier_further_away(self) -> None:
+        near_slow: typing.Final = self._create_courier(speed=1, x=4, y=4)
+        far_fast: typing.Final = self._create_courier(speed=10, x=10, y=10)
+        index: typing.Final = CourierSpatialIndex([near_slow, far_fast])
+
+        nearest: typing.Final = index.find_nearest(Location.must_create(1, 1), 1)
+
+        assert nearest == [far_fast]
+
+    def test_find_nearest_skips_couriers_without_capacity(self) -> None:
+        busy: typing.Final = self._create_courier(speed=1, x=5, y=5)
+        busy.take_order(uuid.uuid4(), Volume.must_create(5))
+        free: typing.Final = self._create_courier(speed=1, x=9, y=9)
+        index: typing.Final = CourierSpatialIndex([busy, free])
+
+        assert index.find_nearest(Location.must_create(5, 5), 5) == [free]
+
+    def test_find_nearest_breaks_ties_by_insertion_order(self) -> None:
+        first: typing.Final = self._create_courier(speed=2, x=7, y=5)
+        second: typing.Final = self._create_courier(speed=2, x=5, y=6)
+        index: typing.Final = CourierSpatialIndex([first, second])
+
+        assert index.find_nearest(Location.must_create(5, 5), 1) == [first]
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_find_nearest_matches_full_scan(self, seed: int) -> None:
+        rng: typing.Final = random.Random(seed)
+        couriers: typing.Final = [
+            self._create_courier(speed=rng.randint(1, 4), x=rng.randint(1, 10), y=rng.randint(1, 10))
+            for _ in range(rng.randint(1, 40))
+        ]
+        for courier in couriers:
+            if rng.random() < 0.3:
+                courier.take_order(uuid.uuid4(), Volume.must_create(rng.randint(1, 10)))
+        index: typing.Final = CourierSpatialIndex(couriers)
+        dispatch_service: typing.Final = OrderDispatchDomainService()
+
+        for _ in range(20):
+            order = self._create_order(x=rng.randint(1, 10), y=rng.randint(1, 10), volume=rng.randint(1, 10))
+
+            expected = dispatch_service.dispatch_order(order, couriers)
+            nearest = index.find_nearest(order.location, order.volume.value)
+
+            assert bool(nearest) == expected.is_success
+            if expected.is_success:
+                assert nearest[0] is expected.get_value()
+
+            top = index.find_nearest(order.location, order.volume.value, limit=5)
+            assert top == self._full_scan(couriers, order, limit=5)
@@ -0,0 +1,55 @@
+import datetime as dt
+import typing
+import uuid
+
+from delivery.core.domain.model.kernel import DeliveryPeriod, Location, Volume
+from delivery.core.domain.model.order.order import Order
+from delivery.core.domain.service import DeliveryDeadlineQueue
+
+
+_DAY_START: typing.Final = dt.datetime(2026, 10, 17, tzinfo=dt.UTC)
+
+
+def _create_order(end_hour: int | None) -> Order:
+    period: typing.Final = (
+        None if end_hour is None else DeliveryPeriod.must_create(_DAY_START, _DAY_START + dt.timedelta(hours=end_hour))
+    )
+    return Order.must_create(
+        id_=uuid.uuid4(),
+        location=Location.must_create(5, 5),
+        volume=Volume.must_create(1),
+        delivery_period=period,
+    )
+
+
+class TestDeliveryDeadlineQueue:
+    def test_pop_returns_orders_by_closest_deadline(self) -> None:
+        late: typing.Final = _create_order(18)
+        early: typing.Final = _create_order(10)
+        middle: typing.Final = _create_order(14)
+
+        queue: typing.Final = DeliveryDeadlineQueue([late, early, middle])
+
+        assert [queue.pop() for _ in range(len(queue))] == [early, middle, late]
+
+    def test_orders_without_window_go_last_in_insertion_order(self) -> None:
+        first_without_window: typing.Final = _create_order(None)
+        with_window: typing.Final = _create_order(23)
+        second_without_window: typing.Final = _create_order(None)
+
+        queue: typing.Final = DeliveryDeadlineQueue([first_without_window, with_window, second_without_window])
+
+        assert queue.pop_many(3) == [with_window, first_without_window, second_without_window]
+
+    def test_equal_deadlines_keep_insertion_order(self) -> None:
+        orders: typing.Final = [_create_order(12) for _ in range(5)]
+
+        queue: typing.Final = DeliveryDeadlineQueue(orders)
+
+        assert queue.pop_many(5) == orders
+
+    def test_pop_many_stops_when_queue_is_empty(self) -> None:
+        queue: typing.Final = DeliveryDeadlineQueue([_create_order(12)])
+
+        assert len(queue.pop_many(3)) == 1
+        assert not queue
@@ -0,0 +1,50 @@
+import datetime as dt
+import typing
+
+import pytest
+
+from delivery.core.domain.model.kernel import Location
+from delivery.core.domain.service.demand_heatmap import DemandHeatmap
+
+
+class TestDemandHeatmap:
+    def test_should_halve_weight_every_half_life(self) -> None:
+        heatmap: typing.Final = DemandHeatmap(dt.timedelta(minutes=10))
+        start: typing.Final = dt.datetime(2026, 1, 1, tzinfo=dt.UTC)
+        location: typing.Final = Location.must_create(3, 4)
+
+        heatmap.record(location, start)
+        heatmap.record(location, start + dt.timedelta(minutes=10))
+
+        assert heatmap.intensity(location, start + dt.timedelta(minutes=10)) == pytest.approx(1.5)
+        assert heatmap.intensity(location, start + dt.timedelta(minutes=20)) == pytest.approx(0.75)
+        assert heatmap.intensity(Location.must_create(1, 1), start) == 0
+
+    def test_should_keep_weights_after_rebase(self) -> None:
+        heatmap: typing.Final = DemandHeatmap(dt.timedelta(seconds=1))
+        start: typing.Final = dt.datetime(2026, 1, 1, tzinfo=dt.UTC)
+        location: typing.Final = Location.must_create(5, 5)
+
+        heatmap.record(location, start)
+        # Сто периодов полураспада заставляют пересчитать счётчики к новому опорному моменту
+        later: typing.Final = start + dt.timedelta(seconds=100)
+        heatmap.record(location, later)
+        heatmap.record(location, later)
+
+        assert heatmap.intensity(location, later) == pytest.approx(2.0)
+
+    def test_should_rank_hotspots_and_lay_out_snapshot_by_cell(self) -> None:
+        heatmap: typing.Final = DemandHeatmap(dt.timedelta(minutes=10))
+        moment: typing.Final = dt.datetime(2026, 1, 1, tzinfo=dt.UTC)
+        busy: typing.Final = Location.must_create(2, 7)
+        quiet: typing.Final = Location.must_create(9, 1)
+        heatmap.record(quiet, moment)
+        heatmap.record(busy, moment)
+        heatmap.record(busy, moment)
+
+        snapshot: typing.Final = heatmap.snapshot(moment)
+
+        assert heatmap.hotspots(limit=5) == [busy, quiet]
+        assert heatmap.hotspots(limit=1) == [busy]
+        assert snapshot[busy.cell_id] == pytest.approx(2.0)
+        assert sum(snapshot) == pytest.approx(3.0)
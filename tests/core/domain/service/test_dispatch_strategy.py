@@ -0,0 +1,83 @@
+import datetime as dt
+import typing
+import uuid
+
+import pytest
+
+from delivery.core.domain.model.courier.courier import Courier
+from delivery.core.domain.model.kernel import DeliveryPeriod, Location, Volume
+from delivery.core.domain.model.order.order import Order
+from delivery.core.domain.service import DispatchStrategy, DispatchStrategyRegistry, OrderDispatchDomainService
+
+
+class TestDispatchStrategy:
+    @staticmethod
+    def _create_strategy(name: str) -> DispatchStrategy:
+        return DispatchStrategyRegistry.create(name, OrderDispatchDomainService())
+
+    @staticmethod
+    def _create_courier(speed: int, location: Location) -> Courier:
+        return Courier.must_create(name="Courier", speed=speed, location=location)
+
+    @staticmethod
+    def _create_order(location: Location, window_end_hour: int | None = None) -> Order:
+        day_start: typing.Final = dt.datetime(2026, 10, 17, tzinfo=dt.UTC)
+        return Order.must_create(
+            id_=uuid.uuid4(),
+            location=location,
+            volume=Volume.must_create(1),
+            delivery_period=None
+            if window_end_hour is None
+            else DeliveryPeriod.must_create(day_start, day_start + dt.timedelta(hours=window_end_hour)),
+        )
+
+    def test_registry_contains_builtin_strategies(self) -> None:
+        assert {"greedy_nearest", "batch_matching", "capacity_aware"} <= set(DispatchStrategyRegistry.get_all_names())
+
+    def test_registry_rejects_unknown_strategy(self) -> None:
+        with pytest.raises(ValueError, match="Unknown dispatch strategy"):
+            self._create_strategy("unknown")
+
+    def test_only_capacity_aware_uses_partially_loaded_couriers(self) -> None:
+        assert self._create_strategy("capacity_aware").uses_partially_loaded_couriers
+        assert not self._create_strategy("greedy_nearest").uses_partially_loaded_couriers
+        assert not self._create_strategy("batch_matching").uses_partially_loaded_couriers
+
+    def test_greedy_nearest_serves_closest_deadline_first(self) -> None:
+        courier: typing.Final = self._create_courier(1, Location.must_create(1, 1))
+        late_order: typing.Final = self._create_order(Location.must_create(1, 2), window_end_hour=20)
+        urgent_order: typing.Final = self._create_order(Location.must_create(10, 10), window_end_hour=10)
+
+        result: typing.Final = self._create_strategy("greedy_nearest").dispatch([late_order, urgent_order], [courier])
+
+        assert result.is_success
+        assert [assignment.order for assignment in result.get_value()] == [urgent_order]
+
+    def test_greedy_nearest_gives_each_courier_one_order(self) -> None:
+        couriers: typing.Final = [
+            self._create_courier(1, Location.must_create(1, 1)),
+            self._create_courier(1, Location.must_create(10, 10)),
+        ]
+        orders: typing.Final = [self._create_order(Location.must_create(2, 2)) for _ in range(3)]
+
+        result: typing.Final = self._create_strategy("greedy_nearest").dispatch(orders, couriers)
+
+        assert result.is_success
+        assignments: typing.Final = result.get_value()
+        assert [assignment.order for assignment in assignments] == orders[:2]
+        assert [assignment.courier for assignment in assignments] == couriers
+
+    def test_batch_matching_minimizes_total_time(self) -> None:
+        # Жадно первый заказ забрал бы ближайшего к нему курьера: 1 + 5 шагов против 2 + 2
+        near_courier: typing.Final = self._create_courier(1, Location.must_create(3, 1))
+        far_courier: typing.Final = self._create_courier(1, Location.must_create(6, 1))
+        first_order: typing.Final = self._create_order(Location.must_create(4, 1), window_end_hour=10)
+        second_order: typing.Final = self._create_order(Location.must_create(1, 1), window_end_hour=11)
+
+        result: typing.Final = self._create_strategy("batch_matching").dispatch(
+            [first_order, second_order], [near_courier, far_courier]
+        )
+
+        assert result.is_success
+        couriers_by_order: typing.Final = {assignment.order.id: assignment.courier for assignment in result.get_value()}
+        assert couriers_by_order == {first_order.id: far_courier, second_order.id: near_courier}
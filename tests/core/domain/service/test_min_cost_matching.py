@@ -0,0 +1,72 @@
+import itertools
+import random
+import typing
+
+from delivery.core.domain.service.min_cost_matching import solve_min_cost_matching
+
+
+def _brute_force_cost(costs: list[list[int]]) -> int:
+    rows_count: typing.Final = len(costs)
+    columns_count: typing.Final = len(costs[0])
+    if rows_count <= columns_count:
+        return min(
+            sum(costs[row][column] for row, column in enumerate(columns))
+            for columns in itertools.permutations(range(columns_count), rows_count)
+        )
+    return min(
+        sum(costs[row][column] for column, row in enumerate(rows))
+        for rows in itertools.permutations(range(rows_count), columns_count)
+    )
+
+
+class TestSolveMinCostMatching:
+    def test_empty_matrix_returns_empty_matching(self) -> None:
+        assert solve_min_cost_matching([]) == []
+        assert solve_min_cost_matching([[]]) == []
+
+    def test_square_matrix(self) -> None:
+        costs: typing.Final = [
+            [4, 1, 3],
+            [2, 0, 5],
+            [3, 2, 2],
+        ]
+
+        matching: typing.Final = solve_min_cost_matching(costs)
+
+        assert matching == [(0, 1), (1, 0), (2, 2)]
+
+    def test_more_columns_than_rows_covers_every_row(self) -> None:
+        costs: typing.Final = [
+            [9, 9, 1, 9],
+            [9, 2, 9, 9],
+        ]
+
+        matching: typing.Final = solve_min_cost_matching(costs)
+
+        assert matching == [(0, 2), (1, 1)]
+
+    def test_more_rows_than_columns_covers_every_column(self) -> None:
+        costs: typing.Final = [
+            [5, 9],
+            [1, 9],
+            [9, 3],
+        ]
+
+        matching: typing.Final = solve_min_cost_matching(costs)
+
+        assert matching == [(1, 0), (2, 1)]
+
+    def test_matches_brute_force_optimum(self) -> None:
+        rng: typing.Final = random.Random(42)
+
+        for _ in range(200):
+            rows_count = rng.randint(1, 5)
+            columns_count = rng.randint(1, 5)
+            costs = [[rng.randint(0, 20) for _ in range(columns_count)] for _ in range(rows_count)]
+
+            matching = solve_min_cost_matching(costs)
+
+            assert len(matching) == min(rows_count, columns_count)
+            assert len({row for row, _ in matching}) == len(matching)
+            assert len({column for _, column in matching}) == len(matching)
+            assert sum(costs[row][column] for row, column in matching) == _brute_force_cost(costs)
@@ -6,7 +6,7 @@ import pytest
 from delivery.core.domain.model.courier.courier import Courier
 from delivery.core.domain.model.kernel import Location, Volume
 from delivery.core.domain.model.order.order import Order
-from delivery.core.domain.service import OrderDispatchDomainService
+from delivery.core.domain.service import OrderAssignment, OrderDispatchDomainService
 
 
 class TestOrderDispatchDomainService:
@@ -240,3 +240,259 @@ class TestOrderDispatchDomainService:
 
         assert result.is_success
         assert result.get_value().id == free_courier.id
+
+    def test_dispatch_orders_with_empty_orders_raises_error(
+        self,
+        dispatch_service: OrderDispatchDomainService,
+    ) -> None:
+        courier: typing.Final = self._create_courier(
+            name="Courier",
+            speed=10,
+            location=Location.must_create(1, 1),
+        )
+
+        result: typing.Final = dispatch_service.dispatch_orders([], [courier])
+
+        assert result.is_failure
+        assert result.get_error().code == "value.is.required"
+
+    def test_dispatch_orders_with_empty_couriers_raises_error(
+        self,
+        dispatch_service: OrderDispatchDomainService,
+    ) -> None:
+        order: typing.Final = self._create_order(
+            location=Location.must_create(5, 5),
+            volume=5,
+        )
+
+        result: typing.Final = dispatch_service.dispatch_orders([order], [])
+
+        assert result.is_failure
+        assert result.get_error().code == "value.is.required"
+
+    def test_dispatch_orders_minimizes_total_time(
+        self,
+        dispatch_service: OrderDispatchDomainService,
+    ) -> None:
+        # Жадный выбор отдал бы ближайшего к первому заказу курьера A,
+        # и второму заказу достался бы далёкий курьер B (1 + 5 шагов против 2 + 2)
+        courier_a: typing.Final = self._create_courier(
+            name="Courier A",
+            speed=1,
+            location=Location.must_create(5, 5),
+        )
+        courier_b: typing.Final = self._create_courier(
+            name="Courier B",
+            speed=1,
+            location=Location.must_create(4, 3),
+        )
+
+        first_order: typing.Final = self._create_order(location=Location.must_create(4, 5), volume=1)
+        second_order: typing.Final = self._create_order(location=Location.must_create(7, 5), volume=1)
+
+        result: typing.Final = dispatch_service.dispatch_orders(
+            [first_order, second_order],
+            [courier_a, courier_b],
+        )
+
+        assert result.is_success
+        assigned: typing.Final = {assignment.order.id: assignment.courier.id for assignment in result.get_value()}
+        assert assigned == {first_order.id: courier_b.id, second_order.id: courier_a.id}
+
+    def test_dispatch_orders_assigns_each_courier_once(
+        self,
+        dispatch_service: OrderDispatchDomainService,
+    ) -> None:
+        courier: typing.Final = self._create_courier(
+            name="Courier",
+            speed=10,
+            location=Location.must_create(1, 1),
+        )
+
+        orders: typing.Final = [
+            self._create_order(location=Location.must_create(2, 2), volume=1),
+            self._create_order(location=Location.must_create(3, 3), volume=1),
+        ]
+
+        result: typing.Final = dispatch_service.dispatch_orders(orders, [courier])
+
+        assert result.is_success
+        assert len(result.get_value()) == 1
+        assert result.get_value()[0].courier.id == courier.id
+
+    def test_dispatch_orders_skips_orders_that_no_courier_can_take(
+        self,
+        dispatch_service: OrderDispatchDomainService,
+    ) -> None:
+        courier: typing.Final = self._create_courier(
+            name="Courier",
+            speed=1,
+            location=Location.must_create(1, 1),
+        )
+
+        large_order: typing.Final = self._create_order(location=Location.must_create(1, 2), volume=50)
+        small_order: typing.Final = self._create_order(location=Location.must_create(10, 10), volume=5)
+
+        result: typing.Final = dispatch_service.dispatch_orders([large_order, small_order], [courier])
+
+        assert result.is_success
+        assignments: typing.Final = result.get_value()
+        assert len(assignments) == 1
+        assert assignments[0].order.id == small_order.id
+
+    def test_dispatch_orders_no_suitable_courier(
+        self,
+        dispatch_service: OrderDispatchDomainService,
+    ) -> None:
+        courier: typing.Final = self._create_courier(
+            name="Courier",
+            speed=10,
+            location=Location.must_create(1, 1),
+        )
+        order: typing.Final = self._create_order(location=Location.must_create(5, 5), volume=50)
+
+        result: typing.Final = dispatch_service.dispatch_orders([order], [courier])
+
+        assert result.is_failure
+        assert result.get_error().code == "order.dispatch.no.suitable.courier"
+
+    def test_dispatch_orders_by_capacity_uses_free_places_of_partially_loaded_courier(
+        self,
+        dispatch_service: OrderDispatchDomainService,
+    ) -> None:
+        loaded_courier: typing.Final = self._create_courier(
+            name="Loaded Courier",
+            speed=1,
+            location=Location.must_create(5, 5),
+        )
+        assert loaded_courier.add_storage_place("Backpack", 20).is_success
+        assert loaded_courier.take_order(uuid.uuid4(), Volume.must_create(5)).is_success
+
+        order: typing.Final = self._create_order(location=Location.must_create(5, 6), volume=15)
+
+        result: typing.Final = dispatch_service.dispatch_orders_by_capacity([order], [loaded_courier])
+
+        assert result.is_success
+        assert result.get_value()[0].courier.id == loaded_courier.id
+
+    def test_dispatch_orders_by_capacity_packs_several_orders_into_one_courier(
+        self,
+        dispatch_service: OrderDispatchDomainService,
+    ) -> None:
+        courier: typing.Final = self._create_courier(
+            name="Courier",
+            speed=1,
+            location=Location.must_create(5, 5),
+        )
+        assert courier.add_storage_place("Backpack", 20).is_success
+
+        small_order: typing.Final = self._create_order(location=Location.must_create(5, 6), volume=8)
+        large_order: typing.Final = self._create_order(location=Location.must_create(6, 5), volume=15)
+
+        result: typing.Final = dispatch_service.dispatch_orders_by_capacity([small_order, large_order], [courier])
+
+        assert result.is_success
+        assignments: typing.Final = result.get_value()
+        assert [assignment.order.id for assignment in assignments] == [large_order.id, small_order.id]
+        for assignment in assignments:
+            assert courier.take_order(assignment.order.id, assignment.order.volume).is_success  # type: ignore[arg-type]
+        assert all(place.is_occupied() for place in courier.storage_places)
+
+    def test_dispatch_orders_by_capacity_prefers_best_fit_on_equal_time(
+        self,
+        dispatch_service: OrderDispatchDomainService,
+    ) -> None:
+        roomy_courier: typing.Final = self._create_courier(
+            name="Roomy Courier",
+            speed=1,
+            location=Location.must_create(5, 4),
+        )
+        assert roomy_courier.add_storage_place("Trunk", 50).is_success
+        assert roomy_courier.take_order(uuid.uuid4(), Volume.must_create(1)).is_success
+
+        tight_courier: typing.Final = self._create_courier(
+            name="Tight Courier",
+            speed=1,
+            location=Location.must_create(5, 6),
+        )
+
+        order: typing.Final = self._create_order(location=Location.must_create(5, 5), volume=10)
+
+        result: typing.Final = dispatch_service.dispatch_orders_by_capacity([order], [roomy_courier, tight_courier])
+
+        assert result.is_success
+        assert result.get_value()[0].courier.id == tight_courier.id
+
+    def test_dispatch_orders_by_capacity_no_suitable_courier(
+        self,
+        dispatch_service: OrderDispatchDomainService,
+    ) -> None:
+        courier: typing.Final = self._create_courier(
+            name="Courier",
+            speed=1,
+            location=Location.must_create(5, 5),
+        )
+        order: typing.Final = self._create_order(location=Location.must_create(5, 6), volume=11)
+
+        result: typing.Final = dispatch_service.dispatch_orders_by_capacity([order], [courier])
+
+        assert result.is_failure
+        assert result.get_error().code == "order.dispatch.no.suitable.courier"
+
+    def _create_busy_delivery(self, courier_location: Location, delivery_location: Location) -> OrderAssignment:
+        courier: typing.Final = self._create_courier(name="Busy Courier", speed=1, location=courier_location)
+        current_order: typing.Final = self._create_order(location=delivery_location, volume=5)
+        assert courier.take_order(current_order.id, current_order.volume).is_success  # type: ignore[arg-type]
+        assert current_order.assign(courier.id).is_success  # type: ignore[arg-type]
+        return OrderAssignment(order=current_order, courier=courier)
+
+    def test_dispatch_with_lookahead_reserves_courier_about_to_become_free(
+        self,
+        dispatch_service: OrderDispatchDomainService,
+    ) -> None:
+        # Занятому курьеру 1 шаг до доставки и 1 шаг до нового заказа, свободному 8 шагов
+        busy_delivery: typing.Final = self._create_busy_delivery(Location.must_create(5, 4), Location.must_create(5, 5))
+        idle_courier: typing.Final = self._create_courier(
+            name="Idle Courier",
+            speed=1,
+            location=Location.must_create(1, 1),
+        )
+        order: typing.Final = self._create_order(location=Location.must_create(5, 6), volume=5)
+
+        result: typing.Final = dispatch_service.dispatch_order_with_lookahead(order, [idle_courier], [busy_delivery])
+
+        assert result.is_success
+        decision: typing.Final = result.get_value()
+        assert decision.is_reservation
+        assert decision.courier.id == busy_delivery.courier.id
+
+    def test_dispatch_with_lookahead_prefers_idle_courier_on_equal_time(
+        self,
+        dispatch_service: OrderDispatchDomainService,
+    ) -> None:
+        busy_delivery: typing.Final = self._create_busy_delivery(Location.must_create(5, 4), Location.must_create(5, 5))
+        idle_courier: typing.Final = self._create_courier(
+            name="Idle Courier",
+            speed=1,
+            location=Location.must_create(5, 8),
+        )
+        order: typing.Final = self._create_order(location=Location.must_create(5, 6), volume=5)
+
+        result: typing.Final = dispatch_service.dispatch_order_with_lookahead(order, [idle_courier], [busy_delivery])
+
+        assert result.is_success
+        decision: typing.Final = result.get_value()
+        assert not decision.is_reservation
+        assert decision.courier.id == idle_courier.id
+
+    def test_dispatch_with_lookahead_skips_busy_courier_without_room_after_delivery(
+        self,
+        dispatch_service: OrderDispatchDomainService,
+    ) -> None:
+        busy_delivery: typing.Final = self._create_busy_delivery(Location.must_create(5, 4), Location.must_create(5, 5))
+        order: typing.Final = self._create_order(location=Location.must_create(5, 6), volume=11)
+
+        result: typing.Final = dispatch_service.dispatch_order_with_lookahead(order, [], [busy_delivery])
+
+        assert result.is_failure
+        assert result.get_error().code == "order.dispatch.no.suitable.courier"
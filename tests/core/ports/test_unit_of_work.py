@@ -0,0 +1,53 @@
+import typing
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from delivery.core.domain.model.kernel import Location
+from delivery.core.ports import unit_of_work
+from delivery.core.ports.unit_of_work import DeliveryUnitOfWork
+from delivery.ioc import IOCContainer
+from tests.test_fixtures import create_test_courier
+
+
+@pytest.fixture
+def session(monkeypatch: pytest.MonkeyPatch) -> typing.Iterator[MagicMock]:
+    session: typing.Final = MagicMock()
+    session.flush = AsyncMock()
+    session.execute = AsyncMock()
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=None)
+    monkeypatch.setattr(unit_of_work, "make_async_retry_session_class", lambda **_: lambda *_, **__: session)
+    IOCContainer.main_database_engine.override_sync(MagicMock())
+    yield session
+    IOCContainer.reset_override_sync()
+
+
+class TestDeliveryUnitOfWork:
+    @pytest.mark.anyio
+    async def test_should_write_changed_aggregates_and_commit(self, session: MagicMock) -> None:
+        courier: typing.Final = create_test_courier(speed=2, location=Location.must_create(1, 1))
+
+        async with DeliveryUnitOfWork.start() as uow:
+            uow.courier.mark_persisted(courier)
+            assert courier.move(Location.must_create(5, 1)).is_success
+
+        session.execute.assert_awaited()
+        session.commit.assert_awaited_once()
+        session.rollback.assert_not_awaited()
+
+    @pytest.mark.anyio
+    async def test_should_roll_back_discarded_work_without_writing(self, session: MagicMock) -> None:
+        courier: typing.Final = create_test_courier(speed=2, location=Location.must_create(1, 1))
+
+        async with DeliveryUnitOfWork.start() as uow:
+            uow.courier.mark_persisted(courier)
+            assert courier.move(Location.must_create(5, 1)).is_success
+            # Обработчик изменил агрегат, а затем вернул ошибку
+            uow.discard()
+
+        session.execute.assert_not_awaited()
+        session.commit.assert_not_awaited()
+        session.rollback.assert_awaited_once()